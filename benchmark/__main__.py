@@ -0,0 +1,112 @@
+"""Run the benchmark suite or compare two result files.
+
+    python -m benchmark run --output results.json [--filter call.]
+    python -m benchmark compare baseline.json results.json [--threshold 0.1]
+
+Comparison exits with a non-zero status when a tracked metric is slower than the baseline
+by more than the threshold, so it can be used as a regression gate.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Dict, List
+
+import pydantic
+
+from benchmark.cases import CASES
+
+
+def run(name_filter: str, repeat: int) -> Dict[str, Any]:
+    results = {}
+
+    for case in CASES:
+        if name_filter not in case.name:
+            continue
+
+        try:
+            operation = case.setup()
+        except ImportError as e:
+            print(f"{case.name:<44} skipped ({e})", file=sys.stderr)  # noqa: T201
+            continue
+
+        operation()  # Warm up lazily built validators and caches.
+        timings = timeit.repeat(operation, number=case.number, repeat=repeat)
+        samples = [t / case.number / case.batch for t in timings]
+        results[case.name] = {"min_s": min(samples), "mean_s": sum(samples) / len(samples)}
+        print(f"{case.name:<44} {min(samples) * 1e6:12.2f} us", file=sys.stderr)  # noqa: T201
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "pydantic": pydantic.VERSION,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Return the names of the metrics which regressed past the threshold.
+
+    Metrics are compared on their best sample, which is the least sensitive to noise.
+    Metrics missing from either side are not tracked.
+    """
+    regressions = []
+
+    for name, base in sorted(baseline["results"].items()):
+        if name not in current["results"]:
+            continue
+
+        ratio = current["results"][name]["min_s"] / base["min_s"]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+
+        marker = "REGRESSED" if regressed else ""
+        print(f"{name:<44} {ratio:6.2f}x {marker}")  # noqa: T201
+
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--output", help="Write results as JSON to this file")
+    run_parser.add_argument("--filter", default="", help="Only run cases containing this text")
+    run_parser.add_argument("--repeat", type=int, default=5)
+
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = json.dumps(run(args.filter, args.repeat), indent=2)
+        if args.output:
+            with open(args.output, "w") as f:  # noqa: PTH123
+                f.write(results)
+        else:
+            print(results)  # noqa: T201
+
+        return 0
+
+    with open(args.baseline) as baseline, open(args.current) as current:  # noqa: PTH123
+        regressions = compare(json.load(baseline), json.load(current), args.threshold)
+
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")  # noqa: T201
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,264 @@
+"""Benchmark cases for the mapping hot path.
+
+Each case prepares its state and returns a zero-argument callable performing one operation.
+Cases needing an optional framework are skipped when it is not installed.
+
+Annotations must stay evaluated in this module (no `from __future__ import annotations`)
+as the mapper reads them from the view signatures.
+"""
+
+import asyncio
+import atexit
+import json
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from pydantic import BaseModel
+
+import request_mapper
+from request_mapper import (
+    AsyncRequestMapperIntegration,
+    FromBody,
+    FromQuery,
+    RequestMapperIntegration,
+)
+from request_mapper.types import FunctionCall, IncomingMappedData, RequestMapperDecorator
+
+Operation = Callable[[], Any]
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Operation]
+    # Operations per timing sample. Keep samples in the tens of milliseconds.
+    number: int
+    # Units of work performed by a single operation, results are reported per unit.
+    batch: int = 1
+
+
+CASES: List[Case] = []
+
+
+def case(
+    name: str, number: int, batch: int = 1
+) -> Callable[[Callable[[], Operation]], Callable[[], Operation]]:
+    def register(setup: Callable[[], Operation]) -> Callable[[], Operation]:
+        CASES.append(Case(name, setup, number, batch))
+        return setup
+
+    return register
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: List[str]
+    price: Optional[float] = None
+
+
+class Batch(BaseModel):
+    items: List[Item]
+
+
+class Pagination(BaseModel):
+    page: int
+    size: int
+
+
+def _batch_body(size: int) -> bytes:
+    items = [
+        {"id": i, "name": f"item-{i}", "tags": ["a", "b"], "price": i / 3} for i in range(size)
+    ]
+    return json.dumps({"items": items}).encode()
+
+
+def _wide_query_model(width: int) -> Any:
+    return type(
+        f"WideQuery{width}",
+        (BaseModel,),
+        {"__annotations__": {f"f{i}": int for i in range(width)}},
+    )
+
+
+def _wide_query_string(width: int) -> str:
+    # Half of the keys are unrelated to the model, as is common with tracking parameters.
+    return "&".join([f"f{i}={i}" for i in range(width)] + [f"x{i}={i}" for i in range(width)])
+
+
+class StaticIntegration(RequestMapperIntegration):
+    def __init__(self, query: str = "page=1&size=20", body: bytes = b"{}") -> None:
+        self.query = query
+        self.body = body
+
+    def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
+        pass
+
+    def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        raise NotImplementedError
+
+    def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        raise NotImplementedError
+
+    def get_query_string(self, call: FunctionCall) -> str:  # noqa: ARG002
+        return self.query
+
+    def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:  # noqa: ARG002
+        return self.body
+
+
+class AsyncStaticIntegration(AsyncRequestMapperIntegration):
+    def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
+        pass
+
+    async def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        raise NotImplementedError
+
+    async def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        raise NotImplementedError
+
+    async def get_query_string(self, call: FunctionCall) -> str:  # noqa: ARG002
+        return "page=1&size=20"
+
+
+def _many_views(count: int) -> List[Callable[..., Any]]:
+    views = []
+    for _ in range(count):
+
+        def view(query: FromQuery[Pagination], body: FromBody[Batch], other: int = 0) -> Any:
+            return query, body, other
+
+        views.append(view)
+
+    return views
+
+
+@case("decoration.get_mapped_params", number=20, batch=100)
+def _get_mapped_params() -> Operation:
+    views = _many_views(100)
+
+    def run() -> None:
+        for view in views:
+            request_mapper._get_mapped_params(view)  # noqa: SLF001
+
+    return run
+
+
+@case("decoration.map_request", number=20, batch=100)
+def _map_request() -> Operation:
+    views = _many_views(100)
+    request_mapper.setup_mapper(StaticIntegration())
+
+    def run() -> None:
+        for view in views:
+            request_mapper.map_request(view)
+
+    return run
+
+
+def _page(query: Pagination) -> int:
+    return query.page
+
+
+@case("call.unwrapped", number=20_000)
+def _call_unwrapped() -> Operation:
+    return lambda: _page(Pagination(page="1", size="20"))  # type: ignore[arg-type]
+
+
+@case("call.sync_inner", number=20_000)
+def _call_sync() -> Operation:
+    def view(query: FromQuery[Pagination]) -> int:
+        return query.page
+
+    request_mapper.setup_mapper(StaticIntegration())
+    return request_mapper.map_request(view)
+
+
+@case("call.async_inner", number=20, batch=1000)
+def _call_async() -> Operation:
+    async def view(query: FromQuery[Pagination]) -> int:
+        return query.page
+
+    request_mapper.setup_mapper(AsyncStaticIntegration())
+    mapped = request_mapper.map_request(view)
+    loop = asyncio.new_event_loop()
+
+    async def batch() -> None:
+        for _ in range(1000):
+            await mapped()
+
+    # Await the view in batches to amortize the event loop round trip.
+    return lambda: loop.run_until_complete(batch())
+
+
+for _size in (1, 100, 10_000):
+
+    @case(f"validate.body[{_size} items]", number=max(1, 20_000 // _size))
+    def _validate_body(size: int = _size) -> Operation:
+        def view(body: FromBody[Batch]) -> int:
+            return len(body.items)
+
+        request_mapper.setup_mapper(StaticIntegration(body=_batch_body(size)))
+        return request_mapper.map_request(view)
+
+
+for _width in (5, 50):
+
+    @case(f"validate.query[{_width} fields]", number=20_000)
+    def _validate_query(width: int = _width) -> Operation:
+        model = _wide_query_model(width)
+
+        def view(query: FromQuery[model]) -> Any:  # type: ignore[valid-type]
+            return query
+
+        request_mapper.setup_mapper(StaticIntegration(query=_wide_query_string(width)))
+        return request_mapper.map_request(view)
+
+
+@case("e2e.flask[query+body]", number=500)
+def _e2e_flask() -> Operation:
+    from flask import Flask
+
+    from request_mapper.integration.flask_integration import FlaskIntegration
+
+    app = Flask(__name__)
+
+    @app.post("/items")
+    def create(query: FromQuery[Pagination], body: FromBody[Batch]) -> Dict[str, int]:
+        return {"count": len(body.items), "page": query.page}
+
+    request_mapper.setup_mapper(FlaskIntegration(app))
+    client = app.test_client()
+    body = _batch_body(10)
+
+    return lambda: client.post("/items?page=1&size=20", data=body, content_type="application/json")
+
+
+@case("e2e.aiohttp[query+body]", number=5, batch=100)
+def _e2e_aiohttp() -> Operation:
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from request_mapper.integration.aiohttp_integration import AioHttpIntegration
+
+    async def create(
+        _request: web.Request, query: FromQuery[Pagination], body: FromBody[Batch]
+    ) -> web.Response:
+        return web.json_response({"count": len(body.items), "page": query.page})
+
+    app = web.Application()
+    app.router.add_post("/items", request_mapper.map_request(create))
+    request_mapper.setup_mapper(AioHttpIntegration(app))
+
+    loop = asyncio.new_event_loop()
+    client = TestClient(TestServer(app), loop=loop)
+    loop.run_until_complete(client.start_server())
+    atexit.register(lambda: loop.run_until_complete(client.close()))
+    body = _batch_body(10)
+
+    async def batch() -> None:
+        for _ in range(100):
+            resp = await client.post(
+                "/items?page=1&size=20", data=body, headers={"Content-Type": "application/json"}
+            )
+            await resp.read()
+
+    return lambda: loop.run_until_complete(batch())
@@ -0,0 +1,127 @@
+"""Measure the per-call overhead map_request adds on top of a plain function call.
+
+Compares an unwrapped function, the mapper as it was before views were compiled into binding
+plans (reproduced below) and the current map_request.
+
+Run with: python -m benchmark.mapping_overhead
+
+Annotations must stay evaluated in this module (no `from __future__ import annotations`)
+as the mapper reads them from the view signatures.
+"""
+
+import timeit
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping
+
+from pydantic import BaseModel, ValidationError
+
+import request_mapper
+from request_mapper import FromQuery, RequestMapperIntegration
+from request_mapper.types import (
+    AnnotatedParameter,
+    FunctionCall,
+    IncomingMappedData,
+    QueryStringMapping,
+    RequestBodyMapping,
+    RequestMapperDecorator,
+    RequestValidationError,
+)
+
+
+class QueryModel(BaseModel):
+    page: int
+    size: int
+
+
+QUERY = {"page": "1", "size": "20"}
+
+
+class ConstantIntegration(RequestMapperIntegration):
+    def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
+        pass
+
+    def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:  # noqa: ARG002
+        return QUERY
+
+    def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:  # noqa: ARG002
+        return QUERY
+
+
+@dataclass(frozen=True)
+class _LegacyFunctionCall:
+    fn: Callable[..., Any]
+    args: Any
+    kwargs: Any
+
+
+def _legacy_map_request(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Reproduce the original per-call binding loop for comparison."""
+    mapped_params = request_mapper._get_mapped_params(fn)  # noqa: SLF001
+
+    def validate(val: AnnotatedParameter, data: Mapping[Any, Any]) -> BaseModel:
+        try:
+            return val.cls(**data)
+        except ValidationError as e:
+            raise RequestValidationError(val.annotation.location, e.errors()) from e
+
+    def inner(*args: Any, **kwargs: Any) -> Any:
+        integration = request_mapper._integration  # noqa: SLF001
+        if not isinstance(integration, RequestMapperIntegration):
+            raise TypeError
+        call: Any = _LegacyFunctionCall(fn, args, kwargs)
+        bound_args = {}
+        for name, param in mapped_params.items():
+            data = None
+            if param.annotation == QueryStringMapping:
+                data = integration.get_query_as_dict(call)
+            elif param.annotation == RequestBodyMapping:
+                data = integration.get_request_body_as_dict(call)
+
+            if data is not None:
+                bound_args[name] = validate(param, data)
+
+        res = fn(*args, **kwargs, **bound_args)
+        if not isinstance(res, BaseModel):
+            return res
+
+        return res.model_dump() if hasattr(res, "model_dump") else res.dict()
+
+    return inner
+
+
+def view(query: FromQuery[QueryModel]) -> int:
+    return query.page
+
+
+def plain(query: QueryModel) -> int:
+    return query.page
+
+
+def run(number: int = 200_000) -> Dict[str, float]:
+    """Return the average cost in nanoseconds per call for each variant."""
+    request_mapper.setup_mapper(ConstantIntegration())
+    legacy = _legacy_map_request(view)
+    mapped = request_mapper.map_request(view)
+
+    variants: Dict[str, Callable[[], Any]] = {
+        "plain function + validation": lambda: plain(QueryModel(**QUERY)),
+        "map_request (legacy loop)": legacy,
+        "map_request (compiled plan)": mapped,
+    }
+
+    return {
+        name: min(timeit.repeat(target, number=number, repeat=5)) / number * 1e9
+        for name, target in variants.items()
+    }
+
+
+def main() -> None:
+    results = run()
+    baseline = results["plain function + validation"]
+
+    for name, ns in results.items():
+        print(f"{name:<32} {ns:8.0f} ns/call  overhead {ns - baseline:+6.0f} ns")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,148 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import functools
+import gc
 import inspect
-from typing import Any, Callable, Mapping, TypeVar
-
-from pydantic import BaseModel, ValidationError
-from typing_extensions import Annotated
-
+import operator
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Hashable, Iterator, Mapping, TypeVar, cast
+
+from pydantic import BaseModel
+from typing_extensions import Annotated, get_args
+
+from request_mapper.cache import CACHE_ATTRIBUTE, CacheStats, ResponseCache, get_view_name
+from request_mapper.engines import ValidationEngine, register_engine
+from request_mapper.errors import ErrorFormat, set_error_format
+from request_mapper.flight import FLIGHT_ATTRIBUTE, FlightStats, SingleFlight
+from request_mapper.form import UploadedFile
+from request_mapper.instrumentation import (
+    PHASE_EXTRACTION,
+    PHASE_HANDLER,
+    PHASE_SERIALIZATION,
+    PHASE_VALIDATION,
+    HistogramAggregator,
+    InstrumentationSink,
+    PhaseTiming,
+    get_payload_size,
+)
 from request_mapper.integration.integration import (
     AsyncRequestMapperIntegration,
+    RequestGetter,
     RequestMapperIntegration,
     RequestMapperIntegrationType,
+    bind_request_getter,
+    get_header_getter,
+    get_json_stream_response_factory,
+    get_warm_up_hook,
+)
+from request_mapper.lazy import LazyModel, compile_lazy_validator, defer_extractor
+from request_mapper.lookup import compile_lookup_validator
+from request_mapper.memory import (
+    MemoryProfiler,
+    memory_mark,
+    memory_usage,
+    start_tracing,
+    stop_tracing,
+)
+from request_mapper.offload import ValidationOffload
+from request_mapper.policy import (
+    BodyPolicy,
+    enforce_policy,
+    enforce_policy_async,
+    get_body_policy,
 )
+from request_mapper.query import compile_query_validators
+from request_mapper.response import (
+    JsonResponseConverter,
+    compile_response_converter,
+    compile_response_stages,
+    compile_value_serializers,
+    is_model_stream,
+)
+from request_mapper.streaming import compile_stream_validator
 from request_mapper.types import (
     AnnotatedParameter,
+    BoundParameter,
+    BoundSource,
+    CookiesMapping,
+    DataExtractor,
+    FormDataMapping,
     FunctionCall,
+    HeadersMapping,
+    LookupMapping,
+    PathMapping,
     QueryStringMapping,
+    RequestBodyLazyMapping,
     RequestBodyMapping,
+    RequestBodyStreamMapping,
     RequestDataMapping,
+    RequestPolicyViolationError,
     RequestValidationError,
     ResponseConverter,
 )
+from request_mapper.validation import Validator, compile_json_validator, compile_validator
+from request_mapper.warmup import get_response_models, get_return_type, warm_up_types
 
 _integration: RequestMapperIntegrationType | None = None
-_response_converter: Callable[[BaseModel], Any] | None = None
+_response_converter: ResponseConverter | None = None
+_instrumentation: InstrumentationSink | None = None
 __T = TypeVar("__T")
 
 FromBody = Annotated[__T, RequestBodyMapping]
+FromBodyLazy = Annotated[LazyModel[__T], RequestBodyLazyMapping]
 FromQuery = Annotated[__T, QueryStringMapping]
+FromForm = Annotated[__T, FormDataMapping]
+FromHeaders = Annotated[__T, HeadersMapping]
+FromPath = Annotated[__T, PathMapping]
+FromCookies = Annotated[__T, CookiesMapping]
+FromBodyStream = Annotated[Iterator[__T], RequestBodyStreamMapping]
+FromAsyncBodyStream = Annotated[AsyncIterator[__T], RequestBodyStreamMapping]
+
+
+def _compile_validators(
+    param: AnnotatedParameter, *, is_async: bool
+) -> tuple[Validator, Validator | None]:
+    """Return the validators for the data extracted for the parameter and for its raw form."""
+    if param.annotation.lazy:
+        validator, raw_validator = _compile_eager_validators(param, is_async=is_async)
+        return (
+            compile_lazy_validator(validator, is_async=is_async),
+            raw_validator and compile_lazy_validator(raw_validator, is_async=is_async),
+        )
 
+    return _compile_eager_validators(param, is_async=is_async)
 
-def _validate_input(val: AnnotatedParameter, data: Mapping[Any, Any]) -> BaseModel:
-    try:
-        return val.cls(**data)
-    except ValidationError as e:
-        raise RequestValidationError(
-            location=val.annotation.location,
-            source_errors=e.errors(),
-        ) from e
+
+def _compile_eager_validators(
+    param: AnnotatedParameter, *, is_async: bool
+) -> tuple[Validator, Validator | None]:
+    if issubclass(param.annotation, RequestBodyStreamMapping):
+        return compile_stream_validator(param, is_async=is_async), None
+
+    if issubclass(param.annotation, QueryStringMapping):
+        return compile_query_validators(param)
+
+    if issubclass(param.annotation, LookupMapping):
+        return compile_lookup_validator(param), None
+
+    if issubclass(param.annotation, FormDataMapping):
+        # Forms are multi-value mappings, decoded like query data.
+        validate_mapping, _ = compile_query_validators(param)
+        return validate_mapping, None
+
+    return compile_validator(param), compile_json_validator(param)
+
+
+def _get_validated_type(param: AnnotatedParameter) -> Any:
+    """Return the type data is validated into, i.e. the item type for streamed bodies."""
+    if issubclass(param.annotation, RequestBodyStreamMapping):
+        args = get_args(param.cls)
+        return args[0] if args else param.cls
+
+    return param.cls
 
 
 def _parameter_get_type_and_annotation(
@@ -50,9 +154,9 @@ def _parameter_get_type_and_annotation(
     """
     if hasattr(parameter.annotation, "__metadata__") and hasattr(parameter.annotation, "__args__"):
         klass = parameter.annotation.__args__[0]
-        annotation = parameter.annotation.__metadata__[0]
+        annotation, *metadata = parameter.annotation.__metadata__
 
-        return AnnotatedParameter(cls=klass, annotation=annotation)
+        return AnnotatedParameter(cls=klass, annotation=annotation, metadata=tuple(metadata))
 
     return None
 
@@ -63,98 +167,568 @@ def _get_mapped_params(fn: Callable[..., Any]) -> Mapping[str, AnnotatedParamete
     for param_name, param_type in inspect.signature(fn).parameters.items():
         param = _parameter_get_type_and_annotation(param_type)
 
-        if param and issubclass(param.annotation, RequestDataMapping):
+        if (
+            param
+            and isinstance(param.annotation, type)
+            and issubclass(param.annotation, RequestDataMapping)
+        ):
+            if param.annotation.lazy:
+                # Validate against the model wrapped by the LazyModel proxy.
+                param = dataclasses.replace(param, cls=get_args(param.cls)[0])
             mapped_params[param_name] = param
 
     return mapped_params
 
 
-async def _async_get_bound_args(
-    mapped_params: Mapping[str, Any], fn_call: FunctionCall
-) -> Mapping[str, Any]:
-    if not isinstance(_integration, AsyncRequestMapperIntegration):
-        msg = (
-            "Integration is not set. Please call setup_mapper with an async integration "
-            "before starting your application"
+class _BindingPlan:
+    """Binding steps for a single view, compiled once when the view is decorated.
+
+    Validators are built from the view signature right away. Extractors depend on the integration
+    and are resolved whenever one is set up. Parameters reading the same source are grouped
+    so that each source is fetched and decoded only once per request.
+    While no compatible integration is available `steps` is None
+    and calling the view raises a TypeError.
+    """
+
+    __slots__ = (
+        "is_async",
+        "validators",
+        "raw_validators",
+        "mapped_params",
+        "streams_models",
+        "value_serializers",
+        "steps",
+        "convert",
+        "serialize",
+        "finalize",
+        "cache",
+        "flight",
+        "view_name",
+        "sink",
+        "policies",
+        "offload",
+        "fn",
+        "get_request",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, fn: Callable[..., Any], mapped_params: Mapping[str, AnnotatedParameter]
+    ) -> None:
+        self.fn = fn
+        self.is_async = asyncio.iscoroutinefunction(fn)
+        self.view_name = get_view_name(fn)
+        self.mapped_params = mapped_params
+        return_type = get_return_type(fn)
+        self.streams_models = is_model_stream(return_type)
+        self.value_serializers = compile_value_serializers(return_type)
+        self.validators: dict[str, Validator] = {}
+        self.raw_validators: dict[str, Validator | None] = {}
+        self.policies = {name: get_body_policy(param) for name, param in mapped_params.items()}
+
+        for name, param in mapped_params.items():
+            self.validators[name], self.raw_validators[name] = _compile_validators(
+                param, is_async=self.is_async
+            )
+        self.steps: tuple[BoundSource, ...] | None = None
+        self.convert: Callable[[Any], Any] = compile_response_converter(None)
+        self.serialize, self.finalize = compile_response_stages(None)
+        self.cache: ResponseCache | None = getattr(fn, CACHE_ATTRIBUTE, None)
+        self.flight: SingleFlight | None = getattr(fn, FLIGHT_ATTRIBUTE, None)
+        self.sink: InstrumentationSink | None = None
+        self.offload: ValidationOffload | None = None
+        self.get_request: RequestGetter | None = None
+
+    def bind(self) -> None:
+        """Resolve everything depending on the options passed to setup_mapper."""
+        integration = _integration
+        make_stream_response = None
+        if integration is not None and self.streams_models:
+            make_stream_response = get_json_stream_response_factory(integration)
+        self.convert = compile_response_converter(
+            _response_converter, make_stream_response, self.value_serializers
+        )
+        self.serialize, self.finalize = compile_response_stages(_response_converter)
+        self.sink = _instrumentation
+        expected = AsyncRequestMapperIntegration if self.is_async else RequestMapperIntegration
+
+        if not isinstance(integration, expected):
+            self.steps = None
+            return
+
+        self.offload = self._bind_offload(integration)
+        self.get_request = bind_request_getter(integration, self.fn)
+
+        # Extractors are resolved once per mapping type so that custom mappings
+        # used by several parameters also share a single fetch.
+        extractors: dict[type[RequestDataMapping], tuple[DataExtractor, DataExtractor | None]] = {}
+        enforcing_extractors: dict[tuple[DataExtractor, BodyPolicy], DataExtractor] = {}
+        deferred_extractors: dict[DataExtractor, DataExtractor] = {}
+        sources: dict[DataExtractor, list[BoundParameter]] = {}
+
+        for name, param in self.mapped_params.items():
+            mapping = param.annotation
+            if mapping not in extractors:
+                extractors[mapping] = (
+                    mapping.bind_extractor(integration),
+                    mapping.bind_raw_extractor(integration),
+                )
+
+            extract, raw_extract = extractors[mapping]
+            validate = self.validators[name]
+            raw_validator = self.raw_validators[name]
+
+            if raw_validator and raw_extract:
+                extract, validate = raw_extract, raw_validator
+
+            policy = self.policies[name]
+            if policy is not None:
+                if (extract, policy) not in enforcing_extractors:
+                    enforcing_extractors[extract, policy] = self._enforce_policy(
+                        integration, extract, policy, mapping.location
+                    )
+                extract = enforcing_extractors[extract, policy]
+
+            if mapping.lazy:
+                if extract not in deferred_extractors:
+                    deferred_extractors[extract] = defer_extractor(extract, is_async=self.is_async)
+                extract = deferred_extractors[extract]
+
+            sources.setdefault(extract, []).append(BoundParameter(name, validate))
+
+        self.steps = tuple(
+            BoundSource(extract, tuple(parameters)) for extract, parameters in sources.items()
         )
-        raise TypeError(msg)
 
-    bound_args = {}
-    for name, param in mapped_params.items():
-        data = None
-        if param.annotation == QueryStringMapping:
-            data = await _integration.get_query_as_dict(fn_call)
-        elif param.annotation == RequestBodyMapping:
-            data = await _integration.get_request_body_as_dict(fn_call)
+    def _bind_offload(self, integration: RequestMapperIntegrationType) -> ValidationOffload | None:
+        if not isinstance(integration, AsyncRequestMapperIntegration):
+            return None
 
-        if data is not None:
-            bound_args[name] = _validate_input(param, data)
+        executor = integration.validation_executor
+        if executor is None:
+            return None
 
-    return bound_args
+        return ValidationOffload(executor, integration.offload_threshold, dict(self.mapped_params))
 
+    def _enforce_policy(
+        self,
+        integration: RequestMapperIntegrationType,
+        extract: DataExtractor,
+        policy: BodyPolicy,
+        location: str,
+    ) -> DataExtractor:
+        get_header = get_header_getter(integration)
 
-def _sync_get_bound_args(
-    mapped_params: Mapping[str, Any], fn_call: FunctionCall
-) -> Mapping[str, Any]:
-    if not isinstance(_integration, RequestMapperIntegration):
-        msg = "Integration is not set. Please call setup_mapper before starting your application."
-        raise TypeError(msg)
+        if self.is_async:
+            return enforce_policy_async(extract, get_header, policy, location)
 
-    bound_args = {}
-    for name, param in mapped_params.items():
-        data = None
-        if param.annotation == QueryStringMapping:
-            data = _integration.get_query_as_dict(fn_call)
-        elif param.annotation == RequestBodyMapping:
-            data = _integration.get_request_body_as_dict(fn_call)
+        return enforce_policy(extract, get_header, policy, location)
 
-        if data is not None:
-            bound_args[name] = _validate_input(param, data)
 
-    return bound_args
+_plans: weakref.WeakSet[_BindingPlan] = weakref.WeakSet()
+
+_SYNC_NOT_SET_UP_MSG = (
+    "Integration is not set. Please call setup_mapper before starting your application."
+)
+_ASYNC_NOT_SET_UP_MSG = (
+    "Integration is not set. Please call setup_mapper with an async integration "
+    "before starting your application"
+)
+
 
+def _make_input_key(plan: _BindingPlan, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """Return the key of the view called with the validated and other arguments.
 
-def _convert_value(res: Any) -> Any:
+    The validated models come first, followed by the other keyword arguments, e.g. Flask path
+    parameters, and the positional arguments. Positional arguments are left out when the
+    integration locates the request among them, as they are then passed by the framework,
+    e.g. `scope, receive, send`. The key is None when some argument cannot be hashed.
+    """
+    mapped_params = plan.mapped_params
+    inputs = [kwargs.get(name) for name in mapped_params]
+    if plan.get_request is None:
+        inputs.extend(args)
+
+    for name, value in kwargs.items():
+        if name not in mapped_params:
+            inputs.extend((name, value))
+
+    try:
+        return ResponseCache.make_key(plan.view_name, inputs)
+    except TypeError:
+        return None
+
+
+def _cache_lookup(
+    plan: _BindingPlan, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[Hashable, bool, Any]:
+    """Return the cache key for the arguments, whether it is cached and its value.
+
+    The key is None when some argument cannot be hashed, in which case the call is not cached.
+    """
+    key = _make_input_key(plan, args, kwargs)
+    if key is None:
+        return None, False, None
+
+    found, value = cast(ResponseCache, plan.cache).lookup(key)
+    return key, found, value
+
+
+def _cache_store(plan: _BindingPlan, key: Hashable, res: Any) -> Any:
+    if not isinstance(res, BaseModel):
+        return plan.convert(res)
+
+    value = plan.serialize(res)
+    if key is not None:
+        cast(ResponseCache, plan.cache).store(key, value)
+
+    return plan.finalize(value)
+
+
+def _invoke_sync_cached(
+    fn: Callable[..., Any], plan: _BindingPlan, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    key, found, value = _cache_lookup(plan, args, kwargs)
+    if found:
+        return plan.finalize(value)
+
+    return _cache_store(plan, key, fn(*args, **kwargs))
+
+
+async def _invoke_async_cached(
+    fn: Callable[..., Any], plan: _BindingPlan, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    key, found, value = _cache_lookup(plan, args, kwargs)
+    if found:
+        return plan.finalize(value)
+
+    if plan.flight is not None:
+        return await _invoke_async_coalesced(fn, plan, args, kwargs, key)
+
+    return _cache_store(plan, key, await fn(*args, **kwargs))
+
+
+async def _call_async_shared(
+    fn: Callable[..., Any],
+    plan: _BindingPlan,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    key: Hashable,
+) -> tuple[bool, Any]:
+    """Run the view, returning whether its result is a serialized model and the result.
+
+    Models are serialized here, once for all coalesced calls, and cached if the view is.
+    """
+    res = await fn(*args, **kwargs)
     if not isinstance(res, BaseModel):
+        return False, res
+
+    value = plan.serialize(res)
+    if plan.cache is not None and key is not None:
+        plan.cache.store(key, value)
+
+    return True, value
+
+
+async def _invoke_async_coalesced(
+    fn: Callable[..., Any],
+    plan: _BindingPlan,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    key: Hashable = None,
+) -> Any:
+    """Run the view once for identical concurrent calls and share its result between them.
+
+    Only serialized models are shared. Calls waiting for a view which returned anything else
+    run it themselves. Calls with arguments which cannot be hashed are not coalesced.
+    """
+    if key is None:
+        key = _make_input_key(plan, args, kwargs)
+
+    call = functools.partial(_call_async_shared, fn, plan, args, kwargs, key)
+    if key is None:
+        serialized, value = await call()
+    else:
+        serialized, value = await cast(SingleFlight, plan.flight).run(
+            key, call, operator.itemgetter(0)
+        )
+
+    return plan.finalize(value) if serialized else plan.convert(value)
+
+
+class _PhaseRecorder:
+    """Measure the phases of an instrumented request for the sink, with their memory if traced."""
+
+    __slots__ = ("sink", "view", "traced", "start", "mark")
+
+    def __init__(self, sink: InstrumentationSink, view: str) -> None:
+        self.sink = sink
+        self.view = view
+        self.traced = sink.measure_memory(view)
+        self.start = 0.0
+        self.mark = 0
+
+    def restart(self) -> None:
+        if self.traced:
+            self.mark = memory_mark()
+        self.start = time.perf_counter()
+
+    def record(
+        self, phase: str, location: str | None = None, payload_size: int | None = None
+    ) -> None:
+        duration = time.perf_counter() - self.start
+        if not self.traced:
+            self.sink.record_phase(PhaseTiming(self.view, phase, duration, location, payload_size))
+            return
+
+        peak, retained = memory_usage(self.mark)
+        self.sink.record_phase(
+            PhaseTiming(self.view, phase, duration, location, payload_size, peak, retained)
+        )
+
+
+def _validate_instrumented(
+    plan: _BindingPlan,
+    recorder: _PhaseRecorder,
+    source: BoundSource,
+    data: Any,
+    kwargs: dict[str, Any],
+) -> None:
+    for name, validate in source.parameters:
+        location = plan.mapped_params[name].annotation.location
+        recorder.restart()
+        try:
+            kwargs[name] = validate(data)
+        except RequestValidationError:
+            recorder.sink.record_validation_failure(plan.view_name, location)
+            raise
+        finally:
+            recorder.record(PHASE_VALIDATION, location, get_payload_size(data))
+
+
+async def _validate_offloaded_instrumented(
+    plan: _BindingPlan,
+    recorder: _PhaseRecorder,
+    source: BoundSource,
+    data: Any,
+    kwargs: dict[str, Any],
+) -> None:
+    location = plan.mapped_params[source.parameters[0].name].annotation.location
+    recorder.restart()
+    try:
+        await cast(ValidationOffload, plan.offload).validate(source.parameters, data, kwargs)
+    except RequestValidationError:
+        recorder.sink.record_validation_failure(plan.view_name, location)
+        raise
+    finally:
+        recorder.record(PHASE_VALIDATION, location, get_payload_size(data))
+
+
+def _record_extraction(
+    plan: _BindingPlan, recorder: _PhaseRecorder, source: BoundSource, data: Any
+) -> None:
+    location = plan.mapped_params[source.parameters[0].name].annotation.location
+    recorder.record(PHASE_EXTRACTION, location, get_payload_size(data))
+
+
+def _invoke_sync_instrumented(
+    fn: Callable[..., Any], plan: _BindingPlan, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    recorder = _PhaseRecorder(cast(InstrumentationSink, plan.sink), plan.view_name)
+    if not recorder.traced:
+        return _run_sync_instrumented(fn, plan, recorder, args, kwargs)
+
+    start_tracing()
+    try:
+        return _run_sync_instrumented(fn, plan, recorder, args, kwargs)
+    finally:
+        stop_tracing()
+
+
+def _run_sync_instrumented(
+    fn: Callable[..., Any],
+    plan: _BindingPlan,
+    recorder: _PhaseRecorder,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    get_request = plan.get_request
+    call = FunctionCall(fn, args, kwargs, None if get_request is None else get_request(args))
+    for source in plan.steps or ():
+        recorder.restart()
+        data = source.extract(call)
+        _record_extraction(plan, recorder, source, data)
+        if data is not None:
+            _validate_instrumented(plan, recorder, source, data, kwargs)
+
+    recorder.restart()
+    if plan.cache is not None:
+        # Cached responses are already serialized, so the whole lookup counts as handling.
+        res = _invoke_sync_cached(fn, plan, args, kwargs)
+        recorder.record(PHASE_HANDLER)
         return res
 
-    if hasattr(res, "model_dump"):
-        return res.model_dump()
+    res = fn(*args, **kwargs)
+    recorder.record(PHASE_HANDLER)
 
-    return res.dict()
+    recorder.restart()
+    res = plan.convert(res)
+    recorder.record(PHASE_SERIALIZATION)
 
+    return res
 
-def map_request(fn: Callable[..., Any]) -> Callable[..., Any]:
-    """Map annotated arguments from the function this decorates to strongly typed models."""
-    mapped_params = _get_mapped_params(fn)
 
-    # If this particular function did not request any mappings
-    # return immediately to avoid any performance overhead.
-    if not mapped_params:
-        return fn
+async def _invoke_async_instrumented(
+    fn: Callable[..., Any], plan: _BindingPlan, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    recorder = _PhaseRecorder(cast(InstrumentationSink, plan.sink), plan.view_name)
+    if not recorder.traced:
+        return await _run_async_instrumented(fn, plan, recorder, args, kwargs)
+
+    start_tracing()
+    try:
+        return await _run_async_instrumented(fn, plan, recorder, args, kwargs)
+    finally:
+        stop_tracing()
+
+
+async def _run_async_instrumented(
+    fn: Callable[..., Any],
+    plan: _BindingPlan,
+    recorder: _PhaseRecorder,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    get_request = plan.get_request
+    call = FunctionCall(fn, args, kwargs, None if get_request is None else get_request(args))
+    for source in plan.steps or ():
+        recorder.restart()
+        data = await source.extract(call)
+        _record_extraction(plan, recorder, source, data)
+        if data is None:
+            continue
+
+        if plan.offload is not None and plan.offload.applies(data):
+            await _validate_offloaded_instrumented(plan, recorder, source, data, kwargs)
+        else:
+            _validate_instrumented(plan, recorder, source, data, kwargs)
+
+    recorder.restart()
+    if plan.cache is not None or plan.flight is not None:
+        res = await (
+            _invoke_async_coalesced(fn, plan, args, kwargs)
+            if plan.cache is None
+            else _invoke_async_cached(fn, plan, args, kwargs)
+        )
+        recorder.record(PHASE_HANDLER)
+        return res
+
+    res = await fn(*args, **kwargs)
+    recorder.record(PHASE_HANDLER)
+
+    recorder.restart()
+    res = plan.convert(res)
+    recorder.record(PHASE_SERIALIZATION)
+
+    return res
+
+
+def _make_async_wrapper(fn: Callable[..., Any], plan: _BindingPlan) -> Callable[..., Any]:
+    # Keep everything the wrapper needs in closure cells to avoid global lookups per call.
+    function_call = FunctionCall
+
+    @functools.wraps(fn)
+    async def async_inner(*args: Any, **kwargs: Any) -> Any:
+        steps = plan.steps
+        if steps is None:
+            raise TypeError(_ASYNC_NOT_SET_UP_MSG)
+
+        sink = plan.sink
+        if sink is not None and sink.should_instrument(plan.view_name):
+            return await _invoke_async_instrumented(fn, plan, args, kwargs)
 
-    if asyncio.iscoroutinefunction(fn):
+        offload = plan.offload
+        get_request = plan.get_request
+        call = function_call(fn, args, kwargs, None if get_request is None else get_request(args))
+        for extract, parameters in steps:
+            data = await extract(call)
+            if data is None:
+                continue
 
-        @functools.wraps(fn)
-        async def async_inner(*args: Any, **kwargs: Any) -> Any:
-            bound_args = await _async_get_bound_args(mapped_params, FunctionCall(fn, args, kwargs))
+            if offload is not None and offload.applies(data):
+                await offload.validate(parameters, data, kwargs)
+            else:
+                for name, validate in parameters:
+                    kwargs[name] = validate(data)
 
-            return _convert_value(await fn(*args, **kwargs, **bound_args))
+        if plan.cache is not None:
+            return await _invoke_async_cached(fn, plan, args, kwargs)
 
-        return async_inner
+        if plan.flight is not None:
+            return await _invoke_async_coalesced(fn, plan, args, kwargs)
+
+        return plan.convert(await fn(*args, **kwargs))
+
+    async_inner.__request_mapper_plan__ = plan  # type: ignore[attr-defined]
+    return async_inner
+
+
+def _make_sync_wrapper(fn: Callable[..., Any], plan: _BindingPlan) -> Callable[..., Any]:
+    function_call = FunctionCall
 
     @functools.wraps(fn)
     def sync_inner(*args: Any, **kwargs: Any) -> Any:
-        bound_args = _sync_get_bound_args(mapped_params, FunctionCall(fn, args, kwargs))
+        steps = plan.steps
+        if steps is None:
+            raise TypeError(_SYNC_NOT_SET_UP_MSG)
+
+        sink = plan.sink
+        if sink is not None and sink.should_instrument(plan.view_name):
+            return _invoke_sync_instrumented(fn, plan, args, kwargs)
 
-        return _convert_value(fn(*args, **kwargs, **bound_args))
+        get_request = plan.get_request
+        call = function_call(fn, args, kwargs, None if get_request is None else get_request(args))
+        for extract, parameters in steps:
+            data = extract(call)
+            if data is not None:
+                for name, validate in parameters:
+                    kwargs[name] = validate(data)
 
+        if plan.cache is not None:
+            return _invoke_sync_cached(fn, plan, args, kwargs)
+
+        return plan.convert(fn(*args, **kwargs))
+
+    sync_inner.__request_mapper_plan__ = plan  # type: ignore[attr-defined]
     return sync_inner
 
 
+def map_request(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Map annotated arguments from the function this decorates to strongly typed models."""
+    mapped_params = _get_mapped_params(fn)
+
+    # If this particular function did not request any mappings
+    # return immediately to avoid any performance overhead.
+    if not mapped_params:
+        return fn
+
+    plan = _BindingPlan(fn, mapped_params)
+    plan.bind()
+    _plans.add(plan)
+
+    if plan.is_async:
+        return _make_async_wrapper(fn, plan)
+
+    return _make_sync_wrapper(fn, plan)
+
+
 def setup_mapper(
     integration: RequestMapperIntegrationType,
     response_converter: ResponseConverter | None = None,
+    instrumentation: InstrumentationSink | None = None,
+    error_format: ErrorFormat | None = None,
+    *,
+    warm_up: bool = False,
 ) -> None:
     """Initialize request mapper using a given integration.
 
@@ -162,8 +736,15 @@ def setup_mapper(
     subclass `RequestMapperIntegration` to provide your own.
 
     :param integration: Integration providing access to framework data
-    :param response_converter: Convert the response to an appropriate object.
+    :param response_converter: Convert models returned by views to an appropriate object.
     By default, will convert to a Python dict using Pydantic model_dump() or dict().
+    Use `JsonResponseConverter` to serialize directly to a JSON response instead.
+    :param instrumentation: Receives the time spent extracting, validating, handling and
+    serializing each mapped request. Use `HistogramAggregator` for in-process reporting,
+    or `MemoryProfiler` to measure the memory allocated by each phase.
+    :param error_format: How validation errors are reported by the error handlers of integrations.
+    By default, every error is reported with all of its details.
+    :param warm_up: If true, call `warm_up_views` once the integration is set up.
     """
     global _integration  # noqa: PLW0603
     _integration = integration
@@ -171,16 +752,81 @@ def setup_mapper(
     global _response_converter  # noqa: PLW0603
     _response_converter = response_converter
 
+    global _instrumentation  # noqa: PLW0603
+    _instrumentation = instrumentation
+
+    set_error_format(error_format)
+
+    for plan in _plans:
+        plan.bind()
+
     _integration.set_up(request_mapper_decorator=map_request)
 
+    if warm_up:
+        warm_up_views()
+
+
+def warm_up_views(*, freeze: bool = False) -> dict[str, float]:
+    """Build the validators and serializers of every mapped view now, rather than on first use.
+
+    Views whose mapping the integration defers, such as Flask views with lazy decoration,
+    are mapped first. Then the types of all mapped parameters and the models of all return
+    annotations are built. Call this before workers fork, e.g. with gunicorn's `--preload`,
+    so that the work is done once and its result is shared by all workers.
+
+    :param freeze: If true, move every object tracked by the garbage collector to a permanent
+    generation with `gc.freeze`. Collections in workers then leave them alone, which keeps
+    their memory shared copy-on-write instead of being copied into each worker.
+    :return: The seconds spent building each type, by name.
+    """
+    if _integration is not None:
+        hook = get_warm_up_hook(_integration)
+        if hook is not None:
+            hook()
+
+    types: list[Any] = []
+    for plan in list(_plans):
+        types.extend(_get_validated_type(param) for param in plan.mapped_params.values())
+        types.extend(get_response_models(get_return_type(plan.fn)))
+
+    timings = warm_up_types(types)
+
+    if freeze:
+        gc.freeze()
+
+    return timings
+
 
 __all__ = [
     "FromBody",
+    "FromBodyLazy",
     "FromQuery",
+    "FromForm",
+    "FromHeaders",
+    "FromPath",
+    "FromCookies",
+    "FromBodyStream",
+    "FromAsyncBodyStream",
     "setup_mapper",
     "map_request",
+    "warm_up_views",
     "RequestMapperIntegration",
     "AsyncRequestMapperIntegration",
     "RequestMapperIntegrationType",
     "RequestValidationError",
+    "RequestPolicyViolationError",
+    "BodyPolicy",
+    "ErrorFormat",
+    "JsonResponseConverter",
+    "InstrumentationSink",
+    "HistogramAggregator",
+    "MemoryProfiler",
+    "ResponseCache",
+    "CacheStats",
+    "SingleFlight",
+    "FlightStats",
+    "LazyModel",
+    "UploadedFile",
+    "ValidationEngine",
+    "register_engine",
 ]
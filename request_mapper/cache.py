@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import collections
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, NamedTuple, TypeVar
+
+from pydantic import BaseModel
+
+from request_mapper.response import dump_model_json
+
+if TYPE_CHECKING:
+    from request_mapper.types import AnyCallable
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+CACHE_ATTRIBUTE = "__request_mapper_cache__"
+
+
+class CacheStats(NamedTuple):
+    """Counters describing the activity of a `ResponseCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float | None
+    size: int
+
+
+def get_view_name(fn: AnyCallable) -> str:
+    """Return the name identifying a view in caches and instrumentation."""
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+def _input_key(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        if isinstance(value, BaseModel):
+            return type(value), dump_model_json(value)
+        raise
+
+    return value  # type: ignore[no-any-return]
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by a serialized response, in bytes."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+
+    return sys.getsizeof(value)
+
+
+class ResponseCache:
+    """Opt-in cache of serialized view responses keyed on the validated request models.
+
+    Decorate views whose result depends only on their arguments, in either order relative to
+    `map_request`. The key is made of the mapped parameters followed by the other arguments,
+    e.g. path parameters, except those passed by the framework to locate the request. Calls
+    with arguments which cannot be hashed are not cached. Only results which are models are
+    cached. They are stored after
+    serialization by the response converter, and framework response objects are
+    created for every request from the cached value.
+
+    :param max_entries: Evict the least recently used entries beyond this count.
+    :param ttl: Expire entries this many seconds after they are stored.
+    :param max_size: Evict the least recently used entries while the estimated total size
+    of cached values exceeds this many bytes.
+    :param size_of: Function estimating the size of a cached value.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl: float | None = None,
+        max_size: int | None = None,
+        size_of: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_size = max_size
+        self.size_of = size_of
+        self._entries: collections.OrderedDict[Hashable, _Entry] = collections.OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, fn: _F) -> _F:
+        """Enable caching for a view."""
+        setattr(fn, CACHE_ATTRIBUTE, self)
+
+        # Already mapped views pick the cache up directly.
+        plan = getattr(fn, "__request_mapper_plan__", None)
+        if plan is not None:
+            plan.cache = self
+
+        return fn
+
+    @staticmethod
+    def make_key(view: str, inputs: Iterable[Any]) -> tuple[Hashable, ...]:
+        """Return the key of a view called with the given validated models and arguments.
+
+        Models must be hashable, e.g. frozen, or they are keyed by their JSON representation.
+        Other unhashable inputs raise a `TypeError`.
+        """
+        return (view, *map(_input_key, inputs))
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """Return whether the key is cached and its value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.expires_at is not None
+                and entry.expires_at <= time.monotonic()
+            ):
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return True, entry.value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting old entries as necessary."""
+        size = self.size_of(value) if self.max_size is not None else 0
+        if self.max_size is not None and size > self.max_size:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _Entry(value, expires_at, size)
+            self._size += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_size is not None and self._size > self.max_size
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, view: AnyCallable | None = None, *inputs: Any) -> None:
+        """Remove cached responses.
+
+        Without arguments, clears everything. With a view, removes all of its entries,
+        or only those for the given validated models when they are passed as well, whatever
+        the other arguments of the view.
+        """
+        with self._lock:
+            if view is None:
+                self._entries.clear()
+                self._size = 0
+                return
+
+            prefix = self.make_key(get_view_name(view), inputs)
+            end = len(prefix)
+            for key in [k for k in self._entries if k[:end] == prefix]:  # type: ignore[index]
+                self._remove(key)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        self._size -= self._entries.pop(key).size
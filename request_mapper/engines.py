@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import abc
+import dataclasses
+import operator
+from functools import lru_cache
+from typing import Any, Callable
+
+from pydantic import BaseModel, ValidationError
+from typing_extensions import get_origin, is_typeddict
+
+_PYDANTIC_V2 = hasattr(BaseModel, "model_validate")
+
+
+def json_safe_errors(error: ValidationError) -> list[dict[str, Any]]:
+    """Return the errors of a ValidationError raised while parsing JSON.
+
+    Errors about malformed documents echo back the raw bytes, which are not serializable.
+    These are decoded to text.
+    """
+    errors: list[dict[str, Any]] = error.errors()  # type: ignore[assignment]
+    for err in errors:
+        if isinstance(err.get("input"), bytes):
+            err["input"] = err["input"].decode(errors="replace")
+
+    return errors
+
+
+class ValidationEngine(abc.ABC):
+    """Validate request data into, and serialize responses from, the types it supports.
+
+    Engines are resolved once per annotated type when a view is decorated, and the functions
+    they compile are called directly on every request.
+    Validators raise one of `error_types`, which `get_errors` turns into a list of error dicts.
+    """
+
+    error_types: tuple[type[Exception], ...] = (ValidationError,)
+
+    @abc.abstractmethod
+    def supports(self, cls: Any) -> bool:
+        """Return whether this engine handles the given type."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def compile_validator(self, cls: Any) -> Callable[[Any], Any]:
+        """Return a function validating Python data, usually a dict, into the type."""
+        raise NotImplementedError
+
+    def compile_json_validator(self, cls: Any) -> Callable[[bytes], Any] | None:  # noqa: ARG002
+        """Return a function validating raw JSON bytes into the type, if supported."""
+        return None
+
+    def compile_serializer(self, cls: Any) -> Callable[[Any], Any]:  # noqa: ARG002
+        """Return a function converting values of the type to Python data."""
+        return _identity
+
+    def compile_json_serializer(self, cls: Any) -> Callable[[Any], bytes] | None:  # noqa: ARG002
+        """Return a function serializing values of the type to JSON bytes, if supported."""
+        return None
+
+    def get_errors(self, error: Exception) -> list[dict[str, Any]]:
+        """Return the details of a validation error as a list of error dicts."""
+        return json_safe_errors(error)  # type: ignore[arg-type]
+
+    def warm_up(self, cls: Any) -> None:
+        """Build anything the type needs which would otherwise be built on first use.
+
+        By default compiles a validator, which suffices for engines building everything up front.
+        """
+        self.compile_validator(cls)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _dump_json_v2(model: BaseModel) -> bytes:
+    return model.model_dump_json().encode()
+
+
+def _dump_json_v1(model: BaseModel) -> bytes:
+    return model.json().encode()
+
+
+class PydanticModelEngine(ValidationEngine):
+    """Engine for pydantic models, using the v2 or the v1 API depending on what is installed."""
+
+    def supports(self, cls: Any) -> bool:
+        return isinstance(cls, type) and issubclass(cls, BaseModel)
+
+    def compile_validator(self, cls: Any) -> Callable[[Any], Any]:
+        return cls.model_validate if _PYDANTIC_V2 else cls.parse_obj  # type: ignore[no-any-return]
+
+    def compile_json_validator(self, cls: Any) -> Callable[[bytes], Any] | None:
+        return cls.model_validate_json if _PYDANTIC_V2 else None
+
+    def compile_serializer(self, cls: Any) -> Callable[[Any], Any]:  # noqa: ARG002
+        # Called by name so that subclasses overriding the method are honoured.
+        return operator.methodcaller("model_dump" if _PYDANTIC_V2 else "dict")
+
+    def compile_json_serializer(self, cls: Any) -> Callable[[Any], bytes] | None:  # noqa: ARG002
+        return _dump_json_v2 if _PYDANTIC_V2 else _dump_json_v1
+
+    def warm_up(self, cls: Any) -> None:
+        # Models with deferred or incomplete schemas are otherwise built on first validation.
+        if _PYDANTIC_V2:
+            cls.model_rebuild()
+
+
+class _RootAdapter:
+    """Pydantic v1 counterpart of `TypeAdapter`, validating through a model with a root field."""
+
+    def __init__(self, cls: Any) -> None:
+        from pydantic import create_model
+
+        self.model = create_model("RootModel", __root__=(cls, ...))
+
+    def validate_python(self, data: Any) -> Any:
+        return self.model(__root__=data).__root__  # type: ignore[attr-defined]
+
+    def dump_python(self, value: Any) -> Any:
+        return self.model(__root__=value).dict()["__root__"]
+
+    def dump_json(self, value: Any) -> bytes:
+        return self.model(__root__=value).json().encode()
+
+
+def _build_type_adapter(cls: Any) -> Any:
+    if _PYDANTIC_V2:
+        from pydantic import TypeAdapter
+
+        return TypeAdapter(cls)
+
+    return _RootAdapter(cls)
+
+
+_cached_type_adapter = lru_cache(maxsize=None)(_build_type_adapter)
+
+
+def get_type_adapter(cls: Any) -> Any:
+    """Return a `TypeAdapter` validating any type such as `list[T]`, `dict[str, T]` or unions.
+
+    Adapters are built once per type and shared by every view using it, since building the
+    validation schema is far more expensive than validating a payload.
+    """
+    try:
+        return _cached_type_adapter(cls)
+    except TypeError:
+        # Types with unhashable metadata cannot be cached.
+        return _build_type_adapter(cls)
+
+
+def is_generic_type(cls: Any) -> bool:
+    """Return whether `cls` is a type such as `list[T]` or a union, rather than a plain class."""
+    return get_origin(cls) is not None or not isinstance(cls, type)
+
+
+class TypeAdapterEngine(ValidationEngine):
+    """Engine for containers, unions, stdlib dataclasses and TypedDicts, through a cached adapter.
+
+    Containers are validated in a single call, with errors starting at the index or key of the
+    failing item.
+    """
+
+    def supports(self, cls: Any) -> bool:
+        return is_generic_type(cls) or dataclasses.is_dataclass(cls) or is_typeddict(cls)
+
+    def warm_up(self, cls: Any) -> None:
+        get_type_adapter(cls)
+
+    def compile_validator(self, cls: Any) -> Callable[[Any], Any]:
+        return get_type_adapter(cls).validate_python  # type: ignore[no-any-return]
+
+    def compile_json_validator(self, cls: Any) -> Callable[[bytes], Any] | None:
+        return get_type_adapter(cls).validate_json if _PYDANTIC_V2 else None
+
+    def compile_serializer(self, cls: Any) -> Callable[[Any], Any]:
+        return get_type_adapter(cls).dump_python  # type: ignore[no-any-return]
+
+    def compile_json_serializer(self, cls: Any) -> Callable[[Any], bytes] | None:
+        return get_type_adapter(cls).dump_json  # type: ignore[no-any-return]
+
+    if not _PYDANTIC_V2:
+
+        def get_errors(self, error: Exception) -> list[dict[str, Any]]:
+            # Pydantic v1 reports errors under the root field of the adapter model.
+            errors = super().get_errors(error)
+            for err in errors:
+                if err["loc"][:1] == ("__root__",):
+                    err["loc"] = err["loc"][1:]
+
+            return errors
+
+
+class ClassEngine(ValidationEngine):
+    """Fallback engine calling any other class with the data as keyword arguments."""
+
+    def supports(self, cls: Any) -> bool:
+        return isinstance(cls, type)
+
+    def compile_validator(self, cls: Any) -> Callable[[Any], Any]:
+        def validate(data: Any) -> Any:
+            return cls(**data)
+
+        return validate
+
+
+_engines: list[ValidationEngine] = [PydanticModelEngine(), TypeAdapterEngine(), ClassEngine()]
+
+
+def register_engine(engine: ValidationEngine) -> None:
+    """Register an engine taking precedence over the built-in ones and those registered before.
+
+    Engines are resolved when views are decorated, so register them before importing views.
+    """
+    _engines.insert(0, engine)
+
+
+def get_engine(cls: Any) -> ValidationEngine:
+    """Return the first registered engine supporting the given type."""
+    for engine in _engines:
+        if engine.supports(cls):
+            return engine
+
+    msg = f"No validation engine supports {cls!r}"
+    raise TypeError(msg)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from request_mapper.types import RequestValidationError
+
+_PYDANTIC_V2 = hasattr(BaseModel, "model_validate")
+_OPTIONAL_KEYS = (("include_input", "input"), ("include_context", "ctx"), ("include_url", "url"))
+
+
+@dataclass(frozen=True)
+class ErrorFormat:
+    """How validation errors are reported in error responses.
+
+    Pass one to `setup_mapper` to keep error responses cheap, e.g. when invalid requests flood in.
+    Errors raised by pydantic v2 are rendered to JSON by pydantic itself whenever possible.
+
+    :param max_errors: Maximum number of errors reported per response.
+    :param include_input: Echo back the invalid input of each error.
+    :param include_context: Include the context of each error, such as the limits that failed.
+    :param include_url: Include a link to the documentation of each error type.
+    """
+
+    max_errors: int | None = None
+    include_input: bool = True
+    include_context: bool = True
+    include_url: bool = True
+
+    def format(self, err: RequestValidationError) -> list[dict[str, Any]]:
+        """Return the errors to report as a list of error dicts."""
+        cause = err.cause
+        if _PYDANTIC_V2 and err.get_errors is None and isinstance(cause, ValidationError):
+            errors: list[dict[str, Any]] = cause.errors(  # type: ignore[assignment]
+                include_url=self.include_url,
+                include_context=self.include_context,
+                include_input=self.include_input,
+            )
+            return errors[: self.max_errors]
+
+        excluded = [key for option, key in _OPTIONAL_KEYS if not getattr(self, option)]
+        errors = err.source_errors[: self.max_errors]
+        if excluded:
+            errors = [{k: v for k, v in error.items() if k not in excluded} for error in errors]
+
+        return errors
+
+    def render(self, err: RequestValidationError) -> bytes:
+        """Return the errors to report as a JSON array."""
+        cause = err.cause
+        if (
+            _PYDANTIC_V2
+            and err.get_errors is None
+            and isinstance(cause, ValidationError)
+            and (self.max_errors is None or cause.error_count() <= self.max_errors)
+        ):
+            return cause.json(
+                indent=None,
+                include_url=self.include_url,
+                include_context=self.include_context,
+                include_input=self.include_input,
+            ).encode()
+
+        return json.dumps(self.format(err), default=str).encode()
+
+
+_error_format = ErrorFormat()
+
+
+def set_error_format(error_format: ErrorFormat | None) -> None:
+    """Use the given format for error responses, or the default one reporting everything."""
+    global _error_format  # noqa: PLW0603
+    _error_format = error_format or ErrorFormat()
+
+
+def render_errors(err: RequestValidationError) -> bytes:
+    """Return the errors of a `RequestValidationError` as JSON, in the configured format."""
+    return _error_format.render(err)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
+
+FLIGHT_ATTRIBUTE = "__request_mapper_flight__"
+
+# Result of a call whose leader was cancelled, e.g. by its client disconnecting, or whose
+# result cannot be shared. Waiters then run the view themselves.
+_NOT_SHARED: Any = object()
+
+
+class FlightStats(NamedTuple):
+    """Counters describing the activity of a `SingleFlight`."""
+
+    calls: int
+    coalesced: int
+    fallbacks: int
+    in_flight: int
+
+
+class SingleFlight:
+    """Opt-in coalescing of identical concurrent calls to async views.
+
+    While a view is running for some validated request models, calls with equal models wait
+    for it to complete and share its result instead of running the view again. Exceptions
+    raised by the view are raised in every waiting call. Like for `ResponseCache`, the key is
+    made of the view and its arguments except the framework ones. Only model results are
+    shared, after serialization, so each call still gets its own framework response. Waiting
+    calls run the view themselves when it returns anything else, e.g. a framework response,
+    which must not be sent more than once. Decorate views in either order relative to
+    `map_request`.
+
+    Calls are coalesced per event loop, so each worker process runs a view once per input.
+
+    :param max_wait: Seconds to wait for a call in flight before running the view anyway.
+    By default, waits for as long as the view runs.
+    """
+
+    def __init__(self, *, max_wait: float | None = None) -> None:
+        self.max_wait = max_wait
+        self._flights: dict[Hashable, asyncio.Future[Any]] = {}
+        self._calls = 0
+        self._coalesced = 0
+        self._fallbacks = 0
+
+    def __call__(self, fn: _F) -> _F:
+        """Enable coalescing for an async view."""
+        if not inspect.iscoroutinefunction(fn):
+            msg = f"SingleFlight only supports async views, got {fn!r}"
+            raise TypeError(msg)
+
+        setattr(fn, FLIGHT_ATTRIBUTE, self)
+
+        # Already mapped views pick it up directly.
+        plan = getattr(fn, "__request_mapper_plan__", None)
+        if plan is not None:
+            plan.flight = self
+
+        return fn
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[_T]],
+        shareable: Callable[[_T], bool] | None = None,
+    ) -> _T:
+        """Return the result of `call`, shared with concurrent calls using the same key.
+
+        Results for which `shareable` returns False are only returned to the call which
+        produced them, and the calls waiting for it run `call` themselves.
+        """
+        key = (asyncio.get_running_loop(), key)
+        future = self._flights.get(key)
+        if future is None:
+            return await self._lead(key, call, shareable)
+
+        self._coalesced += 1
+        try:
+            res = await asyncio.wait_for(asyncio.shield(future), self.max_wait)
+        except asyncio.TimeoutError:
+            res = _NOT_SHARED
+            self._fallbacks += 1
+
+        if res is _NOT_SHARED:
+            return await call()
+
+        return res  # type: ignore[no-any-return]
+
+    async def _lead(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[_T]],
+        shareable: Callable[[_T], bool] | None,
+    ) -> _T:
+        future = self._flights[key] = asyncio.get_running_loop().create_future()
+        self._calls += 1
+        try:
+            res = await call()
+        except asyncio.CancelledError:
+            future.set_result(_NOT_SHARED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Without waiters nobody else retrieves the exception, which asyncio would log.
+            future.exception()
+            raise
+        else:
+            future.set_result(res if shareable is None or shareable(res) else _NOT_SHARED)
+            return res
+        finally:
+            del self._flights[key]
+
+    @property
+    def stats(self) -> FlightStats:
+        return FlightStats(
+            calls=self._calls,
+            coalesced=self._coalesced,
+            fallbacks=self._fallbacks,
+            in_flight=len(self._flights),
+        )
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import mmap
+import tempfile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from urllib.parse import parse_qsl
+
+from request_mapper.types import RequestPolicyViolationError, RequestValidationError
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+    from request_mapper.types import DataExtractor, FormDataMapping, FunctionCall
+
+    HeaderGetter = Callable[[FunctionCall, str], Any]
+
+_CRLF = b"\r\n"
+_HEADERS_END = b"\r\n\r\n"
+_MAX_HEADERS_SIZE = 16 * 1024
+
+
+class UploadedFile:
+    """A file uploaded in a multipart form.
+
+    Contents are kept in memory up to the spool size of the mapping and written to a temporary
+    file beyond that. Declare fields of this type to receive uploads, e.g. `avatar: UploadedFile`.
+    """
+
+    def __init__(self, filename: str, content_type: str | None, spool_size: int) -> None:
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self.file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+    def write(self, data: bytes | memoryview) -> None:
+        self.size += len(data)
+        self.file.write(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.file.seek(offset, whence)
+
+    def mmap(self) -> mmap.mmap | memoryview:
+        """Return the contents without copying them, memory-mapped if they were written to disk.
+
+        Contents still in memory are returned as a memoryview instead.
+        """
+        self.file.flush()
+        if self.size == 0:
+            return memoryview(b"")
+
+        if not self.file._rolled:  # type: ignore[attr-defined]  # noqa: SLF001
+            return self.file._file.getbuffer()  # type: ignore[attr-defined, no-any-return]  # noqa: SLF001
+
+        return mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __repr__(self) -> str:
+        """Show the file name and size."""
+        return f"{type(self).__name__}({self.filename!r}, size={self.size})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls: type[UploadedFile],
+        source: Any,
+        handler: GetCoreSchemaHandler,
+    ) -> CoreSchema:
+        """Accept instances as they are in pydantic v2 models."""
+        from pydantic_core import core_schema
+
+        return core_schema.is_instance_schema(cls)
+
+    @classmethod
+    def __get_validators__(cls: type[UploadedFile]) -> Iterator[Callable[[Any], Any]]:
+        """Accept instances as they are in pydantic v1 models."""
+        yield cls._validate
+
+    @classmethod
+    def _validate(cls: type[UploadedFile], value: Any) -> UploadedFile:
+        if not isinstance(value, cls):
+            msg = "Expected an uploaded file"
+            raise TypeError(msg)
+
+        return value
+
+
+class FormData(Mapping[str, Any]):
+    """Multi-value mapping of form fields. Indexing returns the first value of a key."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, list[Any]] = {}
+
+    def add(self, key: str, value: Any) -> None:
+        self._values.setdefault(key, []).append(value)
+
+    def getlist(self, key: str) -> list[Any]:
+        return self._values.get(key, [])
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the first value of the key."""
+        return self._values[key][0]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """Return the number of distinct keys."""
+        return len(self._values)
+
+
+def _parse_options(header: str) -> tuple[str, dict[str, str]]:
+    """Split a header such as Content-Type into its value and parameters."""
+    value, *params = header.split(";")
+    options = {}
+    for param in params:
+        key, _, option = param.strip().partition("=")
+        if len(option) > 1 and option[0] == option[-1] == '"':
+            option = option[1:-1]
+        options[key.lower()] = option
+
+    return value.strip().lower(), options
+
+
+class FormParser:
+    """Incrementally parse an urlencoded or multipart body.
+
+    Multipart parts are written out as they arrive: files to spooled temporary storage
+    and fields to memory. Only a part boundary's worth of data is held back between chunks.
+    Parts larger than their limit are rejected with a `RequestPolicyViolationError`.
+    """
+
+    def __init__(self, content_type: str | None, mapping: type[FormDataMapping]) -> None:
+        self.mapping = mapping
+        self.location = mapping.location
+        self.data = FormData()
+        media_type, options = _parse_options(content_type or "")
+
+        self._buffer = bytearray()
+        self._urlencoded = media_type == "application/x-www-form-urlencoded"
+        if self._urlencoded:
+            return
+
+        boundary = options.get("boundary")
+        if media_type != "multipart/form-data" or not boundary:
+            msg = f"Content type {media_type or 'none'!r} is not a form"
+            raise RequestPolicyViolationError(
+                self.location, "unsupported_content_type", msg, status_code=415
+            )
+
+        self._delimiter = b"--" + boundary.encode("latin-1")
+        self._part_delimiter = _CRLF + self._delimiter
+        self._state = "preamble"
+        self._steps = {
+            "preamble": self._read_preamble,
+            "delimiter": self._read_delimiter,
+            "headers": self._read_headers,
+            "body": self._read_body,
+        }
+        self._parts = 0
+        self._part: UploadedFile | bytearray | None = None
+        self._part_name = ""
+        self._part_limit: int | None = None
+        self._part_size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Add a chunk of the body."""
+        self._buffer += chunk
+        if self._urlencoded:
+            self._check_size(len(self._buffer), self.mapping.max_field_size)
+            return
+
+        steps = self._steps
+        while self._state != "done" and steps[self._state]():
+            pass
+
+    def close(self) -> FormData:
+        """Signal the end of the body and return the parsed form."""
+        if self._urlencoded:
+            for key, value in parse_qsl(
+                self._buffer.decode("utf-8", errors="replace"), keep_blank_values=True
+            ):
+                self.data.add(key, value)
+        elif self._state != "done":
+            self._fail("Multipart body ended before its closing boundary")
+
+        return self.data
+
+    # Each state consumes what it can from the buffer and returns whether to go on.
+
+    def _read_preamble(self) -> bool:
+        buffer = self._buffer
+        index = buffer.find(self._delimiter)
+        if index < 0:
+            # Keep enough to match a delimiter split across chunks.
+            del buffer[: max(0, len(buffer) - len(self._delimiter))]
+            return False
+
+        del buffer[: index + len(self._delimiter)]
+        self._state = "delimiter"
+        return True
+
+    def _read_delimiter(self) -> bool:
+        buffer = self._buffer
+        if len(buffer) < 2:  # noqa: PLR2004
+            return False
+
+        if buffer[:2] == b"--":
+            self._state = "done"
+            buffer.clear()
+            return False
+
+        if buffer[:2] != _CRLF:
+            self._fail("Malformed multipart boundary")
+
+        del buffer[:2]
+        self._state = "headers"
+        return True
+
+    def _read_headers(self) -> bool:
+        buffer = self._buffer
+        index = buffer.find(_HEADERS_END)
+        if index < 0:
+            if len(buffer) > _MAX_HEADERS_SIZE:
+                self._fail("Multipart part headers are too large")
+            return False
+
+        self._start_part(bytes(buffer[:index]).decode("utf-8", errors="replace"))
+        del buffer[: index + len(_HEADERS_END)]
+        self._state = "body"
+        return True
+
+    def _read_body(self) -> bool:
+        buffer = self._buffer
+        index = buffer.find(self._part_delimiter)
+        if index < 0:
+            keep = len(self._part_delimiter) - 1
+            if len(buffer) > keep:
+                self._write_part(len(buffer) - keep)
+                del buffer[: len(buffer) - keep]
+            return False
+
+        self._write_part(index)
+        self._finish_part()
+        del buffer[: index + len(self._part_delimiter)]
+        self._state = "delimiter"
+        return True
+
+    def _start_part(self, raw_headers: str) -> None:
+        self._parts += 1
+        if self._parts > self.mapping.max_parts:
+            msg = f"Form has more than {self.mapping.max_parts} parts"
+            raise RequestPolicyViolationError(self.location, "too_many_parts", msg, 413)
+
+        headers = {}
+        for line in raw_headers.split("\r\n"):
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        _, disposition = _parse_options(headers.get("content-disposition", ""))
+        self._part_name = disposition.get("name", "")
+        self._part_size = 0
+
+        filename = disposition.get("filename")
+        if filename is None:
+            self._part = bytearray()
+            self._part_limit = self.mapping.max_field_size
+        else:
+            self._part = UploadedFile(
+                filename, headers.get("content-type"), self.mapping.spool_size
+            )
+            self._part_limit = self.mapping.max_file_size
+
+    def _write_part(self, end: int) -> None:
+        """Write the start of the buffer up to `end` to the current part."""
+        self._part_size += end
+        self._check_size(self._part_size, self._part_limit)
+        part = self._part
+        # Views must be released before the buffer is resized.
+        with memoryview(self._buffer) as view, view[:end] as data:
+            if isinstance(part, bytearray):
+                part += data
+            elif part is not None:
+                part.write(data)
+
+    def _finish_part(self) -> None:
+        part = self._part
+        if isinstance(part, UploadedFile):
+            part.seek(0)
+            self.data.add(self._part_name, part)
+        elif part is not None:
+            self.data.add(self._part_name, part.decode("utf-8", errors="replace"))
+        self._part = None
+
+    def _check_size(self, size: int, limit: int | None) -> None:
+        if limit is not None and size > limit:
+            msg = f"Form part exceeds the maximum size of {limit} bytes"
+            raise RequestPolicyViolationError(self.location, "part_too_large", msg, 413)
+
+    def _fail(self, message: str) -> None:
+        raise RequestValidationError(
+            location=self.location,
+            source_errors=[{"type": "form_invalid", "loc": (), "msg": message}],
+        )
+
+
+def compile_form_extractor(
+    mapping: type[FormDataMapping],
+    get_header: HeaderGetter,
+    get_stream: DataExtractor,
+    *,
+    is_async: bool,
+) -> DataExtractor:
+    """Return an extractor parsing the form from the request body stream."""
+    if is_async:
+
+        async def extract_async(call: FunctionCall) -> FormData:
+            parser = FormParser(await get_header(call, "Content-Type"), mapping)
+            chunks: AsyncIterable[bytes] = await get_stream(call)
+            async for chunk in chunks:
+                parser.feed(chunk)
+
+            return parser.close()
+
+        return extract_async
+
+    def extract(call: FunctionCall) -> FormData:
+        parser = FormParser(get_header(call, "Content-Type"), mapping)
+        chunks: Iterable[bytes] = get_stream(call)
+        for chunk in chunks:
+            parser.feed(chunk)
+
+        return parser.close()
+
+    return extract
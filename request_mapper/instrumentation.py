@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import abc
+import bisect
+import threading
+from typing import Any, NamedTuple
+
+PHASE_EXTRACTION = "extraction"
+PHASE_VALIDATION = "validation"
+PHASE_HANDLER = "handler"
+PHASE_SERIALIZATION = "serialization"
+
+# Bound of the last bucket in reports, as JSON has no representation for infinity.
+OVERFLOW_BOUND = "+Inf"
+
+
+class PhaseTiming(NamedTuple):
+    """Time spent in one phase of a mapped request.
+
+    `location` and `payload_size` are only set for the extraction and validation phases.
+    The payload size is the length in bytes or characters of raw data, None for decoded data.
+    `peak_memory` and `retained_memory` are only set when the sink asked to measure memory.
+    """
+
+    view: str
+    phase: str
+    duration: float
+    location: str | None = None
+    payload_size: int | None = None
+    peak_memory: int | None = None
+    retained_memory: int | None = None
+
+
+class InstrumentationSink(abc.ABC):
+    """Receives timings of mapped requests. Register one using `setup_mapper`.
+
+    Methods are called synchronously on the request path and should return quickly.
+    """
+
+    @abc.abstractmethod
+    def record_phase(self, timing: PhaseTiming) -> None:
+        """Record the time spent in a single phase of a request."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def record_validation_failure(self, view: str, location: str) -> None:
+        """Record that data from the given location failed validation."""
+        raise NotImplementedError
+
+    def should_instrument(self, view: str) -> bool:  # noqa: ARG002
+        """Return whether to instrument the next request of the view.
+
+        Called once per request, before anything is measured. Requests for which this
+        returns False take the same path as without a sink. By default, all are instrumented.
+        """
+        return True
+
+    def measure_memory(self, view: str) -> bool:  # noqa: ARG002
+        """Return whether to trace the memory allocated by each phase of the next request.
+
+        Called once per instrumented request. Tracing is expensive, so sinks should only
+        sample requests, e.g. through `should_instrument`.
+        """
+        return False
+
+
+def get_payload_size(data: Any) -> int | None:
+    """Return the size of raw request data, or None if it has already been decoded."""
+    if isinstance(data, (bytes, bytearray, memoryview, str)):
+        return len(data)
+
+    return None
+
+
+# Exponential bucket bounds in seconds from 1us to ~67s.
+DEFAULT_BUCKETS = tuple(1e-6 * 2**i for i in range(27))
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "min", "max", "payload_total")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.counts = [0] * (bucket_count + 1)
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.payload_total = 0
+
+
+class HistogramAggregator(InstrumentationSink):
+    """In-process sink aggregating timings into histograms per view, phase and location."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._histograms: dict[tuple[str, str, str | None], _Histogram] = {}
+        self._failures: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def record_phase(self, timing: PhaseTiming) -> None:
+        key = (timing.view, timing.phase, timing.location)
+        bucket = bisect.bisect_left(self.buckets, timing.duration)
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets))
+
+            histogram.counts[bucket] += 1
+            histogram.total += timing.duration
+            histogram.min = min(histogram.min, timing.duration)
+            histogram.max = max(histogram.max, timing.duration)
+            histogram.payload_total += timing.payload_size or 0
+
+    def record_validation_failure(self, view: str, location: str) -> None:
+        with self._lock:
+            self._failures[view, location] = self._failures.get((view, location), 0) + 1
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._histograms.clear()
+            self._failures.clear()
+
+    def report(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary of everything recorded so far.
+
+        Percentiles are estimated as the upper bound of the bucket they fall in.
+        The bound of the bucket for durations beyond the last bound is `"+Inf"`.
+        """
+        with self._lock:
+            phases = [
+                self._summarize(view, phase, location, histogram)
+                for (view, phase, location), histogram in sorted(
+                    self._histograms.items(), key=lambda item: repr(item[0])
+                )
+            ]
+            failures = [
+                {"view": view, "location": location, "count": count}
+                for (view, location), count in sorted(self._failures.items())
+            ]
+
+        return {"phases": phases, "validation_failures": failures}
+
+    def _summarize(
+        self, view: str, phase: str, location: str | None, histogram: _Histogram
+    ) -> dict[str, Any]:
+        count = sum(histogram.counts)
+        bounds: list[Any] = [*self.buckets, OVERFLOW_BOUND]
+
+        return {
+            "view": view,
+            "phase": phase,
+            "location": location,
+            "count": count,
+            "total": histogram.total,
+            "mean": histogram.total / count,
+            "min": histogram.min,
+            "max": histogram.max,
+            "mean_payload_size": histogram.payload_total / count,
+            "p50": self._percentile(histogram, count, 0.5),
+            "p90": self._percentile(histogram, count, 0.9),
+            "p99": self._percentile(histogram, count, 0.99),
+            "buckets": [
+                {"le": bound, "count": bucket_count}
+                for bound, bucket_count in zip(bounds, histogram.counts)
+                if bucket_count
+            ],
+        }
+
+    def _percentile(self, histogram: _Histogram, count: int, quantile: float) -> float:
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, histogram.counts):
+            seen += bucket_count
+            if seen >= count * quantile:
+                return min(bound, histogram.max)
+
+        return histogram.max
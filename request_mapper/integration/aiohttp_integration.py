@@ -1,13 +1,30 @@
-from typing import Awaitable, Callable
+from __future__ import annotations
+
+import inspect
+import sys
+import typing
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator
 
 from request_mapper import AsyncRequestMapperIntegration, RequestValidationError
+from request_mapper.errors import render_errors
+from request_mapper.offload import DEFAULT_OFFLOAD_THRESHOLD
+from request_mapper.response import NDJSON_MEDIA_TYPE, accepts_ndjson, aiter_json_chunks
+from request_mapper.streaming import STREAM_CHUNK_SIZE
 from request_mapper.types import (
+    AnyCallable,
     FunctionCall,
     IncomingMappedData,
     IntegrationDoesNotExistError,
     RequestMapperDecorator,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from aiohttp.abc import AbstractStreamWriter
+
+    from request_mapper.integration.integration import RequestGetter
+
 try:
     from aiohttp import web
 except ImportError as e:
@@ -23,10 +40,39 @@ async def _aio_error_middleware(
     try:
         return await handler(request)
     except RequestValidationError as e:
-        return web.json_response(e.source_errors, status=422)
+        return web.Response(
+            body=render_errors(e), status=e.status_code, content_type="application/json"
+        )
+
+
+class JsonStreamResponse(web.StreamResponse):
+    """Response writing the items of a generator as they are produced.
+
+    Items are sent as a JSON array, or as newline-delimited JSON if the client accepts it.
+    """
+
+    def __init__(self, items: Iterator[Any] | AsyncIterator[Any]) -> None:
+        super().__init__()
+        self.results = items
+
+    async def prepare(self, request: web.BaseRequest) -> AbstractStreamWriter | None:
+        """Send the headers, then the items."""
+        if self.prepared:
+            return await super().prepare(request)
+
+        ndjson = accepts_ndjson(request.headers.get("Accept"))
+        self.content_type = NDJSON_MEDIA_TYPE if ndjson else "application/json"
+        writer = await super().prepare(request)
+        async for chunk in aiter_json_chunks(self.results, ndjson=ndjson):
+            await self.write(chunk)
+
+        return writer
 
 
 def _get_request(call: FunctionCall) -> web.Request:
+    if call.request is not None:
+        return call.request  # type: ignore[no-any-return]
+
     for arg in call.args:
         if isinstance(arg, web.View):
             return arg.request
@@ -38,19 +84,131 @@ def _get_request(call: FunctionCall) -> web.Request:
     raise ValueError(msg)
 
 
+def _request_from_view(args: tuple[Any, ...]) -> web.Request | None:
+    view = args[0] if args else None
+    return view.request if isinstance(view, web.View) else None
+
+
+def _request_at(index: int) -> RequestGetter:
+    """Return a getter reading the request from the positional argument at `index`.
+
+    Returns None when the view is called otherwise, so that the arguments are searched instead.
+    """
+
+    def get_request(args: tuple[Any, ...]) -> web.BaseRequest | None:
+        if len(args) > index and isinstance(args[index], web.BaseRequest):
+            return args[index]  # type: ignore[no-any-return]
+
+        return None
+
+    return get_request
+
+
+def _is_view_method(fn: AnyCallable) -> bool:
+    """Return whether the function is defined in a `web.View` subclass.
+
+    The class is looked up from the qualified name of the function, so this is False for
+    classes defined in functions or not defined yet, e.g. while the class body runs.
+    """
+    owner: Any = sys.modules.get(fn.__module__)
+    for name in fn.__qualname__.split(".")[:-1]:
+        owner = getattr(owner, name, None)
+
+    return isinstance(owner, type) and issubclass(owner, web.View)
+
+
+def _get_type_hints(fn: AnyCallable) -> dict[str, Any]:
+    try:
+        return typing.get_type_hints(fn)
+    except Exception:  # noqa: BLE001
+        # Annotations referring to names which are not importable at runtime.
+        return {}
+
+
 class AioHttpIntegration(AsyncRequestMapperIntegration):
-    """Async integration for aiohttp framework v3.x."""
+    """Async integration for aiohttp framework v3.x.
 
-    def __init__(self, app: web.Application, *, add_error_handling_middleware: bool = True) -> None:
+    Pass a `validation_executor` to validate request bodies larger than `offload_threshold`
+    bytes outside of the event loop. A thread pool works with any model. A process pool
+    also avoids holding the GIL but requires models importable at module level.
+    """
+
+    def __init__(
+        self,
+        app: web.Application,
+        *,
+        add_error_handling_middleware: bool = True,
+        validation_executor: Executor | None = None,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
         self.app = app
+        self.validation_executor = validation_executor
+        self.offload_threshold = offload_threshold
         if add_error_handling_middleware:
             self.app.middlewares.append(_aio_error_middleware)
 
     def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
         pass
 
+    def bind_request_getter(self, fn: AnyCallable) -> RequestGetter | None:
+        """Locate the request among the positional parameters of the view.
+
+        That is the parameter annotated as a request, or else the one named `request`.
+        Methods of class-based views read it from the view instead. Getters check the
+        argument they find, so views called differently fall back to searching the arguments.
+        """
+        parameters = [
+            parameter
+            for parameter in inspect.signature(fn).parameters.values()
+            if parameter.kind
+            in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        hints = _get_type_hints(fn)
+        for index, parameter in enumerate(parameters):
+            annotation = hints.get(parameter.name, parameter.annotation)
+            if isinstance(annotation, type) and issubclass(annotation, web.BaseRequest):
+                return _request_at(index)
+
+        names = [parameter.name for parameter in parameters]
+        if names[:1] == ["self"] and _is_view_method(fn):
+            return _request_from_view
+
+        if "request" in names:
+            return _request_at(names.index("request"))
+
+        return None
+
     async def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:
         return _get_request(call).query
 
+    async def get_header(self, call: FunctionCall, name: str) -> str | None:
+        return _get_request(call).headers.get(name)
+
+    async def get_headers(self, call: FunctionCall) -> Any:
+        return _get_request(call).headers
+
+    async def get_path_params(self, call: FunctionCall) -> Any:
+        return _get_request(call).match_info
+
+    async def get_cookies(self, call: FunctionCall) -> Any:
+        return _get_request(call).cookies
+
+    async def get_query_string(self, call: FunctionCall) -> str:
+        return _get_request(call).rel_url.raw_query_string
+
     async def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:
         return await _get_request(call).json()  # type: ignore[no-any-return]
+
+    async def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:
+        return await _get_request(call).read()
+
+    async def get_request_body_stream(self, call: FunctionCall) -> AsyncIterator[bytes]:
+        return _get_request(call).content.iter_chunked(STREAM_CHUNK_SIZE)
+
+    def make_json_response(self, content: bytes) -> web.Response:
+        return web.Response(body=content, content_type="application/json")
+
+    def make_json_stream_response(
+        self, items: Iterator[Any] | AsyncIterator[Any]
+    ) -> JsonStreamResponse:
+        return JsonStreamResponse(items)
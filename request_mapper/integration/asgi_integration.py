@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import inspect
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    MutableMapping,
+)
+from urllib.parse import parse_qsl
+
+from request_mapper import AsyncRequestMapperIntegration, RequestValidationError
+from request_mapper.errors import render_errors
+from request_mapper.lookup import CookieLookup
+from request_mapper.offload import DEFAULT_OFFLOAD_THRESHOLD
+from request_mapper.response import NDJSON_MEDIA_TYPE, accepts_ndjson, aiter_json_chunks
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from request_mapper.integration.integration import RequestGetter
+    from request_mapper.types import (
+        AnyCallable,
+        FunctionCall,
+        IncomingMappedData,
+        RequestMapperDecorator,
+    )
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+AsgiApp = Callable[[Scope, Receive, Send], Awaitable[Any]]
+
+# The body is kept in the scope so that every accessor sees it after `receive` is drained.
+_BODY_SCOPE_KEY = "request_mapper.body"
+
+
+class JsonResponse:
+    """Minimal ASGI response sending already serialized JSON."""
+
+    __slots__ = ("body", "status")
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        self.body = body
+        self.status = status
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        """Send the response as an ASGI app."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(self.body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class JsonStreamResponse:
+    """ASGI response sending the items of a generator as they are produced.
+
+    Items are sent as a JSON array, or as newline-delimited JSON if the client accepts it.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterator[Any] | AsyncIterator[Any]) -> None:
+        self.items = items
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        """Send the response as an ASGI app."""
+        ndjson = accepts_ndjson(AsgiHeaders(scope).get("Accept"))
+        content_type = NDJSON_MEDIA_TYPE if ndjson else "application/json"
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type.encode())],
+            }
+        )
+        async for chunk in aiter_json_chunks(self.items, ndjson=ndjson):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        await send({"type": "http.response.body", "body": b""})
+
+
+class AsgiHeaders:
+    """Case-insensitive view over the headers of an ASGI scope, searched on each lookup."""
+
+    __slots__ = ("headers",)
+
+    def __init__(self, scope: Scope) -> None:
+        self.headers = scope.get("headers", ())
+
+    def get(self, name: str) -> str | None:
+        key = name.lower().encode("latin-1")
+        for header, value in self.headers:
+            if header.lower() == key:
+                return value.decode("latin-1")  # type: ignore[no-any-return]
+
+        return None
+
+    def getall(self, name: str, default: Any = None) -> Any:
+        key = name.lower().encode("latin-1")
+        values = [
+            value.decode("latin-1") for header, value in self.headers if header.lower() == key
+        ]
+        return values or default
+
+
+class AsgiMiddleware:
+    """Wrap an ASGI app using mapped views.
+
+    Responds with the status of the error and its details as JSON when request validation fails.
+    Values returned by the app are sent as JSON, so views can return models like in
+    other integrations. Use `JsonResponseConverter` to skip encoding them again here.
+    """
+
+    def __init__(self, app: AsgiApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the wrapped app."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            res = await self.app(scope, receive, send)
+        except RequestValidationError as e:
+            res = JsonResponse(render_errors(e), status=e.status_code)
+
+        if res is None:
+            return
+
+        if not isinstance(res, (JsonResponse, JsonStreamResponse)):
+            res = JsonResponse(json.dumps(res).encode())
+
+        await res(scope, receive, send)
+
+
+async def _read_body(scope: Scope, receive: Receive) -> bytes:
+    body: bytes | None = scope.get(_BODY_SCOPE_KEY)
+    if body is not None:
+        return body
+
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+
+    # A single chunk, the common case for small bodies, is used as is.
+    # Otherwise chunks are copied once into the final buffer.
+    body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    scope[_BODY_SCOPE_KEY] = body
+    return body
+
+
+def _request_from_method(args: tuple[Any, ...]) -> tuple[Any, ...]:
+    return args[1:3]
+
+
+def _request_from_app(args: tuple[Any, ...]) -> tuple[Any, ...]:
+    return args[:2]
+
+
+class AsgiIntegration(AsyncRequestMapperIntegration):
+    """Async integration working directly on ASGI `scope` and `receive`.
+
+    Mapped views are ASGI apps taking mapped parameters after `scope, receive, send`,
+    or methods taking them after `self`. Wrap the app in `AsgiMiddleware` to send values
+    returned by views and to handle validation errors.
+    Request bodies are read once and validated straight from the bytes.
+    """
+
+    def __init__(
+        self,
+        *,
+        validation_executor: Executor | None = None,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
+        self.validation_executor = validation_executor
+        self.offload_threshold = offload_threshold
+
+    def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
+        pass
+
+    def bind_request_getter(self, fn: AnyCallable) -> RequestGetter | None:
+        """Locate `scope` and `receive` among the first arguments of the view."""
+        parameters = list(inspect.signature(fn).parameters)
+        if parameters[:1] == ["self"]:
+            return _request_from_method
+
+        return _request_from_app
+
+    async def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        return dict(parse_qsl(await self.get_query_string(call), keep_blank_values=True))
+
+    async def get_query_string(self, call: FunctionCall) -> str:
+        scope, _ = _get_request(call)
+        return scope.get("query_string", b"").decode("latin-1")  # type: ignore[no-any-return]
+
+    async def get_header(self, call: FunctionCall, name: str) -> str | None:
+        scope, _ = _get_request(call)
+        return AsgiHeaders(scope).get(name)
+
+    async def get_headers(self, call: FunctionCall) -> AsgiHeaders:
+        scope, _ = _get_request(call)
+        return AsgiHeaders(scope)
+
+    async def get_path_params(self, call: FunctionCall) -> Any:
+        """Return the path parameters set in the scope by routers such as Starlette's."""
+        scope, _ = _get_request(call)
+        return scope.get("path_params", {})
+
+    async def get_cookies(self, call: FunctionCall) -> CookieLookup:
+        return CookieLookup(await self.get_header(call, "Cookie"))
+
+    async def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:
+        return await _read_body(*_get_request(call))
+
+    async def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        return json.loads(await self.get_request_body_as_bytes(call))  # type: ignore[no-any-return]
+
+    async def get_request_body_stream(self, call: FunctionCall) -> AsyncIterator[bytes]:
+        scope, receive = _get_request(call)
+        if _BODY_SCOPE_KEY in scope:
+            return _iter_chunks([scope[_BODY_SCOPE_KEY]])
+
+        return _receive_chunks(receive)
+
+    def make_json_response(self, content: bytes) -> JsonResponse:
+        return JsonResponse(content)
+
+    def make_json_stream_response(
+        self, items: Iterator[Any] | AsyncIterator[Any]
+    ) -> JsonStreamResponse:
+        return JsonStreamResponse(items)
+
+
+def _get_request(call: FunctionCall) -> tuple[Scope, Receive]:
+    if call.request is not None:
+        return call.request  # type: ignore[no-any-return]
+
+    return call.args[0], call.args[1]
+
+
+async def _iter_chunks(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _receive_chunks(receive: Receive) -> AsyncIterator[bytes]:
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+        yield message.get("body", b"")
+        more_body = message.get("more_body", False)
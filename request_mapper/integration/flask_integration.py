@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import functools
+import inspect
+import json
+
+from request_mapper.streaming import STREAM_CHUNK_SIZE
 from request_mapper.types import (
     IncomingMappedData,
     IntegrationDoesNotExistError,
@@ -12,20 +17,29 @@ except ImportError as e:
     msg = "Flask"
     raise IntegrationDoesNotExistError(msg) from e
 
-from typing import TYPE_CHECKING
+from typing import Any, Callable, Iterator
 
 from request_mapper import RequestValidationError
+from request_mapper.errors import render_errors
 from request_mapper.integration.integration import RequestMapperIntegration
+from request_mapper.response import NDJSON_MEDIA_TYPE, accepts_ndjson, iter_json_chunks
 from request_mapper.types import FunctionCall
 
-if TYPE_CHECKING:
-    from typing_extensions import Literal
+
+@functools.lru_cache(maxsize=None)
+def _declared_parameters(fn: Callable[..., Any]) -> frozenset[str] | None:
+    """Return the names of the parameters of a view, or None if it accepts any keyword."""
+    parameters = inspect.signature(fn).parameters.values()
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
+
+    return frozenset(p.name for p in parameters)
 
 
-def _handle_request_validation_error(
-    err: RequestValidationError
-) -> tuple[flask.Response, Literal[422]]:
-    return flask.jsonify({"location": err.location, "errors": err.source_errors}), 422
+def _handle_request_validation_error(err: RequestValidationError) -> tuple[flask.Response, int]:
+    # Errors are rendered straight to JSON, without going through flask.jsonify.
+    body = b'{"location":%s,"errors":%s}' % (json.dumps(err.location).encode(), render_errors(err))
+    return flask.Response(body, mimetype="application/json"), err.status_code
 
 
 class FlaskIntegration(RequestMapperIntegration):
@@ -36,7 +50,12 @@ class FlaskIntegration(RequestMapperIntegration):
     """
 
     def __init__(
-        self, app: flask.Flask, *, decorate_views: bool = True, register_error_handler: bool = True
+        self,
+        app: flask.Flask,
+        *,
+        decorate_views: bool = True,
+        register_error_handler: bool = True,
+        lazy_decoration: bool = False,
     ) -> None:
         """Initialize a new Flask Integration. Flask must be installed for this to work.
 
@@ -44,10 +63,17 @@ class FlaskIntegration(RequestMapperIntegration):
         @param decorate_views: If true, all views will be decorated with map_request.
         @param register_error_handler: If true, an error handler will be added to convert
         RequestValidationError to 422.
+        @param lazy_decoration: If true, views are decorated when they are first dispatched
+        instead of during set up. This keeps start up fast for apps with many views,
+        and also maps views registered after set up.
         """
         self.add_error_handler = register_error_handler
         self.map_views = decorate_views
+        self.lazy_decoration = lazy_decoration
         self.__app = app
+        # Maps views to their decorated version, and decorated views to themselves.
+        self.__decorated_views: dict[Callable[..., Any], Callable[..., Any]] = {}
+        self.__decorator: RequestMapperDecorator | None = None
 
     def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
         """Register error handler and map views.
@@ -59,15 +85,110 @@ class FlaskIntegration(RequestMapperIntegration):
                 RequestValidationError, _handle_request_validation_error
             )
 
-        if self.map_views:
-            self.__app.view_functions = {
-                name: request_mapper_decorator(fn) for name, fn in self.__app.view_functions.items()
-            }
+        if not self.map_views:
+            return
+
+        if self.lazy_decoration:
+            # Only register the hook once, as setup_mapper may be called again.
+            if self.__decorator is None:
+                self.__app.before_request(self.__decorate_current_view)
+            self.__decorator = request_mapper_decorator
+            return
+
+        self.__app.view_functions = {
+            name: request_mapper_decorator(fn) for name, fn in self.__app.view_functions.items()
+        }
+
+    def warm_up(self) -> None:
+        """Decorate every registered view now when using lazy decoration."""
+        if self.map_views and self.lazy_decoration and self.__decorator is not None:
+            for endpoint in list(self.__app.view_functions):
+                self.__decorate_view(endpoint)
+
+    def __decorate_current_view(self) -> None:
+        """Decorate the view about to handle the current request if it was not seen before."""
+        endpoint = flask.request.endpoint
+        if endpoint is not None:
+            self.__decorate_view(endpoint)
+
+    def __decorate_view(self, endpoint: str) -> None:
+        view_functions = self.__app.view_functions
+        fn = view_functions.get(endpoint)
+        if fn is None:
+            return
+
+        decorated = self.__decorated_views.get(fn)
+        if decorated is None:
+            decorated = self.__decorator(fn)  # type: ignore[misc]
+            self.__decorated_views[fn] = decorated
+            self.__decorated_views[decorated] = decorated
+
+        if decorated is not fn:
+            view_functions[endpoint] = decorated
 
     def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:  # noqa: ARG002
         """Return the current request body using request.json."""
         return flask.request.json  # type:ignore[no-any-return]
 
+    def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:  # noqa: ARG002
+        """Return the raw request body using request.get_data.
+
+        Requests without a JSON content type are handed to request.json,
+        so they fail the same way they would on the dict path.
+        """
+        request = flask.request
+        if not request.is_json:
+            return request.json  # type:ignore[no-any-return]
+
+        return request.get_data()
+
+    def get_request_body_stream(self, call: FunctionCall) -> Iterator[bytes]:  # noqa: ARG002
+        """Return the request body in chunks read from request.stream."""
+        return iter(functools.partial(flask.request.stream.read, STREAM_CHUNK_SIZE), b"")
+
     def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:  # noqa: ARG002
         """Return the query data as a dict using request.args."""
         return flask.request.args
+
+    def make_json_response(self, content: bytes) -> flask.Response:
+        """Wrap serialized JSON in a flask Response."""
+        return flask.Response(content, mimetype="application/json")
+
+    def make_json_stream_response(self, items: Iterator[Any]) -> flask.Response:
+        """Stream items in a flask Response, keeping the request context until they are sent."""
+        ndjson = accepts_ndjson(flask.request.headers.get("Accept"))
+        return flask.Response(
+            flask.stream_with_context(iter_json_chunks(items, ndjson=ndjson)),
+            mimetype=NDJSON_MEDIA_TYPE if ndjson else "application/json",
+        )
+
+    def get_query_string(self, call: FunctionCall) -> str:  # noqa: ARG002
+        """Return the raw query string using request.query_string."""
+        return flask.request.query_string.decode(errors="replace")
+
+    def get_header(self, call: FunctionCall, name: str) -> str | None:  # noqa: ARG002
+        """Return a header using request.headers."""
+        return flask.request.headers.get(name)
+
+    def get_headers(self, call: FunctionCall) -> Any:  # noqa: ARG002
+        """Return request.headers, which reads from the WSGI environ on access."""
+        return flask.request.headers
+
+    def get_cookies(self, call: FunctionCall) -> Any:  # noqa: ARG002
+        """Return request.cookies."""
+        return flask.request.cookies
+
+    def get_path_params(self, call: FunctionCall) -> Any:
+        """Return request.view_args.
+
+        Flask passes route parameters to views as keyword arguments. Those the view does
+        not declare itself are removed from the call, so they can be mapped with FromPath.
+        """
+        view_args = flask.request.view_args or {}
+        declared = _declared_parameters(call.fn)
+        if declared is not None:
+            for key in view_args:
+                if key not in declared:
+                    call.kwargs.pop(key, None)
+
+        return view_args
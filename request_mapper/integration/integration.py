@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Tuple, Union
+
+from request_mapper.offload import DEFAULT_OFFLOAD_THRESHOLD
 
 if TYPE_CHECKING:
-    from request_mapper.types import FunctionCall, IncomingMappedData, RequestMapperDecorator
+    from concurrent.futures import Executor
+
+    from request_mapper.types import (
+        AnyCallable,
+        DataExtractor,
+        FunctionCall,
+        IncomingMappedData,
+        RequestMapperDecorator,
+    )
 
 
 class RequestMapperIntegration(abc.ABC):
@@ -25,9 +35,107 @@ class RequestMapperIntegration(abc.ABC):
         """Return the current request body as a mapping."""
         raise NotImplementedError
 
+    def get_header(self, call: FunctionCall, name: str) -> str | None:
+        """Return the value of a request header, or None if it is missing.
+
+        Optional. Used to check a `BodyPolicy` before the body is read.
+        """
+        raise NotImplementedError
+
+    def get_query_string(self, call: FunctionCall) -> str:
+        """Return the current raw query string, still percent-encoded.
+
+        Optional. When implemented, query models are decoded from it directly,
+        reading only the keys they declare.
+        """
+        raise NotImplementedError
+
+    def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:
+        """Return the current request body as raw bytes.
+
+        Optional. When implemented, JSON bodies are validated straight from the bytes
+        instead of being decoded into a dict first, if the model supports it.
+        """
+        raise NotImplementedError
+
+    def get_headers(self, call: FunctionCall) -> Any:
+        """Return the request headers as an object with a case-insensitive `get` method.
+
+        Optional. Required by `FromHeaders`. Prefer returning the framework's own header
+        mapping over building a new one, as only the declared headers are read from it.
+        """
+        raise NotImplementedError
+
+    def get_path_params(self, call: FunctionCall) -> Any:
+        """Return the parameters of the matched route as an object with a `get` method.
+
+        Optional. Required by `FromPath`.
+        """
+        raise NotImplementedError
+
+    def get_cookies(self, call: FunctionCall) -> Any:
+        """Return the request cookies as an object with a `get` method.
+
+        Optional. Required by `FromCookies`.
+        """
+        raise NotImplementedError
+
+    def get_form_data(self, call: FunctionCall) -> IncomingMappedData:
+        """Return the current form data as a mapping, with files as `UploadedFile`.
+
+        Optional. When not implemented, `FromForm` parses the body stream instead.
+        """
+        raise NotImplementedError
+
+    def get_request_body_stream(self, call: FunctionCall) -> Iterator[bytes]:
+        """Return the current request body as an iterator of byte chunks.
+
+        Optional. Required by `FromBodyStream`.
+        """
+        raise NotImplementedError
+
+    def make_json_response(self, content: bytes) -> Any:
+        """Wrap already serialized JSON in a framework response object.
+
+        Optional. Required by `JsonResponseConverter`.
+        """
+        raise NotImplementedError
+
+    def make_json_stream_response(self, items: Iterator[Any]) -> Any:
+        """Wrap the items of a generator returned by a view in a streaming response.
+
+        Optional. When implemented, views can return generators of models to stream large results.
+        Items should be sent as they are produced, as a JSON array or as newline-delimited JSON
+        depending on the Accept header. `iter_json_chunks` encodes them accordingly.
+        """
+        raise NotImplementedError
+
+    def bind_request_getter(self, fn: AnyCallable) -> RequestGetter | None:
+        """Return a function locating the framework request in the positional arguments of the view.
+
+        Optional. Called once per view when the integration is set up, so that accessors can read
+        the request from `call.request` instead of searching the arguments on every request.
+        Return None if the request cannot be located from the view signature.
+        """
+        raise NotImplementedError
+
+    def warm_up(self) -> None:
+        """Map views whose mapping was deferred to their first request.
+
+        Optional. Called by `warm_up_views` so that the work is done once, before workers fork.
+        """
+        raise NotImplementedError
+
 
 class AsyncRequestMapperIntegration(abc.ABC):
-    """Base class for integrations."""
+    """Base class for integrations.
+
+    Set `validation_executor` to validate raw request data larger than `offload_threshold`
+    bytes in that executor instead of on the event loop.
+    """
+
+    validation_executor: Executor | None = None
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD
 
     @abc.abstractmethod
     def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
@@ -44,5 +152,173 @@ class AsyncRequestMapperIntegration(abc.ABC):
         """Return the current request body as a mapping."""
         raise NotImplementedError
 
+    async def get_header(self, call: FunctionCall, name: str) -> str | None:
+        """Return the value of a request header, or None if it is missing.
+
+        Optional. Used to check a `BodyPolicy` before the body is read.
+        """
+        raise NotImplementedError
+
+    async def get_query_string(self, call: FunctionCall) -> str:
+        """Return the current raw query string, still percent-encoded.
+
+        Optional. When implemented, query models are decoded from it directly,
+        reading only the keys they declare.
+        """
+        raise NotImplementedError
+
+    async def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:
+        """Return the current request body as raw bytes.
+
+        Optional. When implemented, JSON bodies are validated straight from the bytes
+        instead of being decoded into a dict first, if the model supports it.
+        """
+        raise NotImplementedError
+
+    async def get_headers(self, call: FunctionCall) -> Any:
+        """Return the request headers as an object with a case-insensitive `get` method.
+
+        Optional. Required by `FromHeaders`. Prefer returning the framework's own header
+        mapping over building a new one, as only the declared headers are read from it.
+        """
+        raise NotImplementedError
+
+    async def get_path_params(self, call: FunctionCall) -> Any:
+        """Return the parameters of the matched route as an object with a `get` method.
+
+        Optional. Required by `FromPath`.
+        """
+        raise NotImplementedError
+
+    async def get_cookies(self, call: FunctionCall) -> Any:
+        """Return the request cookies as an object with a `get` method.
+
+        Optional. Required by `FromCookies`.
+        """
+        raise NotImplementedError
+
+    async def get_form_data(self, call: FunctionCall) -> IncomingMappedData:
+        """Return the current form data as a mapping, with files as `UploadedFile`.
+
+        Optional. When not implemented, `FromForm` parses the body stream instead.
+        """
+        raise NotImplementedError
+
+    async def get_request_body_stream(self, call: FunctionCall) -> AsyncIterator[bytes]:
+        """Return the current request body as an async iterator of byte chunks.
+
+        Optional. Required by `FromBodyStream`.
+        """
+        raise NotImplementedError
+
+    def make_json_response(self, content: bytes) -> Any:
+        """Wrap already serialized JSON in a framework response object.
+
+        Optional. Required by `JsonResponseConverter`.
+        """
+        raise NotImplementedError
+
+    def make_json_stream_response(self, items: Iterator[Any] | AsyncIterator[Any]) -> Any:
+        """Wrap the items of a (async) generator returned by a view in a streaming response.
+
+        Optional. When implemented, views can return generators of models to stream large results.
+        Items should be sent as they are produced, as a JSON array or as newline-delimited JSON
+        depending on the Accept header. `aiter_json_chunks` encodes them accordingly.
+        """
+        raise NotImplementedError
+
+    def bind_request_getter(self, fn: AnyCallable) -> RequestGetter | None:
+        """Return a function locating the framework request in the positional arguments of the view.
+
+        Optional. Called once per view when the integration is set up, so that accessors can read
+        the request from `call.request` instead of searching the arguments on every request.
+        Return None if the request cannot be located from the view signature.
+        """
+        raise NotImplementedError
+
+    def warm_up(self) -> None:
+        """Map views whose mapping was deferred to their first request.
+
+        Optional. Called by `warm_up_views` so that the work is done once, before workers fork.
+        """
+        raise NotImplementedError
+
 
 RequestMapperIntegrationType = Union[RequestMapperIntegration, AsyncRequestMapperIntegration]
+RequestGetter = Callable[[Tuple[Any, ...]], Any]
+
+
+def _get_optional_method(
+    integration: RequestMapperIntegrationType, name: str
+) -> Callable[..., Any] | None:
+    """Return the bound method if the integration implements this optional method."""
+    implementation = getattr(type(integration), name)
+
+    if implementation in (
+        getattr(RequestMapperIntegration, name),
+        getattr(AsyncRequestMapperIntegration, name),
+    ):
+        return None
+
+    return getattr(integration, name)  # type: ignore[no-any-return]
+
+
+def get_raw_body_extractor(integration: RequestMapperIntegrationType) -> DataExtractor | None:
+    """Return the integration's raw body accessor or None if it does not provide one."""
+    return _get_optional_method(integration, "get_request_body_as_bytes")
+
+
+def get_header_getter(
+    integration: RequestMapperIntegrationType,
+) -> Callable[[FunctionCall, str], Any] | None:
+    """Return the integration's header accessor or None if it does not provide one."""
+    return _get_optional_method(integration, "get_header")
+
+
+def get_raw_query_extractor(integration: RequestMapperIntegrationType) -> DataExtractor | None:
+    """Return the integration's raw query string accessor or None if it does not provide one."""
+    return _get_optional_method(integration, "get_query_string")
+
+
+def get_body_stream_extractor(integration: RequestMapperIntegrationType) -> DataExtractor | None:
+    """Return the integration's body stream accessor or None if it does not provide one."""
+    return _get_optional_method(integration, "get_request_body_stream")
+
+
+def get_json_response_factory(
+    integration: RequestMapperIntegrationType,
+) -> Callable[[bytes], Any] | None:
+    """Return the integration's JSON response factory or None if it does not provide one."""
+    return _get_optional_method(integration, "make_json_response")
+
+
+def get_json_stream_response_factory(
+    integration: RequestMapperIntegrationType,
+) -> Callable[[Any], Any] | None:
+    """Return the integration's streaming response factory or None if it does not provide one."""
+    return _get_optional_method(integration, "make_json_stream_response")
+
+
+def bind_request_getter(
+    integration: RequestMapperIntegrationType, fn: AnyCallable
+) -> RequestGetter | None:
+    """Return the integration's request getter for the view, or None if it does not provide one."""
+    bind = _get_optional_method(integration, "bind_request_getter")
+    return None if bind is None else bind(fn)
+
+
+def get_form_data_extractor(integration: RequestMapperIntegrationType) -> DataExtractor | None:
+    """Return the integration's form data accessor or None if it does not provide one."""
+    return _get_optional_method(integration, "get_form_data")
+
+
+def get_warm_up_hook(integration: RequestMapperIntegrationType) -> Callable[[], None] | None:
+    """Return the integration's warm up hook or None if it does not provide one."""
+    return _get_optional_method(integration, "warm_up")
+
+
+def get_optional_accessor(
+    integration: RequestMapperIntegrationType, name: str
+) -> DataExtractor | None:
+    """Return the integration's accessor of that name or None if it does not provide it."""
+    return _get_optional_method(integration, name)
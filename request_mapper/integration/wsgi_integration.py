@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import contextvars
+import inspect
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, MutableMapping
+from urllib.parse import parse_qsl
+
+from request_mapper import RequestMapperIntegration, RequestValidationError
+from request_mapper.errors import render_errors
+from request_mapper.lookup import CookieLookup
+from request_mapper.response import NDJSON_MEDIA_TYPE, accepts_ndjson, iter_json_chunks
+from request_mapper.streaming import STREAM_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from request_mapper.integration.integration import RequestGetter
+    from request_mapper.types import (
+        AnyCallable,
+        FunctionCall,
+        IncomingMappedData,
+        RequestMapperDecorator,
+    )
+
+Environ = MutableMapping[str, Any]
+StartResponse = Callable[..., Any]
+WsgiApp = Callable[[Environ, StartResponse], Iterable[bytes]]
+
+# The body is kept in the environ so that every accessor sees it after the input is read.
+_BODY_ENVIRON_KEY = "request_mapper.body"
+_current_environ: contextvars.ContextVar[Environ] = contextvars.ContextVar("request_mapper_environ")
+
+
+class JsonResponse:
+    """Minimal WSGI response sending already serialized JSON."""
+
+    __slots__ = ("body", "status")
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        self.body = body
+        self.status = status
+
+    def __call__(self, environ: Environ, start_response: StartResponse) -> Iterable[bytes]:  # noqa: ARG002
+        """Send the response as a WSGI app."""
+        start_response(
+            f"{self.status} {HTTPStatus(self.status).phrase}",
+            [("Content-Type", "application/json"), ("Content-Length", str(len(self.body)))],
+        )
+        return [self.body]
+
+
+class JsonStreamResponse:
+    """WSGI response sending the items of a generator as they are produced.
+
+    Items are sent as a JSON array, or as newline-delimited JSON if the client accepts it.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterator[Any]) -> None:
+        self.items = items
+
+    def __call__(self, environ: Environ, start_response: StartResponse) -> Iterable[bytes]:
+        """Send the response as a WSGI app."""
+        ndjson = accepts_ndjson(environ.get("HTTP_ACCEPT"))
+        start_response(
+            "200 OK", [("Content-Type", NDJSON_MEDIA_TYPE if ndjson else "application/json")]
+        )
+        return iter_json_chunks(self.items, ndjson=ndjson)
+
+
+class WsgiMiddleware:
+    """Wrap a WSGI app using mapped views.
+
+    Makes the environ of the current request available to `WsgiIntegration`, so views
+    of any WSGI framework can be mapped, e.g. `app.wsgi_app = WsgiMiddleware(app.wsgi_app)`
+    for Flask. Responds with the status of the error and its details as JSON when request
+    validation fails, and sends dicts, lists and `JsonResponse` objects returned by the app.
+    Frameworks handling exceptions themselves need their own handler for validation errors.
+    """
+
+    def __init__(self, app: WsgiApp) -> None:
+        self.app = app
+
+    def __call__(self, environ: Environ, start_response: StartResponse) -> Iterable[bytes]:
+        """Run the wrapped app."""
+        token = _current_environ.set(environ)
+        try:
+            res: Any = self.app(environ, start_response)
+        except RequestValidationError as e:
+            res = JsonResponse(render_errors(e), status=e.status_code)
+        finally:
+            _current_environ.reset(token)
+
+        if isinstance(res, (dict, list)):
+            res = JsonResponse(json.dumps(res).encode())
+
+        if isinstance(res, (JsonResponse, JsonStreamResponse)):
+            return res(environ, start_response)
+
+        return res  # type: ignore[no-any-return]
+
+
+class EnvironHeaders:
+    """Case-insensitive view over the headers of a WSGI environ."""
+
+    __slots__ = ("environ",)
+
+    def __init__(self, environ: Environ) -> None:
+        self.environ = environ
+
+    def get(self, name: str) -> str | None:
+        key = name.upper().replace("-", "_")
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+
+        return self.environ.get(key)
+
+
+def _get_environ(call: FunctionCall) -> Environ:
+    if call.request is not None:
+        return call.request  # type: ignore[no-any-return]
+
+    try:
+        return _current_environ.get()
+    except LookupError:
+        msg = "No WSGI environ for the current call. Wrap the app in WsgiMiddleware."
+        raise ValueError(msg) from None
+
+
+def _get_content_length(environ: Environ) -> int:
+    content_length = environ.get("CONTENT_LENGTH", "")
+    return int(content_length) if content_length.isdigit() else 0
+
+
+def _environ_from_app(args: tuple[Any, ...]) -> Environ:
+    return args[0]  # type: ignore[no-any-return]
+
+
+def _environ_from_method(args: tuple[Any, ...]) -> Environ:
+    return args[1]  # type: ignore[no-any-return]
+
+
+class WsgiIntegration(RequestMapperIntegration):
+    """Integration reading the WSGI environ directly, without a framework request object.
+
+    The query string is decoded from `QUERY_STRING` and the body is read from `wsgi.input`
+    up to `CONTENT_LENGTH`, then validated straight from the bytes.
+    Views taking `environ` as their first argument, or after `self`, read it from there.
+    Other views, e.g. Flask views, need the app to be wrapped in `WsgiMiddleware`.
+    """
+
+    def set_up(self, request_mapper_decorator: RequestMapperDecorator) -> None:
+        pass
+
+    def bind_request_getter(self, fn: AnyCallable) -> RequestGetter | None:
+        """Locate `environ` among the first arguments of the view."""
+        parameters = list(inspect.signature(fn).parameters)
+        if parameters[:1] == ["environ"]:
+            return _environ_from_app
+
+        if parameters[:2] == ["self", "environ"]:
+            return _environ_from_method
+
+        return None
+
+    def get_query_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        return dict(parse_qsl(self.get_query_string(call), keep_blank_values=True))
+
+    def get_query_string(self, call: FunctionCall) -> str:
+        return _get_environ(call).get("QUERY_STRING", "")  # type: ignore[no-any-return]
+
+    def get_header(self, call: FunctionCall, name: str) -> str | None:
+        return EnvironHeaders(_get_environ(call)).get(name)
+
+    def get_headers(self, call: FunctionCall) -> EnvironHeaders:
+        return EnvironHeaders(_get_environ(call))
+
+    def get_path_params(self, call: FunctionCall) -> Any:
+        """Return the keyword arguments set by routers following the wsgiorg.routing_args spec."""
+        return _get_environ(call).get("wsgiorg.routing_args", ((), {}))[1]
+
+    def get_cookies(self, call: FunctionCall) -> CookieLookup:
+        return CookieLookup(_get_environ(call).get("HTTP_COOKIE"))
+
+    def get_request_body_as_bytes(self, call: FunctionCall) -> bytes:
+        environ = _get_environ(call)
+        body: bytes | None = environ.get(_BODY_ENVIRON_KEY)
+        if body is None:
+            content_length = _get_content_length(environ)
+            body = environ["wsgi.input"].read(content_length) if content_length else b""
+            environ[_BODY_ENVIRON_KEY] = body
+
+        return body
+
+    def get_request_body_as_dict(self, call: FunctionCall) -> IncomingMappedData:
+        return json.loads(self.get_request_body_as_bytes(call))  # type: ignore[no-any-return]
+
+    def get_request_body_stream(self, call: FunctionCall) -> Iterator[bytes]:
+        environ = _get_environ(call)
+        if _BODY_ENVIRON_KEY in environ:
+            return iter([environ[_BODY_ENVIRON_KEY]])
+
+        return _read_chunks(environ["wsgi.input"], _get_content_length(environ))
+
+    def make_json_response(self, content: bytes) -> JsonResponse:
+        return JsonResponse(content)
+
+    def make_json_stream_response(self, items: Iterator[Any]) -> JsonStreamResponse:
+        return JsonStreamResponse(items)
+
+
+def _read_chunks(stream: Any, remaining: int) -> Iterator[bytes]:
+    while remaining > 0:
+        chunk = stream.read(min(remaining, STREAM_CHUNK_SIZE))
+        if not chunk:
+            return
+
+        remaining -= len(chunk)
+        yield chunk
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from request_mapper.types import DataExtractor, FunctionCall
+    from request_mapper.validation import Validator
+
+_T = TypeVar("_T")
+_UNRESOLVED = object()
+
+
+class LazyModel(Generic[_T]):
+    """Proxy for a request model which is only fetched and validated when first used.
+
+    Call `get()` or access any attribute of the model to resolve it. Errors are raised
+    at that point as `RequestValidationError`, so the usual error handlers still apply.
+    Resolves to None when the integration has no data for the parameter.
+    """
+
+    __slots__ = ("_fetch", "_validate", "_value")
+
+    # Proxies are unique per request, so caches must not key on them.
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, fetch: Callable[[], Any], validate: Validator) -> None:
+        self._fetch = fetch
+        self._validate = validate
+        self._value: Any = _UNRESOLVED
+
+    @property
+    def resolved(self) -> bool:
+        return self._value is not _UNRESOLVED
+
+    def get(self) -> _T:
+        """Return the validated model, fetching and validating it on the first call."""
+        if self._value is _UNRESOLVED:
+            data = self._fetch()
+            self._value = None if data is None else self._validate(data)
+
+        return self._value  # type: ignore[no-any-return]
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve the model and return its attribute."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        """Show the model without resolving it."""
+        if self._value is _UNRESOLVED:
+            return f"{type(self).__name__}(<unresolved>)"
+
+        return f"{type(self).__name__}({self._value!r})"
+
+
+class AsyncLazyModel(LazyModel[_T]):
+    """Proxy for a request model of an async view, resolved by awaiting `get()`.
+
+    Attributes of the model are available on the proxy once it has been resolved.
+    """
+
+    __slots__ = ()
+
+    async def get(self) -> _T:  # type: ignore[override]
+        """Return the validated model, fetching and validating it on the first call."""
+        if self._value is _UNRESOLVED:
+            data = await self._fetch()
+            self._value = None if data is None else self._validate(data)
+
+        return self._value  # type: ignore[no-any-return]
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the model, which must have been resolved already."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if self._value is _UNRESOLVED:
+            msg = f"Await get() before accessing {name!r} on a lazily mapped model"
+            raise RuntimeError(msg)
+
+        return getattr(self._value, name)
+
+
+def defer_extractor(extract: DataExtractor, *, is_async: bool) -> DataExtractor:
+    """Wrap an extractor to return a function fetching the data instead of the data itself."""
+    if is_async:
+
+        async def defer_async(call: FunctionCall) -> Callable[[], Any]:
+            return functools.partial(extract, call)
+
+        return defer_async
+
+    def defer(call: FunctionCall) -> Callable[[], Any]:
+        return functools.partial(extract, call)
+
+    return defer
+
+
+def compile_lazy_validator(validate: Validator, *, is_async: bool) -> Validator:
+    """Return a validator wrapping fetch functions from a deferred extractor in a proxy."""
+    proxy = AsyncLazyModel if is_async else LazyModel
+
+    def make_proxy(fetch: Callable[[], Any]) -> LazyModel[Any]:
+        return proxy(fetch, validate)
+
+    return make_proxy
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from request_mapper.query import _field_specs
+from request_mapper.validation import compile_validator
+
+if TYPE_CHECKING:
+    from request_mapper.types import AnnotatedParameter, LookupMapping
+    from request_mapper.validation import Validator
+
+
+def _get_all_values(source: Any) -> Callable[[str], list[Any]] | None:
+    """Return a function listing every value of a key in a multi-value mapping, if it is one."""
+    getall = getattr(source, "getall", None)
+    if getall is not None:
+        # multidict's getall raises a KeyError for missing keys unless given a default.
+        return lambda name: getall(name, [])
+
+    return getattr(source, "getlist", None)
+
+
+def _get_aliases(cls: Any) -> set[str]:
+    """Return the keys of the model which are aliases rather than field names."""
+    if hasattr(cls, "model_fields"):
+        aliases: set[str] = set()
+        for field in cls.model_fields.values():
+            alias = field.validation_alias or field.alias
+            choices = getattr(alias, "choices", [alias])
+            aliases.update(choice for choice in choices if isinstance(choice, str))
+
+        return aliases
+
+    # Pydantic v1
+    fields = getattr(cls, "__fields__", {})
+    return {field.alias for field in fields.values() if field.has_alias}
+
+
+def compile_lookup_validator(val: AnnotatedParameter) -> Validator:
+    """Return a validator reading only the keys the model declares from a lookup source.
+
+    The table of keys, their names in the source and whether they hold a list of values
+    is built once per parameter. Aliases are looked up as they are.
+    """
+    mapping: type[LookupMapping] = val.annotation  # type: ignore[assignment]
+    specs, _ = _field_specs(val.cls)
+    aliases = _get_aliases(val.cls)
+    table = tuple(
+        (key, key if key in aliases else mapping.lookup_name(key), is_list)
+        for key, is_list in specs.items()
+    )
+    validate = compile_validator(val)
+
+    def validate_source(source: Any) -> Any:
+        get = source.get
+        get_all = _get_all_values(source)
+        data = {}
+
+        for key, name, is_list in table:
+            if is_list and get_all is not None:
+                values = get_all(name)
+                if values:
+                    data[key] = values
+                continue
+
+            value = get(name)
+            if value is not None:
+                data[key] = value
+
+        return validate(data)
+
+    return validate_source
+
+
+class CookieLookup:
+    """Look up cookies in a Cookie header one name at a time, without parsing every cookie."""
+
+    __slots__ = ("header",)
+
+    def __init__(self, header: str | None) -> None:
+        self.header = header or ""
+
+    def get(self, name: str) -> str | None:
+        prefix = f"{name}="
+        for pair in self.header.split(";"):
+            pair = pair.strip()  # noqa: PLW2901
+            if pair.startswith(prefix):
+                value = pair[len(prefix) :]
+                if len(value) > 1 and value[0] == value[-1] == '"':
+                    value = value[1:-1]
+                return value
+
+        return None
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import threading
+import tracemalloc
+from typing import Any
+
+from request_mapper.instrumentation import OVERFLOW_BOUND, InstrumentationSink, PhaseTiming
+
+# Payload size bucket bounds in bytes, from 1 KiB to 16 MiB.
+DEFAULT_PAYLOAD_BUCKETS = tuple(1024 * 4**i for i in range(8))
+
+_lock = threading.Lock()
+_sessions = 0
+_started = False
+
+
+def start_tracing() -> None:
+    """Start tracing allocations unless already done, by an earlier request or by the app."""
+    global _sessions, _started  # noqa: PLW0603
+    with _lock:
+        if _sessions == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started = True
+        _sessions += 1
+
+
+def stop_tracing() -> None:
+    """Stop tracing allocations once the last request started by `start_tracing` is done."""
+    global _sessions, _started  # noqa: PLW0603
+    with _lock:
+        _sessions -= 1
+        if _sessions == 0 and _started:
+            tracemalloc.stop()
+            _started = False
+
+
+def memory_mark() -> int:
+    """Return the memory currently traced, after resetting the traced peak where supported."""
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+
+    return tracemalloc.get_traced_memory()[0]
+
+
+def memory_usage(mark: int) -> tuple[int, int]:
+    """Return the peak and retained memory allocated since `memory_mark` returned `mark`."""
+    current, peak = tracemalloc.get_traced_memory()
+    return max(peak - mark, 0), current - mark
+
+
+class _MemoryStats:
+    __slots__ = ("count", "peak_total", "peak_max", "retained_total", "retained_max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.peak_total = 0
+        self.peak_max = 0
+        self.retained_total = 0
+        self.retained_max = 0
+
+
+class MemoryProfiler(InstrumentationSink):
+    """Sink recording the memory allocated while mapping requests, per view, phase and location.
+
+    Allocations are traced with `tracemalloc` during sampled requests only, one in `sample_rate`,
+    so that it can run in staging under load. Other requests are not instrumented at all.
+    For each phase it records the peak allocated memory and the memory still retained at its
+    end, grouped by payload size.
+    Tracing is process-wide: measurements include allocations made at the same time by other
+    threads or tasks, which averages out over many samples.
+    On Python 3.8 the peak of a phase also includes earlier phases of the same request.
+
+    :param sample_rate: Measure one in this many requests.
+    :param payload_buckets: Upper bounds of the payload size groups in bytes.
+    """
+
+    def __init__(
+        self, sample_rate: int = 1, payload_buckets: tuple[int, ...] = DEFAULT_PAYLOAD_BUCKETS
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.payload_buckets = payload_buckets
+        self._requests = itertools.count()
+        self._stats: dict[tuple[str, str, str | None, int | None], _MemoryStats] = {}
+        self._lock = threading.Lock()
+
+    def should_instrument(self, view: str) -> bool:  # noqa: ARG002
+        return next(self._requests) % self.sample_rate == 0
+
+    def measure_memory(self, view: str) -> bool:  # noqa: ARG002
+        return True
+
+    def record_phase(self, timing: PhaseTiming) -> None:
+        peak, retained = timing.peak_memory, timing.retained_memory
+        if peak is None or retained is None:
+            return
+
+        size = timing.payload_size
+        bucket = None if size is None else bisect.bisect_left(self.payload_buckets, size)
+        key = (timing.view, timing.phase, timing.location, bucket)
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _MemoryStats()
+
+            stats.count += 1
+            stats.peak_total += peak
+            stats.peak_max = max(stats.peak_max, peak)
+            stats.retained_total += retained
+            stats.retained_max = max(stats.retained_max, retained)
+
+    def record_validation_failure(self, view: str, location: str) -> None:
+        pass
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary of the memory allocated per view and phase.
+
+        Sizes are in bytes. `payload_size_le` is the upper bound of the payload size group,
+        None for phases without raw payload and `"+Inf"` for payloads beyond the last bound.
+        """
+        bounds: list[Any] = [*self.payload_buckets, OVERFLOW_BOUND]
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: repr(item[0]))
+
+        return {
+            "phases": [
+                {
+                    "view": view,
+                    "phase": phase,
+                    "location": location,
+                    "payload_size_le": None if bucket is None else bounds[bucket],
+                    "count": stats.count,
+                    "peak_mean": stats.peak_total / stats.count,
+                    "peak_max": stats.peak_max,
+                    "retained_mean": stats.retained_total / stats.count,
+                    "retained_max": stats.retained_max,
+                }
+                for (view, phase, location, bucket), stats in items
+            ]
+        }
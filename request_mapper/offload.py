@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Sequence
+
+from request_mapper.instrumentation import get_payload_size
+
+if TYPE_CHECKING:
+    from request_mapper.types import AnnotatedParameter, BoundParameter
+    from request_mapper.validation import Validator
+
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_remote_validator(param: AnnotatedParameter) -> Validator:
+    # Imported here as the package imports this module.
+    from request_mapper import _compile_validators
+
+    validator, raw_validator = _compile_validators(param, is_async=True)
+    return raw_validator or validator
+
+
+class RemoteValidator:
+    """Picklable stand-in for a raw data validator, compiled again in the worker process.
+
+    The model class must be importable by the worker, so models defined inside functions
+    cannot be validated in a process pool.
+    """
+
+    __slots__ = ("param",)
+
+    def __init__(self, param: AnnotatedParameter) -> None:
+        self.param = param
+
+    def __call__(self, data: Any) -> Any:
+        return _compile_remote_validator(self.param)(data)
+
+
+def _validate_all(validators: Sequence[Validator], data: Any) -> list[Any]:
+    return [validate(data) for validate in validators]
+
+
+class ValidationOffload:
+    """Moves decoding and validation of large raw payloads off the event loop.
+
+    Only raw request data, such as body bytes, is offloaded since its size is known
+    before it is decoded. Validation errors are raised in the view as usual.
+    """
+
+    __slots__ = ("executor", "threshold", "_remote_validators")
+
+    def __init__(
+        self,
+        executor: Executor,
+        threshold: int,
+        mapped_params: dict[str, AnnotatedParameter],
+    ) -> None:
+        self.executor = executor
+        self.threshold = threshold
+        self._remote_validators: dict[str, Validator] | None = None
+
+        # Validators are closures which cannot be sent to other processes.
+        if isinstance(executor, ProcessPoolExecutor):
+            self._remote_validators = {
+                name: RemoteValidator(param) for name, param in mapped_params.items()
+            }
+
+    def applies(self, data: Any) -> bool:
+        """Return whether the data is large enough to be validated in the executor."""
+        size = get_payload_size(data)
+        return size is not None and size > self.threshold
+
+    async def validate(
+        self, parameters: Sequence[BoundParameter], data: Any, kwargs: dict[str, Any]
+    ) -> None:
+        """Validate the data for every parameter in the executor and store the results."""
+        if self._remote_validators is None:
+            validators = [validate for _, validate in parameters]
+        else:
+            validators = [self._remote_validators[name] for name, _ in parameters]
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self.executor, _validate_all, validators, data)
+        for (name, _), result in zip(parameters, results):
+            kwargs[name] = result
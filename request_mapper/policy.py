@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from request_mapper.types import RequestPolicyViolationError
+
+if TYPE_CHECKING:
+    from request_mapper.types import AnnotatedParameter, DataExtractor, FunctionCall
+
+    HeaderGetter = Callable[[FunctionCall, str], Any]
+
+_NON_STRUCTURAL = bytes(set(range(256)) - set(b'[]{}"'))
+_SQUARE_BRACKETS = bytes.maketrans(b"{}", b"[]")
+
+
+@dataclass(frozen=True)
+class BodyPolicy:
+    """Limits checked cheaply before a request body is parsed.
+
+    Declare it next to the mapping, e.g. `Annotated[FromBody[Model], BodyPolicy(max_size=1024)]`,
+    or for every parameter using a model with a `__body_policy__` class attribute.
+    Violations raise `RequestPolicyViolationError`.
+
+    :param max_size: Maximum body size in bytes.
+    Checked against Content-Length before the body is read, then against the actual body.
+    :param content_types: Accepted media types, compared without parameters such as charset.
+    :param max_depth: Maximum nesting depth of JSON arrays and objects.
+    """
+
+    max_size: int | None = None
+    content_types: tuple[str, ...] | None = None
+    max_depth: int | None = None
+
+    def __post_init__(self) -> None:
+        """Accept any iterable of content types while keeping the policy hashable."""
+        if self.content_types is not None:
+            object.__setattr__(self, "content_types", tuple(self.content_types))
+
+
+def get_body_policy(val: AnnotatedParameter) -> BodyPolicy | None:
+    """Return the policy declared on the parameter, or failing that on its model."""
+    for metadata in val.metadata:
+        if isinstance(metadata, BodyPolicy):
+            return metadata
+
+    policy = getattr(val.cls, "__body_policy__", None)
+    return policy if isinstance(policy, BodyPolicy) else None
+
+
+def json_depth_exceeds(data: bytes | bytearray, max_depth: int) -> bool:
+    """Return whether arrays and objects in the raw JSON document nest deeper than max_depth.
+
+    Strings and scalars are stripped and nesting is measured on the remaining brackets,
+    using only bytes methods, so that the check stays cheap next to parsing.
+    Malformed documents are left to the parser to reject.
+    """
+    if data.count(b"[") + data.count(b"{") <= max_depth:
+        return False
+
+    # Drop escaped backslashes and quotes, so that the remaining quotes delimit strings.
+    unescaped = data.replace(b"\\\\", b"").replace(b'\\"', b"")
+    structure = unescaped.translate(None, _NON_STRUCTURAL)
+    # Every other part between quotes is outside of strings.
+    brackets = b"".join(structure.split(b'"')[::2]).translate(_SQUARE_BRACKETS)
+    # Each pass removes the innermost level of every array and object.
+    for _ in range(max_depth):
+        reduced = brackets.replace(b"[]", b"")
+        if len(reduced) == len(brackets):
+            return False
+        brackets = reduced
+
+    return b"[]" in brackets
+
+
+def _object_depth_exceeds(data: Any, max_depth: int) -> bool:
+    if not isinstance(data, (dict, list)):
+        return False
+
+    if max_depth == 0:
+        return True
+
+    children = data.values() if isinstance(data, dict) else data
+    return any(_object_depth_exceeds(child, max_depth - 1) for child in children)
+
+
+class _PolicyChecker:
+    def __init__(self, policy: BodyPolicy, location: str) -> None:
+        self.policy = policy
+        self.location = location
+        self.content_types = (
+            frozenset(t.lower() for t in policy.content_types) if policy.content_types else None
+        )
+
+    def check_headers(self, content_type: str | None, content_length: str | None) -> None:
+        if self.content_types is not None:
+            media_type = (content_type or "").split(";", 1)[0].strip().lower()
+            if media_type not in self.content_types:
+                self._reject(
+                    "unsupported_content_type",
+                    f"Content type {media_type or 'none'!r} is not accepted",
+                    415,
+                )
+
+        if self.policy.max_size is not None and content_length and content_length.isdigit():
+            self.check_size(int(content_length))
+
+    def check_size(self, size: int) -> None:
+        if self.policy.max_size is not None and size > self.policy.max_size:
+            self._reject(
+                "body_too_large",
+                f"Request body exceeds the maximum size of {self.policy.max_size} bytes",
+                413,
+            )
+
+    def check_data(self, data: Any) -> None:
+        max_depth = self.policy.max_depth
+
+        if isinstance(data, (bytes, bytearray)):
+            self.check_size(len(data))
+            exceeded = max_depth is not None and json_depth_exceeds(data, max_depth)
+        else:
+            exceeded = max_depth is not None and _object_depth_exceeds(data, max_depth)
+
+        if exceeded:
+            self._reject(
+                "body_too_deep",
+                f"Request body nests deeper than the maximum depth of {max_depth}",
+                422,
+            )
+
+    def _reject(self, error_type: str, message: str, status_code: int) -> None:
+        raise RequestPolicyViolationError(self.location, error_type, message, status_code)
+
+
+def enforce_policy(
+    extract: DataExtractor,
+    get_header: HeaderGetter | None,
+    policy: BodyPolicy,
+    location: str,
+) -> DataExtractor:
+    """Wrap a synchronous extractor so that the policy is checked around it."""
+    checker = _PolicyChecker(policy, location)
+
+    def enforcing_extract(call: FunctionCall) -> Any:
+        if get_header is not None:
+            checker.check_headers(
+                get_header(call, "Content-Type"), get_header(call, "Content-Length")
+            )
+
+        data = extract(call)
+        checker.check_data(data)
+
+        return data
+
+    return enforcing_extract
+
+
+def enforce_policy_async(
+    extract: Callable[[FunctionCall], Awaitable[Any]],
+    get_header: Callable[[FunctionCall, str], Awaitable[Any]] | None,
+    policy: BodyPolicy,
+    location: str,
+) -> DataExtractor:
+    """Wrap an asynchronous extractor so that the policy is checked around it."""
+    checker = _PolicyChecker(policy, location)
+
+    async def enforcing_extract(call: FunctionCall) -> Any:
+        if get_header is not None:
+            checker.check_headers(
+                await get_header(call, "Content-Type"), await get_header(call, "Content-Length")
+            )
+
+        data = await extract(call)
+        checker.check_data(data)
+
+        return data
+
+    return enforcing_extract
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import collections.abc
+import sys
+from typing import TYPE_CHECKING, Any, Mapping, Union
+from urllib.parse import unquote_plus
+
+from typing_extensions import get_args, get_origin
+
+from request_mapper.validation import compile_validator
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from request_mapper.types import AnnotatedParameter
+    from request_mapper.validation import Validator
+
+_SEQUENCE_TYPES = (
+    list,
+    set,
+    frozenset,
+    tuple,
+    collections.abc.Sequence,
+    collections.abc.Set,
+    collections.abc.Iterable,
+)
+
+_UNION_TYPES: tuple[Any, ...] = (Union,)
+if sys.version_info >= (3, 10):
+    import types
+
+    # `X | Y` unions, whose origin is not `typing.Union`.
+    _UNION_TYPES += (types.UnionType,)
+
+
+def _is_sequence(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+
+    if origin in _UNION_TYPES:
+        return any(_is_sequence(arg) for arg in get_args(annotation))
+
+    return origin in _SEQUENCE_TYPES or annotation in _SEQUENCE_TYPES
+
+
+def _field_specs(cls: type[BaseModel]) -> tuple[dict[str, bool], bool]:
+    """Return the query keys the model reads, mapped to whether they hold a list of values.
+
+    The second element tells whether other keys can be skipped, which is not the case
+    for models which do not ignore extra keys or for anything that is not a pydantic model.
+    """
+    specs: dict[str, bool] = {}
+
+    if hasattr(cls, "model_fields"):
+        ignores_extra = cls.model_config.get("extra", "ignore") == "ignore"
+
+        for name, field in cls.model_fields.items():
+            alias = field.validation_alias or field.alias
+            choices = getattr(alias, "choices", [alias or name])
+            if not all(isinstance(choice, str) for choice in choices):
+                ignores_extra = False
+                choices = [choice for choice in choices if isinstance(choice, str)]
+
+            keys = {*choices, name} if cls.model_config.get("populate_by_name") else set(choices)
+            specs.update(dict.fromkeys(keys, _is_sequence(field.annotation)))
+
+        return specs, ignores_extra
+
+    # Pydantic v1
+    v1_cls: Any = cls
+    config = getattr(v1_cls, "__config__", None)
+    if config is None:
+        return specs, False
+
+    for name, field in v1_cls.__fields__.items():
+        keys = {field.alias, name} if config.allow_population_by_field_name else {field.alias}
+        specs.update(dict.fromkeys(keys, _is_sequence(field.outer_type_)))
+
+    return specs, getattr(config.extra, "value", config.extra) == "ignore"
+
+
+class QueryDecoder:
+    """Decode query data into the keyword arguments of a given model.
+
+    Built once per model: keys the model does not read are skipped, fields declared as
+    sequences collect every value of a repeated key and other fields take the first one.
+    """
+
+    def __init__(self, cls: type[BaseModel]) -> None:
+        specs, only_declared = _field_specs(cls)
+        self.list_keys = frozenset(key for key, is_list in specs.items() if is_list)
+        self.keys = frozenset(specs) if only_declared else None
+
+    def decode_string(self, query: str) -> dict[str, Any]:
+        """Decode a raw, still percent-encoded, query string."""
+        keys = self.keys
+        list_keys = self.list_keys
+        result: dict[str, Any] = {}
+
+        for pair in query.split("&"):
+            if not pair:
+                continue
+
+            key, _, value = pair.partition("=")
+            if "%" in key or "+" in key:
+                key = unquote_plus(key)
+
+            if keys is not None and key not in keys:
+                continue
+
+            if "%" in value or "+" in value:
+                value = unquote_plus(value)
+
+            if key in list_keys:
+                result.setdefault(key, []).append(value)
+            elif key not in result:
+                result[key] = value
+
+        return result
+
+    def decode_mapping(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """Decode a mapping such as a framework multi-value dict."""
+        list_keys = self.list_keys
+        get_all = getattr(data, "getlist", None) or getattr(data, "getall", None)
+        result: dict[str, Any] = {}
+
+        for key in data.keys() if self.keys is None else self.keys:
+            if key not in data:
+                continue
+
+            if get_all and key in list_keys:
+                result[key] = get_all(key)
+            else:
+                result[key] = data[key]
+
+        return result
+
+
+def compile_query_validators(val: AnnotatedParameter) -> tuple[Validator, Validator]:
+    """Return validators for query data as a mapping and as a raw query string."""
+    decoder = QueryDecoder(val.cls)
+    decode_mapping = decoder.decode_mapping
+    decode_string = decoder.decode_string
+    validate = compile_validator(val)
+
+    def validate_mapping(data: Mapping[str, Any]) -> Any:
+        return validate(decode_mapping(data))
+
+    def validate_string(query: str) -> Any:
+        return validate(decode_string(query))
+
+    return validate_mapping, validate_string
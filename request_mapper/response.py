@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import collections.abc
+import json
+from types import AsyncGeneratorType, GeneratorType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, cast
+
+from pydantic import BaseModel
+from typing_extensions import get_args, get_origin
+
+from request_mapper.engines import PydanticModelEngine, get_engine
+from request_mapper.integration.integration import get_json_response_factory
+from request_mapper.streaming import STREAM_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from request_mapper.integration.integration import RequestMapperIntegrationType
+    from request_mapper.types import ResponseConverter
+
+_models = PydanticModelEngine()
+
+# Serializers for pydantic models, picked once for the installed pydantic version.
+# `dump_model` converts a model to a dict, `dump_model_json` straight to JSON bytes.
+dump_model: Callable[[BaseModel], Any] = _models.compile_serializer(BaseModel)
+dump_model_json = cast(Callable[[BaseModel], bytes], _models.compile_json_serializer(BaseModel))
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+# Generators returned by views annotated with these are streamed. Other iterables such as
+# lists are not generators and are still converted as usual.
+_STREAM_TYPES = (
+    collections.abc.Iterable,
+    collections.abc.AsyncIterable,
+    collections.abc.Iterator,
+    collections.abc.AsyncIterator,
+    collections.abc.Generator,
+    collections.abc.AsyncGenerator,
+)
+
+
+def is_model_stream(annotation: Any) -> bool:
+    """Return whether a return annotation declares a stream of models, e.g. `Iterable[Model]`."""
+    args = get_args(annotation)
+    return (
+        get_origin(annotation) in _STREAM_TYPES
+        and bool(args)
+        and isinstance(args[0], type)
+        and issubclass(args[0], BaseModel)
+    )
+
+
+def compile_value_serializers(
+    annotation: Any,
+) -> tuple[Callable[[Any], Any], Callable[[Any], bytes] | None] | None:
+    """Return the engine serializers of a return annotation to Python data and to JSON bytes.
+
+    Returns None when the response converter takes care of the values instead, that is for
+    views without annotation or returning models or streams, and for types the engine cannot
+    serialize, such as unions including framework responses.
+    """
+    if annotation is None or get_origin(annotation) in _STREAM_TYPES:
+        return None
+
+    try:
+        engine = get_engine(annotation)
+        if isinstance(engine, PydanticModelEngine):
+            return None
+
+        return engine.compile_serializer(annotation), engine.compile_json_serializer(annotation)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    """Return whether the Accept header asks for newline-delimited JSON."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def _encode_item(item: Any) -> bytes:
+    if isinstance(item, BaseModel):
+        return dump_model_json(item)
+
+    return json.dumps(item).encode()
+
+
+class _JsonChunkWriter:
+    """Collect encoded items into chunks of about `STREAM_CHUNK_SIZE` bytes.
+
+    The first item is sent on its own so that clients start receiving data right away.
+    """
+
+    def __init__(self, *, ndjson: bool) -> None:
+        self.ndjson = ndjson
+        self.separator = b"\n" if ndjson else b","
+        self.parts: list[bytes] = [] if ndjson else [b"["]
+        self.size = 0
+        self.count = 0
+
+    def add(self, item: Any) -> bytes | None:
+        data = _encode_item(item)
+        parts = self.parts
+        if self.ndjson:
+            parts.append(data)
+            parts.append(self.separator)
+        else:
+            if self.count:
+                parts.append(self.separator)
+            parts.append(data)
+
+        self.count += 1
+        self.size += len(data) + 1
+        if self.count == 1 or self.size >= STREAM_CHUNK_SIZE:
+            return self.flush()
+
+        return None
+
+    def flush(self) -> bytes:
+        chunk = b"".join(self.parts)
+        self.parts.clear()
+        self.size = 0
+        return chunk
+
+    def close(self) -> bytes:
+        if not self.ndjson:
+            self.parts.append(b"]")
+
+        return self.flush()
+
+
+def iter_json_chunks(items: Iterator[Any], *, ndjson: bool) -> Iterator[bytes]:
+    """Encode items as they are produced, into a JSON array or newline-delimited JSON."""
+    writer = _JsonChunkWriter(ndjson=ndjson)
+    for item in items:
+        chunk = writer.add(item)
+        if chunk is not None:
+            yield chunk
+
+    yield writer.close()
+
+
+async def aiter_json_chunks(
+    items: Iterator[Any] | AsyncIterator[Any], *, ndjson: bool
+) -> AsyncIterator[bytes]:
+    """Encode items of a sync or async iterator as they are produced. See `iter_json_chunks`."""
+    if not isinstance(items, AsyncIterator):
+        for data in iter_json_chunks(items, ndjson=ndjson):
+            yield data
+        return
+
+    writer = _JsonChunkWriter(ndjson=ndjson)
+    async for item in items:
+        chunk = writer.add(item)
+        if chunk is not None:
+            yield chunk
+
+    yield writer.close()
+
+
+class JsonResponseConverter:
+    """Serialize returned models to JSON once and wrap them in a ready framework response.
+
+    This avoids building an intermediate dict which the framework would then encode again.
+    The integration must implement `make_json_response`.
+    """
+
+    def __init__(self, integration: RequestMapperIntegrationType) -> None:
+        make_response = get_json_response_factory(integration)
+
+        if make_response is None:
+            msg = f"{type(integration).__name__} does not support creating JSON responses"
+            raise TypeError(msg)
+
+        self.finalize = make_response
+
+    def __call__(self, model: BaseModel) -> Any:
+        return self.finalize(dump_model_json(model))
+
+    @staticmethod
+    def serialize(model: BaseModel) -> bytes:
+        """Return the part of the conversion which does not depend on the current request."""
+        return dump_model_json(model)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def compile_response_stages(
+    converter: ResponseConverter | None,
+) -> tuple[Callable[[BaseModel], Any], Callable[[Any], Any]]:
+    """Split a converter into a serialization stage and a finalization stage.
+
+    The serialized value may be reused across requests, for example by a `ResponseCache`,
+    while finalization runs for every request. Converters can provide both stages through
+    `serialize` and `finalize` attributes. Other converters are treated as serialization only.
+    """
+    if converter is None:
+        return dump_model, _identity
+
+    serialize = getattr(converter, "serialize", None)
+    finalize = getattr(converter, "finalize", None)
+    if serialize is not None and finalize is not None:
+        return serialize, finalize
+
+    return converter, _identity
+
+
+def _compile_value_converter(
+    converter: ResponseConverter,
+    serialize: Callable[[Any], Any],
+    serialize_json: Callable[[Any], bytes] | None,
+) -> Callable[[Any], Any]:
+    if isinstance(converter, JsonResponseConverter) and serialize_json is not None:
+        finalize = converter.finalize
+
+        def convert_json(res: Any) -> Any:
+            if isinstance(res, BaseModel):
+                return converter(res)
+
+            return finalize(serialize_json(res))
+
+        return convert_json
+
+    def convert_values(res: Any) -> Any:
+        if isinstance(res, BaseModel):
+            return converter(res)
+
+        return serialize(res)
+
+    return convert_values
+
+
+def compile_response_converter(
+    converter: ResponseConverter | None,
+    make_stream_response: Callable[[Any], Any] | None = None,
+    value_serializers: tuple[Callable[[Any], Any], Callable[[Any], bytes] | None] | None = None,
+) -> Callable[[Any], Any]:
+    """Return a function applying the converter to models and passing other values through.
+
+    When given `make_stream_response`, generators and async generators returned by views
+    are streamed as they are consumed. Only pass it for views annotated as returning a stream
+    of models, see `is_model_stream`, so that other generators reach the framework unchanged.
+
+    When given the serializers of the return annotation, see `compile_value_serializers`,
+    other values are serialized with them instead, e.g. dataclasses and lists of models.
+    A `JsonResponseConverter` wraps their JSON in a response as it does for models.
+    """
+    if converter is None:
+        converter = dump_model
+
+    if value_serializers is not None:
+        return _compile_value_converter(converter, *value_serializers)
+
+    if make_stream_response is None:
+
+        def convert(res: Any) -> Any:
+            if isinstance(res, BaseModel):
+                return converter(res)
+
+            return res
+
+        return convert
+
+    def convert_streams(res: Any) -> Any:
+        if isinstance(res, BaseModel):
+            return converter(res)
+
+        if isinstance(res, (GeneratorType, AsyncGeneratorType)):
+            return make_stream_response(res)
+
+        return res
+
+    return convert_streams
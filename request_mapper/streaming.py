@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator
+
+from typing_extensions import get_args
+
+from request_mapper.engines import ValidationEngine, get_engine, json_safe_errors
+from request_mapper.types import RequestValidationError
+from request_mapper.validation import _bind_errors
+
+if TYPE_CHECKING:
+    from request_mapper.types import AnnotatedParameter
+    from request_mapper.validation import Validator
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_ARRAY_TOKENS = re.compile(rb'[\[\]{},"\\]')
+_WHITESPACE = b" \t\r\n"
+_QUOTE, _BACKSLASH, _COMMA, _CLOSE_BRACKET = b'"\\,]'
+
+
+class JsonItemSplitter:
+    """Incrementally split a JSON array or newline-delimited JSON into raw item documents.
+
+    A body starting with `[` is read as a JSON array, anything else as newline-delimited JSON.
+    Only the item currently being read is buffered, regardless of the size of the whole body.
+    Malformed input is not rejected here: it ends up in an item which then fails validation.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._is_array: bool | None = None
+        self._array_closed = False
+        self._depth = 0
+        self._in_string = False
+        self._scan_pos = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of the body and return the items it completed."""
+        self._buffer += chunk
+
+        if self._is_array is None:
+            stripped = self._buffer.lstrip(_WHITESPACE)
+            if not stripped:
+                self._buffer.clear()
+                return []
+
+            self._is_array = stripped[:1] == b"["
+            if self._is_array:
+                del stripped[:1]
+                self._depth = 1
+            self._buffer = stripped
+
+        return self._split_array() if self._is_array else self._split_lines()
+
+    def close(self) -> list[bytes]:
+        """Signal the end of the body and return any remaining item."""
+        remaining = bytes(self._buffer).strip()
+        self._buffer.clear()
+
+        if self._is_array and not self._array_closed:
+            # Unterminated array, hand the partial item over so that validation reports it.
+            return [remaining]
+
+        return [remaining] if remaining else []
+
+    def _split_lines(self) -> list[bytes]:
+        *lines, rest = self._buffer.split(b"\n")
+        self._buffer = bytearray(rest)
+
+        return [bytes(item) for item in (line.strip() for line in lines) if item]
+
+    def _split_array(self) -> list[bytes]:
+        items = []
+        buffer = self._buffer
+        pos = self._scan_pos
+        item_start = 0
+
+        while not self._array_closed:
+            match = _ARRAY_TOKENS.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+
+            start = match.start()
+            token = buffer[start]
+
+            if self._in_string and token == _BACKSLASH:
+                if start + 1 >= len(buffer):
+                    # The escaped character is in the next chunk, rescan from the backslash.
+                    pos = start
+                    break
+
+                pos = start + 2
+                continue
+
+            pos = start + 1
+            if self._consume(token):
+                item = bytes(buffer[item_start:start]).strip()
+                if item or token == _COMMA:
+                    items.append(item)
+                item_start = pos
+                self._array_closed = token == _CLOSE_BRACKET
+
+        del buffer[:item_start]
+        self._scan_pos = pos - item_start
+
+        if self._array_closed:
+            # Anything after the closing bracket must be whitespace, otherwise surface it.
+            trailing = bytes(buffer).strip()
+            if trailing:
+                items.append(trailing)
+            buffer.clear()
+            self._scan_pos = 0
+
+        return items
+
+    def _consume(self, token: int) -> bool:
+        """Update the parser state for a structural token and return whether it ends an item."""
+        if self._in_string:
+            self._in_string = token != _QUOTE
+        elif token == _QUOTE:
+            self._in_string = True
+        elif token in b"[{":
+            self._depth += 1
+        elif token in b"]}" and self._depth > 1:
+            self._depth -= 1
+        elif self._depth == 1:
+            return token in b",]"
+
+        return False
+
+
+def _compile_item_parser(engine: ValidationEngine, item_cls: Any) -> Callable[[bytes], Any]:
+    """Return a function validating a raw item document, through JSON when not supported."""
+    parse = engine.compile_json_validator(item_cls)
+    if parse is not None:
+        return parse
+
+    validate = engine.compile_validator(item_cls)
+
+    def parse_item(item: bytes) -> Any:
+        return validate(json.loads(item))
+
+    return parse_item
+
+
+def _prefix_errors(
+    get_errors: Callable[[Exception], Any], index: int
+) -> Callable[[Exception], Any]:
+    """Wrap `get_errors` to start the location of each error with the index of the item."""
+
+    def get_item_errors(error: Exception) -> Any:
+        errors = get_errors(error)
+        for err in errors:
+            err["loc"] = (index, *err["loc"])
+
+        return errors
+
+    return get_item_errors
+
+
+def _compile_item_validator(val: AnnotatedParameter) -> Callable[[int, bytes], Any]:
+    args = get_args(val.cls)
+    item_cls = args[0] if args else val.cls
+    engine = get_engine(item_cls)
+    location = val.annotation.location
+    validate = _bind_errors(engine, _compile_item_parser(engine, item_cls), location)
+
+    def validate_item(index: int, item: bytes) -> Any:
+        try:
+            return validate(item)
+        except RequestValidationError as e:
+            # Errors are still only formatted when reported, with the index prepended then.
+            get_errors = _prefix_errors(e.get_errors or json_safe_errors, index)  # type: ignore[arg-type]
+            raise RequestValidationError(
+                location, cause=e.cause, get_errors=get_errors
+            ) from e.cause
+        except json.JSONDecodeError as e:
+            errors = [{"type": "json_invalid", "loc": (index,), "msg": f"Invalid JSON: {e.msg}"}]
+            raise RequestValidationError(location, source_errors=errors) from e
+
+    return validate_item
+
+
+def compile_stream_validator(val: AnnotatedParameter, *, is_async: bool) -> Validator:
+    """Return a validator turning a stream of body chunks into an iterator of validated items.
+
+    Items are parsed and validated one at a time as the handler consumes the iterator.
+    Errors are reported with the index of the failing item as the first element of their location.
+    """
+    validate_item = _compile_item_validator(val)
+
+    def iter_items(chunks: Iterable[bytes]) -> Iterator[Any]:
+        splitter = JsonItemSplitter()
+        index = 0
+
+        for chunk in chunks:
+            for item in splitter.feed(chunk):
+                yield validate_item(index, item)
+                index += 1
+
+        for item in splitter.close():
+            yield validate_item(index, item)
+            index += 1
+
+    async def aiter_items(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+        splitter = JsonItemSplitter()
+        index = 0
+
+        async for chunk in chunks:
+            for item in splitter.feed(chunk):
+                yield validate_item(index, item)
+                index += 1
+
+        for item in splitter.close():
+            yield validate_item(index, item)
+            index += 1
+
+    return aiter_items if is_async else iter_items
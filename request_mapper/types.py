@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import functools
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Mapping, NamedTuple, Optional
 
 from pydantic import BaseModel
 
+from request_mapper.engines import json_safe_errors
+from request_mapper.integration.integration import (
+    get_body_stream_extractor,
+    get_form_data_extractor,
+    get_header_getter,
+    get_optional_accessor,
+    get_raw_body_extractor,
+    get_raw_query_extractor,
+)
+
 if TYPE_CHECKING:
-    from request_mapper import RequestMapperIntegration
+    from request_mapper import RequestMapperIntegration, RequestMapperIntegrationType
 
 AnyCallable = Callable[..., Optional[Any]]
 IncomingMappedData = Mapping[str, Any]
 RequestMapperDecorator = Callable[[AnyCallable], AnyCallable]
+DataExtractor = Callable[["FunctionCall"], Any]
 ResponseConverter = Callable[[BaseModel], Any]
 
 
@@ -23,19 +36,81 @@ class IntegrationDoesNotExistError(Exception):
 
 
 class RequestValidationError(Exception):
-    """Raised when pydantic fails to validate a model."""
+    """Raised when pydantic fails to validate a model.
+
+    Errors raised by validation engines are kept as `cause` and only turned into a list of
+    error dicts when `source_errors` is first read. Error handlers render them with
+    `render_errors`, which can skip building that list altogether.
+    """
+
+    status_code = 422
 
-    def __init__(self, location: str, source_errors: Any) -> None:
-        self.source_errors = source_errors
+    def __init__(
+        self,
+        location: str,
+        source_errors: Any = None,
+        *,
+        cause: Exception | None = None,
+        get_errors: Callable[[Exception], Any] | None = None,
+    ) -> None:
+        self._source_errors = source_errors
         self.location = location
+        self.cause = cause
+        self.get_errors = get_errors
 
         super().__init__("Request data validation failed")
 
+    @property
+    def source_errors(self) -> Any:
+        """Return the details of the errors, formatted on first access."""
+        if self._source_errors is None and self.cause is not None:
+            if self.get_errors is None:
+                self._source_errors = json_safe_errors(self.cause)  # type: ignore[arg-type]
+            else:
+                self._source_errors = self.get_errors(self.cause)
+
+        return self._source_errors
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling, so errors raised while validating in a process pool reach the view."""
+        return type(self), (self.location, self.source_errors)
+
+
+class RequestPolicyViolationError(RequestValidationError):
+    """Raised when a request is rejected by a `BodyPolicy` before its data is parsed."""
+
+    def __init__(self, location: str, error_type: str, message: str, status_code: int) -> None:
+        super().__init__(
+            location=location,
+            source_errors=[{"type": error_type, "loc": (), "msg": message}],
+        )
+        self.status_code = status_code
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling with this class's constructor arguments."""
+        [error] = self.source_errors
+        return type(self), (self.location, error["type"], error["msg"], self.status_code)
+
+
+def _unsupported(integration: RequestMapperIntegrationType, feature: str) -> DataExtractor:
+    """Return an extractor failing with a TypeError, for integrations lacking an optional method.
+
+    Failing on use rather than when binding keeps views bound to other integrations working.
+    """
+    msg = f"{type(integration).__name__} does not support {feature}"
+
+    def unsupported(call: FunctionCall) -> Any:  # noqa: ARG001
+        raise TypeError(msg)
+
+    return unsupported
+
 
 class RequestDataMapping(abc.ABC):
     """Base class to represent request data."""
 
     location: str
+    # Lazy mappings inject a `LazyModel` proxy which only fetches and validates data on access.
+    lazy: bool = False
 
     @abc.abstractmethod
     def get_data(
@@ -43,6 +118,29 @@ class RequestDataMapping(abc.ABC):
     ) -> IncomingMappedData:
         """Return mapped data."""
 
+    @classmethod
+    def bind_extractor(
+        cls: type[RequestDataMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor:
+        """Return a callable which retrieves the data for this mapping from the integration.
+
+        This is resolved once per view when the integration is set up,
+        so it must not depend on the current request.
+        """
+        return functools.partial(cls().get_data, integration)  # type: ignore[arg-type]
+
+    @classmethod
+    def bind_raw_extractor(
+        cls: type[RequestDataMapping],
+        integration: RequestMapperIntegrationType,  # noqa: ARG003
+    ) -> DataExtractor | None:
+        """Return a callable which retrieves the raw, undecoded data for this mapping if available.
+
+        When this returns a callable, parameters supporting it are validated from the raw data
+        such as JSON bytes or the query string, without building an intermediate mapping.
+        """
+        return None
+
 
 class RequestBodyMapping(RequestDataMapping):
     """Retrieve incoming data from the request body."""
@@ -54,6 +152,152 @@ class RequestBodyMapping(RequestDataMapping):
     ) -> IncomingMappedData:
         return integration.get_request_body_as_dict(call)
 
+    @classmethod
+    def bind_extractor(
+        cls: type[RequestBodyMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor:
+        return integration.get_request_body_as_dict
+
+    @classmethod
+    def bind_raw_extractor(
+        cls: type[RequestBodyMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor | None:
+        return get_raw_body_extractor(integration)
+
+
+class RequestBodyLazyMapping(RequestBodyMapping):
+    """Retrieve incoming data from the request body only once the view uses it."""
+
+    lazy = True
+
+
+class RequestBodyStreamMapping(RequestDataMapping):
+    """Retrieve incoming data from the request body as a stream of items.
+
+    The body must be a JSON array or newline-delimited JSON. Views receive an iterator
+    which validates items as it is consumed, so memory use does not grow with the body size.
+    """
+
+    location = "request-body"
+
+    def get_data(
+        self, integration: RequestMapperIntegration, call: FunctionCall
+    ) -> IncomingMappedData:
+        return integration.get_request_body_stream(call)  # type: ignore[return-value]
+
+    @classmethod
+    def bind_extractor(
+        cls: type[RequestBodyStreamMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor:
+        extractor = get_body_stream_extractor(integration)
+        return extractor or _unsupported(integration, "streaming request bodies")
+
+
+class FormDataMapping(RequestDataMapping):
+    """Retrieve incoming data from an urlencoded or multipart form body.
+
+    Unless the integration provides form data itself, the body stream is parsed as it is read.
+    Uploaded files are spooled to temporary files beyond `spool_size` bytes.
+    Subclass this to change the limits, which reject a form with a 413 status when exceeded.
+    """
+
+    location = "form-data"
+    spool_size = 1024 * 1024
+    max_field_size: int | None = 1024 * 1024
+    max_file_size: int | None = None
+    max_parts = 1000
+
+    def get_data(
+        self, integration: RequestMapperIntegration, call: FunctionCall
+    ) -> IncomingMappedData:
+        return integration.get_form_data(call)
+
+    @classmethod
+    def bind_extractor(
+        cls: type[FormDataMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor:
+        extractor = get_form_data_extractor(integration)
+        if extractor is not None:
+            return extractor
+
+        # Imported here as the form module depends on this one.
+        from request_mapper.form import compile_form_extractor
+
+        get_header = get_header_getter(integration)
+        get_stream = get_body_stream_extractor(integration)
+        if get_header is None or get_stream is None:
+            return _unsupported(integration, "form data")
+
+        is_async = asyncio.iscoroutinefunction(get_stream)
+        return compile_form_extractor(cls, get_header, get_stream, is_async=is_async)
+
+
+class LookupMapping(RequestDataMapping):
+    """Base class for sources read one key at a time, such as headers.
+
+    The extracted data only needs a `get` method. Validators look up the keys the model
+    declares and nothing else, so sources with many entries are never copied in full.
+    """
+
+    # Name of the optional integration method returning the source, without its `get_` prefix.
+    feature: str
+
+    @staticmethod
+    def lookup_name(key: str) -> str:
+        """Return the name to look up in the source for a model field without an alias."""
+        return key
+
+    @classmethod
+    def bind_extractor(
+        cls: type[LookupMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor:
+        extractor = get_optional_accessor(integration, f"get_{cls.feature}")
+        return extractor or _unsupported(integration, cls.feature.replace("_", " "))
+
+
+class HeadersMapping(LookupMapping):
+    """Retrieve incoming data from the request headers.
+
+    Field names are matched case-insensitively, with underscores standing for dashes,
+    e.g. `tenant_id` reads the `Tenant-Id` header. Aliases are used as they are.
+    """
+
+    location = "headers"
+    feature = "headers"
+
+    def get_data(
+        self, integration: RequestMapperIntegration, call: FunctionCall
+    ) -> IncomingMappedData:
+        return integration.get_headers(call)  # type: ignore[no-any-return]
+
+    @staticmethod
+    def lookup_name(key: str) -> str:
+        return key.replace("_", "-")
+
+
+class PathMapping(LookupMapping):
+    """Retrieve incoming data from the parameters of the matched route."""
+
+    location = "path"
+    feature = "path_params"
+
+    def get_data(
+        self, integration: RequestMapperIntegration, call: FunctionCall
+    ) -> IncomingMappedData:
+        return integration.get_path_params(call)  # type: ignore[no-any-return]
+
+
+class CookiesMapping(LookupMapping):
+    """Retrieve incoming data from the request cookies."""
+
+    location = "cookies"
+    feature = "cookies"
+
+    def get_data(
+        self, integration: RequestMapperIntegration, call: FunctionCall
+    ) -> IncomingMappedData:
+        return integration.get_cookies(call)  # type: ignore[no-any-return]
+
 
 class QueryStringMapping(RequestDataMapping):
     """Retrieve incoming data from the query string."""
@@ -65,6 +309,18 @@ class QueryStringMapping(RequestDataMapping):
     ) -> IncomingMappedData:
         return integration.get_query_as_dict(call)
 
+    @classmethod
+    def bind_extractor(
+        cls: type[QueryStringMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor:
+        return integration.get_query_as_dict
+
+    @classmethod
+    def bind_raw_extractor(
+        cls: type[QueryStringMapping], integration: RequestMapperIntegrationType
+    ) -> DataExtractor | None:
+        return get_raw_query_extractor(integration)
+
 
 @dataclass(frozen=True)
 class AnnotatedParameter:
@@ -72,12 +328,33 @@ class AnnotatedParameter:
 
     cls: type[BaseModel]
     annotation: type[RequestDataMapping]
+    metadata: tuple[Any, ...] = ()
 
 
-@dataclass(frozen=True)
-class FunctionCall:
-    """Model representing a function call."""
+class BoundParameter(NamedTuple):
+    """A mapped parameter with its validator resolved ahead of time."""
+
+    name: str
+    validate: Callable[[Any], Any]
+
+
+class BoundSource(NamedTuple):
+    """A source of request data and every mapped parameter reading from it."""
+
+    extract: DataExtractor
+    parameters: tuple[BoundParameter, ...]
+
+
+class FunctionCall(NamedTuple):
+    """Model representing a function call.
+
+    This is created for every mapped call, so it is a named tuple rather than
+    a frozen dataclass which is several times slower to construct.
+    `request` holds the framework request when the integration can locate it
+    from the view signature, see `bind_request_getter`.
+    """
 
     fn: AnyCallable
     args: tuple[Any, ...]
     kwargs: dict[str, Any]
+    request: Any = None
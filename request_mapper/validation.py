@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from request_mapper.engines import ValidationEngine, get_engine
+from request_mapper.types import RequestValidationError
+
+if TYPE_CHECKING:
+    from request_mapper.types import AnnotatedParameter
+
+Validator = Callable[[Any], Any]
+
+
+def _bind_errors(
+    engine: ValidationEngine, validate: Callable[[Any], Any], location: str
+) -> Callable[[Any], Any]:
+    """Wrap an engine validator to raise its errors as a `RequestValidationError`."""
+    error_types = engine.error_types
+    # Errors are formatted only when reported. Without a custom `get_errors`, pydantic errors
+    # can then be rendered straight to JSON by pydantic itself.
+    get_errors: Callable[[Exception], Any] | None = engine.get_errors
+    if type(engine).get_errors is ValidationEngine.get_errors:
+        get_errors = None
+
+    def validate_request(data: Any) -> Any:
+        try:
+            return validate(data)
+        except error_types as e:
+            raise RequestValidationError(location, cause=e, get_errors=get_errors) from e
+
+    return validate_request
+
+
+def compile_validator(val: AnnotatedParameter) -> Validator:
+    """Return a validator for the given parameter with its model and location pre-bound.
+
+    The validation engine for the type is resolved here, once per parameter.
+    Types other than models, e.g. `list[T]`, are validated in a single call through a cached
+    type adapter. Errors then start with the index or key of the failing item.
+    """
+    engine = get_engine(val.cls)
+    return _bind_errors(engine, engine.compile_validator(val.cls), val.annotation.location)
+
+
+def compile_json_validator(val: AnnotatedParameter) -> Validator | None:
+    """Return a validator parsing raw JSON bytes straight into the model.
+
+    Returns None for types which the engine cannot validate from JSON directly,
+    such as any type with pydantic v1.
+    """
+    engine = get_engine(val.cls)
+    validate_json = engine.compile_json_validator(val.cls)
+    if validate_json is None:
+        return None
+
+    return _bind_errors(engine, validate_json, val.annotation.location)
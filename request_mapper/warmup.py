@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import inspect
+import time
+import typing
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import BaseModel
+from typing_extensions import get_args, get_origin
+
+from request_mapper.engines import get_engine
+
+
+def get_type_name(cls: Any) -> str:
+    """Return a readable name for a class or a type such as `list[T]`."""
+    if isinstance(cls, type) and get_origin(cls) is None:
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    return repr(cls)
+
+
+def get_return_type(fn: Callable[..., Any]) -> Any:
+    """Return the return annotation of a view, or None if it has none that can be resolved."""
+    try:
+        return typing.get_type_hints(fn).get("return")
+    except Exception:  # noqa: BLE001
+        # Annotations referring to names which are not importable at runtime.
+        annotation = inspect.signature(fn).return_annotation
+        if annotation is inspect.Signature.empty or isinstance(annotation, str):
+            return None
+
+        return annotation
+
+
+def get_response_models(annotation: Any) -> Iterator[type[BaseModel]]:
+    """Yield the models found in a return annotation, including inside containers and unions."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+
+    for arg in get_args(annotation):
+        yield from get_response_models(arg)
+
+
+def warm_up_types(types: Iterable[Any]) -> dict[str, float]:
+    """Build the validators and serializers of each type, returning the seconds spent per type."""
+    timings: dict[str, float] = {}
+    for cls in types:
+        name = get_type_name(cls)
+        if cls is None or name in timings:
+            continue
+
+        start = time.perf_counter()
+        get_engine(cls).warm_up(cls)
+        timings[name] = time.perf_counter() - start
+
+    return timings
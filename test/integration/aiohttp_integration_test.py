@@ -1,9 +1,27 @@
+import asyncio
+import dataclasses
 from test.fixtures import QueryDummyModel, RequestBodyDummyModel
+from typing import AsyncIterator, List
 
+import aiohttp
 import pytest
 from aiohttp import web
 from aiohttp.pytest_plugin import aiohttp_client
-from request_mapper import FromQuery, FromBody, map_request, setup_mapper
+from pydantic import BaseModel
+from request_mapper import (
+    FromAsyncBodyStream,
+    FromBody,
+    FromCookies,
+    FromForm,
+    FromHeaders,
+    FromPath,
+    FromQuery,
+    JsonResponseConverter,
+    SingleFlight,
+    UploadedFile,
+    map_request,
+    setup_mapper,
+)
 from request_mapper.integration.aiohttp_integration import AioHttpIntegration
 
 
@@ -43,3 +61,213 @@ async def test_maps_class_based_views(aiohttp_client):
     client = await aiohttp_client(app)
     resp = await client.get("?query=true")
     assert await resp.json() == {"query": True}
+
+
+@pytest.mark.asyncio()
+async def test_maps_bound_method_handlers(aiohttp_client):
+    class Handlers:
+        @map_request
+        async def get(self, request: web.Request, q: FromQuery[QueryDummyModel]) -> web.Response:
+            return web.json_response({"query": q.query, "path": request.path})
+
+    app = web.Application()
+    app.router.add_get("/", Handlers().get)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    resp = await client.get("/?query=true")
+    assert resp.status == 200
+    assert await resp.json() == {"query": True, "path": "/"}
+
+
+@pytest.mark.asyncio()
+async def test_json_response_converter_returns_json_response(aiohttp_client):
+    @map_request
+    async def view(_request: web.Request, query: FromQuery[QueryDummyModel]):
+        return query
+
+    app = web.Application()
+    app.router.add_get("/", view)
+    integration = AioHttpIntegration(app)
+    setup_mapper(integration=integration, response_converter=JsonResponseConverter(integration))
+
+    client = await aiohttp_client(app)
+    resp = await client.get("/?query=true")
+    assert resp.content_type == "application/json"
+    assert await resp.json() == {"query": True}
+
+
+@pytest.mark.asyncio()
+async def test_json_response_converter_serializes_annotated_dataclasses(aiohttp_client):
+    @dataclasses.dataclass
+    class Result:
+        query: bool
+
+    @map_request
+    async def view(_request: web.Request, query: FromQuery[QueryDummyModel]) -> Result:
+        return Result(query=query.query)
+
+    app = web.Application()
+    app.router.add_get("/", view)
+    integration = AioHttpIntegration(app)
+    setup_mapper(integration=integration, response_converter=JsonResponseConverter(integration))
+
+    client = await aiohttp_client(app)
+    resp = await client.get("/?query=true")
+    assert resp.content_type == "application/json"
+    assert await resp.json() == {"query": True}
+
+
+@pytest.mark.asyncio()
+async def test_maps_streamed_body_items(aiohttp_client):
+    @map_request
+    async def view(_request: web.Request, items: FromAsyncBodyStream[RequestBodyDummyModel]):
+        return web.json_response({"count": sum([item.body async for item in items])})
+
+    app = web.Application()
+    app.router.add_post("/", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    resp = await client.post("/", data=b'{"body": true}\n{"body": false}\n{"body": true}\n')
+    assert await resp.json() == {"count": 2}
+
+
+@pytest.mark.asyncio()
+async def test_streamed_body_validation_error_returns_422(aiohttp_client):
+    @map_request
+    async def view(_request: web.Request, items: FromAsyncBodyStream[RequestBodyDummyModel]):
+        return web.json_response({"count": len([item async for item in items])})
+
+    app = web.Application()
+    app.router.add_post("/", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    resp = await client.post("/", data=b'[{"body": true}, {}]')
+    assert resp.status == 422
+    assert (await resp.json())[0]["loc"] == [1, "body"]
+
+
+@pytest.mark.asyncio()
+async def test_maps_repeated_query_keys_to_lists(aiohttp_client):
+    class FilterQuery(BaseModel):
+        ids: List[int]
+        name: str
+
+    @map_request
+    async def view(_request: web.Request, query: FromQuery[FilterQuery]):
+        return web.json_response(query.model_dump())
+
+    app = web.Application()
+    app.router.add_get("/", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    resp = await client.get("/?ids=1&ids=2&name=a%26b")
+    assert await resp.json() == {"ids": [1, 2], "name": "a&b"}
+
+
+@pytest.mark.asyncio()
+async def test_maps_multipart_forms(aiohttp_client):
+    class UploadForm(BaseModel):
+        title: str
+        doc: UploadedFile
+
+    @map_request
+    async def view(_request: web.Request, form: FromForm[UploadForm]):
+        return web.json_response({"title": form.title, "doc": form.doc.read().decode()})
+
+    app = web.Application()
+    app.router.add_post("/", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    data = aiohttp.FormData()
+    data.add_field("title", "Report")
+    data.add_field("doc", b"contents", filename="report.txt")
+    resp = await client.post("/", data=data)
+    assert await resp.json() == {"title": "Report", "doc": "contents"}
+
+
+@pytest.mark.asyncio()
+async def test_maps_path_headers_and_cookies(aiohttp_client):
+    class PostPath(BaseModel):
+        post_id: int
+
+    class TenantHeaders(BaseModel):
+        tenant_id: int
+
+    class Session(BaseModel):
+        session: str
+
+    @map_request
+    async def view(
+        _request: web.Request,
+        path: FromPath[PostPath],
+        headers: FromHeaders[TenantHeaders],
+        cookies: FromCookies[Session],
+    ):
+        return web.json_response(
+            {"post": path.post_id, "tenant": headers.tenant_id, "session": cookies.session}
+        )
+
+    app = web.Application()
+    app.router.add_get("/posts/{post_id}", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    resp = await client.get("/posts/7", headers={"Tenant-Id": "3", "Cookie": "session=s1"})
+    assert await resp.json() == {"post": 7, "tenant": 3, "session": "s1"}
+
+
+@pytest.mark.asyncio()
+async def test_streams_async_generator_results(aiohttp_client):
+    async def rows(count):
+        for i in range(count):
+            yield RequestBodyDummyModel(body=i % 2 == 0)
+
+    @map_request
+    async def view(
+        _request: web.Request, query: FromQuery[QueryDummyModel]
+    ) -> AsyncIterator[RequestBodyDummyModel]:
+        return rows(3 if query.query else 0)
+
+    app = web.Application()
+    app.router.add_get("/", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    resp = await client.get("/?query=true")
+    assert await resp.json() == [{"body": True}, {"body": False}, {"body": True}]
+
+    resp = await client.get("/?query=false")
+    assert await resp.json() == []
+
+    resp = await client.get("/?query=true", headers={"Accept": "application/x-ndjson"})
+    assert resp.content_type == "application/x-ndjson"
+    assert len((await resp.text()).splitlines()) == 3
+
+
+@pytest.mark.asyncio()
+async def test_runs_coalesced_views_returning_responses_per_request(aiohttp_client):
+    calls = 0
+
+    @SingleFlight()
+    @map_request
+    async def view(_request: web.Request, query: FromQuery[QueryDummyModel]):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return web.json_response({"query": query.query})
+
+    app = web.Application()
+    app.router.add_get("/", view)
+    setup_mapper(integration=AioHttpIntegration(app))
+
+    client = await aiohttp_client(app)
+    responses = await asyncio.wait_for(
+        asyncio.gather(*(client.get("/?query=true") for _ in range(3))), 5
+    )
+    assert [await resp.json() for resp in responses] == [{"query": True}] * 3
+    assert calls == 3
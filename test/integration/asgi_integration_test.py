@@ -0,0 +1,137 @@
+import asyncio
+import json
+import unittest
+from test.fixtures import QueryDummyModel, RequestBodyDummyModel
+from typing import AsyncIterator, List
+
+from pydantic import BaseModel
+
+from request_mapper import (
+    FromAsyncBodyStream,
+    FromBody,
+    FromCookies,
+    FromHeaders,
+    FromPath,
+    FromQuery,
+    JsonResponseConverter,
+    map_request,
+    setup_mapper,
+)
+from request_mapper.integration.asgi_integration import AsgiIntegration, AsgiMiddleware
+
+
+def request(app, *, query=b"", body_chunks=(), headers=(), path_params=None):
+    scope = {"type": "http", "query_string": query, "headers": list(headers)}
+    if path_params is not None:
+        scope["path_params"] = path_params
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(body_chunks) - 1}
+        for i, chunk in enumerate(body_chunks)
+    ] or [{"type": "http.request", "body": b""}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, *body = sent
+    return start["status"], json.loads(b"".join(message["body"] for message in body))
+
+
+class AsgiIntegrationTest(unittest.TestCase):
+    def test_maps_query_json_models(self):
+        @map_request
+        async def app(
+            scope,
+            receive,
+            send,
+            query: FromQuery[QueryDummyModel],
+            body: FromBody[RequestBodyDummyModel],
+        ):
+            return {"query": query.query, "body": body.body}
+
+        setup_mapper(AsgiIntegration())
+        res = request(
+            AsgiMiddleware(app), query=b"query=true", body_chunks=[b'{"bo', b'dy": true}']
+        )
+        self.assertEqual(res, (200, {"query": True, "body": True}))
+
+    def test_validation_error_returns_422(self):
+        @map_request
+        async def app(scope, receive, send, body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        setup_mapper(AsgiIntegration())
+        status, errors = request(AsgiMiddleware(app), body_chunks=[b'{"body": []}'])
+        self.assertEqual(status, 422)
+        self.assertEqual(errors[0]["loc"], ["body"])
+
+    def test_maps_repeated_query_keys_to_lists(self):
+        class FilterQuery(BaseModel):
+            ids: List[int]
+
+        class View:
+            @map_request
+            async def __call__(self, scope, receive, send, query: FromQuery[FilterQuery]):
+                return query
+
+        integration = AsgiIntegration()
+        setup_mapper(integration, response_converter=JsonResponseConverter(integration))
+        res = request(AsgiMiddleware(View()), query=b"ids=1&ids=2")
+        self.assertEqual(res, (200, {"ids": [1, 2]}))
+
+    def test_maps_streamed_body_items(self):
+        @map_request
+        async def app(scope, receive, send, items: FromAsyncBodyStream[RequestBodyDummyModel]):
+            return {"count": sum([item.body async for item in items])}
+
+        setup_mapper(AsgiIntegration())
+        res = request(AsgiMiddleware(app), body_chunks=[b'{"body": true}\n{"bo', b'dy": true}\n'])
+        self.assertEqual(res, (200, {"count": 2}))
+
+    def test_maps_path_headers_and_cookies(self):
+        class PostPath(BaseModel):
+            post_id: int
+
+        class TenantHeaders(BaseModel):
+            tenant_id: int
+
+        class Session(BaseModel):
+            session: str
+
+        @map_request
+        async def app(
+            scope,
+            receive,
+            send,
+            path: FromPath[PostPath],
+            headers: FromHeaders[TenantHeaders],
+            cookies: FromCookies[Session],
+        ):
+            return {"post": path.post_id, "tenant": headers.tenant_id, "session": cookies.session}
+
+        setup_mapper(AsgiIntegration())
+        res = request(
+            AsgiMiddleware(app),
+            headers=[(b"tenant-id", b"3"), (b"cookie", b"session=s1")],
+            path_params={"post_id": "7"},
+        )
+        self.assertEqual(res, (200, {"post": 7, "tenant": 3, "session": "s1"}))
+
+    def test_streams_async_generator_results(self):
+        async def rows():
+            for i in range(3):
+                yield RequestBodyDummyModel(body=i % 2 == 0)
+
+        @map_request
+        async def app(
+            scope, receive, send, query: FromQuery[QueryDummyModel]
+        ) -> AsyncIterator[RequestBodyDummyModel]:
+            return rows()
+
+        setup_mapper(AsgiIntegration())
+        res = request(AsgiMiddleware(app), query=b"query=true")
+        self.assertEqual(res, (200, [{"body": True}, {"body": False}, {"body": True}]))
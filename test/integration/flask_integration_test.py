@@ -1,8 +1,27 @@
+import io
 import unittest
 from test.fixtures import QueryDummyModel, RequestBodyDummyModel
+from typing import Iterable, Iterator, List
+
+from pydantic import BaseModel
+from typing_extensions import Annotated
 
 from flask import Flask
-from request_mapper import FromBody, FromQuery, setup_mapper
+from request_mapper import (
+    BodyPolicy,
+    FromBody,
+    FromBodyLazy,
+    FromBodyStream,
+    FromCookies,
+    FromForm,
+    FromHeaders,
+    FromPath,
+    FromQuery,
+    JsonResponseConverter,
+    ResponseCache,
+    UploadedFile,
+    setup_mapper,
+)
 from request_mapper.integration.flask_integration import FlaskIntegration
 
 
@@ -24,3 +43,192 @@ class FlaskIntegrationTest(unittest.TestCase):
         res = self.client.post("/", query_string={"query": True}, json={"body": True})
         self.assertEqual(res.status_code, 200)
         self.assertEqual(res.data, b"ok")
+
+    def test_invalid_json_body_returns_422(self):
+        @self.app.route("/", methods=["POST"])
+        def flask_view(body: FromBody[RequestBodyDummyModel]):
+            return "ok"
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.post("/", data=b"{not json", content_type="application/json")
+        self.assertEqual(res.status_code, 422)
+        self.assertEqual(res.json["location"], "request-body")
+        self.assertEqual(res.json["errors"][0]["type"], "json_invalid")
+
+    def test_lazy_body_validation_error_returns_422(self):
+        @self.app.route("/", methods=["POST"])
+        def flask_view(body: FromBodyLazy[RequestBodyDummyModel]):
+            return "ok" if body.body else "no"
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.post("/", json={"body": "invalid"})
+        self.assertEqual(res.status_code, 422)
+        self.assertEqual(self.client.post("/", json={"body": True}).data, b"ok")
+
+    def test_json_response_converter_returns_json_response(self):
+        @self.app.route("/")
+        def flask_view(query: FromQuery[QueryDummyModel]):
+            return query
+
+        integration = FlaskIntegration(app=self.app)
+        setup_mapper(integration=integration, response_converter=JsonResponseConverter(integration))
+        res = self.client.get("/", query_string={"query": True})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, "application/json")
+        self.assertEqual(res.data, b'{"query":true}')
+
+    def test_maps_streamed_body_items(self):
+        @self.app.route("/", methods=["POST"])
+        def flask_view(items: FromBodyStream[RequestBodyDummyModel]):
+            return {"count": sum(item.body for item in items)}
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.post("/", data=b'[{"body": true}, {"body": true}, {"body": false}]')
+        self.assertEqual(res.json, {"count": 2})
+
+    def test_maps_repeated_query_keys_to_lists(self):
+        class FilterQuery(BaseModel):
+            ids: List[int]
+
+        @self.app.route("/")
+        def flask_view(query: FromQuery[FilterQuery]):
+            return query
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.get("/?ids=1&ids=2&ids=3")
+        self.assertEqual(res.json, {"ids": [1, 2, 3]})
+
+    def test_body_policy_violation_returns_status(self):
+        @self.app.route("/", methods=["POST"])
+        def flask_view(body: Annotated[FromBody[RequestBodyDummyModel], BodyPolicy(max_size=5)]):
+            return "ok"
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.post("/", json={"body": True})
+        self.assertEqual(res.status_code, 413)
+        self.assertEqual(res.json["errors"][0]["type"], "body_too_large")
+
+    def test_lazy_decoration_maps_views_on_first_dispatch(self):
+        @self.app.route("/")
+        def flask_view(query: FromQuery[QueryDummyModel]):
+            return query
+
+        @self.app.route("/plain")
+        def plain_view():
+            return "plain"
+
+        setup_mapper(integration=FlaskIntegration(app=self.app, lazy_decoration=True))
+        self.assertIs(self.app.view_functions["flask_view"], flask_view)
+
+        @self.app.route("/late")
+        def late_view(query: FromQuery[QueryDummyModel]):
+            return query
+
+        self.assertEqual(self.client.get("/?query=true").json, {"query": True})
+        self.assertEqual(self.client.get("/?query=true").json, {"query": True})
+        self.assertEqual(self.client.get("/late?query=false").json, {"query": False})
+        self.assertEqual(self.client.get("/late").status_code, 422)
+        self.assertEqual(self.client.get("/plain").data, b"plain")
+        self.assertIsNot(self.app.view_functions["flask_view"], flask_view)
+        self.assertIs(self.app.view_functions["plain_view"], plain_view)
+
+    def test_warm_up_maps_lazily_decorated_views(self):
+        @self.app.route("/")
+        def flask_view(query: FromQuery[QueryDummyModel]):
+            return query
+
+        setup_mapper(integration=FlaskIntegration(app=self.app, lazy_decoration=True), warm_up=True)
+        self.assertIsNot(self.app.view_functions["flask_view"], flask_view)
+        self.assertEqual(self.client.get("/?query=true").json, {"query": True})
+
+    def test_maps_multipart_forms(self):
+        class UploadForm(BaseModel):
+            title: str
+            doc: UploadedFile
+
+        @self.app.route("/", methods=["POST"])
+        def flask_view(form: FromForm[UploadForm]):
+            return {"title": form.title, "doc": form.doc.read().decode()}
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.post(
+            "/", data={"title": "Report", "doc": (io.BytesIO(b"contents"), "report.txt")}
+        )
+        self.assertEqual(res.json, {"title": "Report", "doc": "contents"})
+
+    def test_maps_path_headers_and_cookies(self):
+        class PostPath(BaseModel):
+            post_id: int
+
+        class TenantHeaders(BaseModel):
+            tenant_id: int
+
+        class Session(BaseModel):
+            session: str
+
+        @self.app.route("/posts/<int:post_id>/<slug>")
+        def flask_view(
+            slug: str,
+            path: FromPath[PostPath],
+            headers: FromHeaders[TenantHeaders],
+            cookies: FromCookies[Session],
+        ):
+            return {
+                "slug": slug,
+                "post": path.post_id,
+                "tenant": headers.tenant_id,
+                "session": cookies.session,
+            }
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        self.client.set_cookie("session", "s1")
+        res = self.client.get("/posts/7/hello", headers={"Tenant-Id": "3"})
+        self.assertEqual(res.json, {"slug": "hello", "post": 7, "tenant": 3, "session": "s1"})
+        self.assertEqual(self.client.get("/posts/7/hello").status_code, 422)
+
+    def test_cache_keys_include_path_parameters(self):
+        @self.app.route("/items/<int:item_id>")
+        @ResponseCache()
+        def flask_view(item_id: int, query: FromQuery[QueryDummyModel]) -> RequestBodyDummyModel:
+            return RequestBodyDummyModel(body=item_id == 1)
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        self.assertEqual(self.client.get("/items/1?query=true").json, {"body": True})
+        self.assertEqual(self.client.get("/items/2?query=true").json, {"body": False})
+        self.assertEqual(self.client.get("/items/1?query=true").json, {"body": True})
+
+    def test_streams_generator_results(self):
+        @self.app.route("/")
+        def flask_view(query: FromQuery[QueryDummyModel]) -> Iterator[RequestBodyDummyModel]:
+            return (RequestBodyDummyModel(body=query.query) for _ in range(3))
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.get("/?query=true")
+        self.assertEqual(res.json, [{"body": True}] * 3)
+
+        res = self.client.get("/?query=false", headers={"Accept": "application/x-ndjson"})
+        self.assertEqual(res.mimetype, "application/x-ndjson")
+        self.assertEqual(res.data.splitlines(), [b'{"body":false}'] * 3)
+
+    def test_streams_generators_annotated_as_iterables(self):
+        @self.app.route("/")
+        def flask_view(query: FromQuery[QueryDummyModel]) -> Iterable[RequestBodyDummyModel]:
+            return (RequestBodyDummyModel(body=query.query) for _ in range(2))
+
+        @self.app.route("/list")
+        def list_view(query: FromQuery[QueryDummyModel]) -> Iterable[RequestBodyDummyModel]:
+            return [{"body": query.query}]
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        self.assertEqual(self.client.get("/?query=true").json, [{"body": True}] * 2)
+        self.assertEqual(self.client.get("/list?query=true").json, [{"body": True}])
+
+    def test_passes_other_generator_results_to_flask(self):
+        @self.app.route("/")
+        def flask_view(query: FromQuery[QueryDummyModel]):
+            return (f"{i},{query.query}\n" for i in range(2))
+
+        setup_mapper(integration=FlaskIntegration(app=self.app))
+        res = self.client.get("/?query=true")
+        self.assertEqual(res.mimetype, "text/html")
+        self.assertEqual(res.data, b"0,True\n1,True\n")
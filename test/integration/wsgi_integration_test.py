@@ -0,0 +1,90 @@
+import io
+import json
+import unittest
+from test.fixtures import QueryDummyModel, RequestBodyDummyModel
+from typing import Iterator, List
+from wsgiref.util import setup_testing_defaults
+
+from pydantic import BaseModel
+
+from flask import Flask
+from request_mapper import FromBody, FromBodyStream, FromQuery, map_request, setup_mapper
+from request_mapper.integration.wsgi_integration import WsgiIntegration, WsgiMiddleware
+
+
+def request(app, *, query="", body=b""):
+    environ = {
+        "QUERY_STRING": query,
+        "REQUEST_METHOD": "POST",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+    statuses = []
+    res = b"".join(app(environ, lambda status, headers: statuses.append(status)))
+    return int(statuses[0].split()[0]), json.loads(res)
+
+
+class WsgiIntegrationTest(unittest.TestCase):
+    def test_maps_query_json_models(self):
+        @map_request
+        def app(
+            environ,
+            start_response,
+            query: FromQuery[QueryDummyModel],
+            body: FromBody[RequestBodyDummyModel],
+        ):
+            return {"query": query.query, "body": body.body}
+
+        setup_mapper(WsgiIntegration())
+        res = request(WsgiMiddleware(app), query="query=true", body=b'{"body": true}')
+        self.assertEqual(res, (200, {"query": True, "body": True}))
+
+    def test_validation_error_returns_422(self):
+        @map_request
+        def app(environ, start_response, body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        setup_mapper(WsgiIntegration())
+        status, errors = request(WsgiMiddleware(app), body=b'{"body": []}')
+        self.assertEqual(status, 422)
+        self.assertEqual(errors[0]["loc"], ["body"])
+
+    def test_maps_streamed_body_items(self):
+        @map_request
+        def app(environ, start_response, items: FromBodyStream[RequestBodyDummyModel]):
+            return {"count": sum(item.body for item in items)}
+
+        setup_mapper(WsgiIntegration())
+        res = request(WsgiMiddleware(app), body=b'[{"body": true}, {"body": false}]')
+        self.assertEqual(res, (200, {"count": 1}))
+
+    def test_maps_flask_views(self):
+        class FilterQuery(BaseModel):
+            ids: List[int]
+
+        flask_app = Flask(__name__)
+        flask_app.config.update({"TESTING": True})
+        flask_app.wsgi_app = WsgiMiddleware(flask_app.wsgi_app)
+
+        @flask_app.route("/")
+        @map_request
+        def flask_view(query: FromQuery[FilterQuery]):
+            return query
+
+        setup_mapper(WsgiIntegration())
+        client = flask_app.test_client()
+        self.assertEqual(client.get("/?ids=1&ids=2").json, {"ids": [1, 2]})
+        self.assertEqual(client.get("/?ids=x").status_code, 422)
+
+    def test_streams_generator_results(self):
+        @map_request
+        def app(
+            environ, start_response, query: FromQuery[QueryDummyModel]
+        ) -> Iterator[QueryDummyModel]:
+            return (QueryDummyModel(query=query.query) for _ in range(2))
+
+        setup_mapper(WsgiIntegration())
+        res = request(WsgiMiddleware(app), query="query=true")
+        self.assertEqual(res, (200, [{"query": True}] * 2))
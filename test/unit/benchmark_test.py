@@ -0,0 +1,15 @@
+import unittest
+
+from benchmark.__main__ import compare
+
+
+def results(**timings):
+    return {"results": {name: {"min_s": value, "mean_s": value} for name, value in timings.items()}}
+
+
+class TestBenchmarkCompare(unittest.TestCase):
+    def test_reports_metrics_slower_than_threshold(self):
+        baseline = results(fast=1.0, slow=1.0, removed=1.0)
+        current = results(fast=1.05, slow=1.5, added=9.0)
+
+        self.assertEqual(compare(baseline, current, threshold=0.1), ["slow"])
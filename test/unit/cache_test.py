@@ -0,0 +1,196 @@
+import asyncio
+import importlib
+import unittest
+from test.fixtures import DummyIntegration, QueryDummyModel
+
+from pydantic import BaseModel
+
+import request_mapper
+from request_mapper import AsyncRequestMapperIntegration, FromQuery, ResponseCache
+
+
+class ResultModel(BaseModel):
+    value: int
+
+
+class AsyncDummyIntegration(AsyncRequestMapperIntegration):
+    def __init__(self, query):
+        self.query = query
+
+    def set_up(self, request_mapper_decorator):
+        pass
+
+    async def get_query_as_dict(self, call):
+        return self.query
+
+    async def get_request_body_as_dict(self, call):
+        return {}
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+        self.calls = 0
+
+    def _make_view(self, cache):
+        @cache
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel]):
+            self.calls += 1
+            return ResultModel(value=self.calls)
+
+        return target
+
+    def test_caches_on_validated_input(self):
+        cache = ResponseCache()
+        target = self._make_view(cache)
+        integration = DummyIntegration(query={"query": True})
+        request_mapper.setup_mapper(integration)
+
+        self.assertEqual(target(), {"value": 1})
+        self.assertEqual(target(), {"value": 1})
+        integration.query = {"query": False}
+        self.assertEqual(target(), {"value": 2})
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.stats[:3], (1, 2, 0))
+
+    def test_decorator_order(self):
+        cache = ResponseCache()
+
+        @request_mapper.map_request
+        @cache
+        def target(query: FromQuery[QueryDummyModel]):
+            self.calls += 1
+            return ResultModel(value=self.calls)
+
+        request_mapper.setup_mapper(DummyIntegration())
+        target()
+        target()
+        self.assertEqual(self.calls, 1)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=1)
+        target = self._make_view(cache)
+        integration = DummyIntegration(query={"query": True})
+        request_mapper.setup_mapper(integration)
+
+        target()
+        integration.query = {"query": False}
+        target()
+        integration.query = {"query": True}
+        target()
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(cache.stats.evictions, 2)
+        self.assertEqual(cache.stats.entries, 1)
+
+    def test_ttl(self):
+        cache = ResponseCache(ttl=0)
+        target = self._make_view(cache)
+        request_mapper.setup_mapper(DummyIntegration())
+
+        target()
+        target()
+        self.assertEqual(self.calls, 2)
+
+    def test_max_size(self):
+        cache = ResponseCache(max_size=1, size_of=lambda value: 2)
+        target = self._make_view(cache)
+        request_mapper.setup_mapper(DummyIntegration())
+
+        target()
+        target()
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.stats.size, 0)
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        target = self._make_view(cache)
+        request_mapper.setup_mapper(DummyIntegration())
+
+        target()
+        cache.invalidate(target, QueryDummyModel(query=False))
+        target()
+        self.assertEqual(self.calls, 1)
+
+        cache.invalidate(target, QueryDummyModel(query=True))
+        target()
+        self.assertEqual(self.calls, 2)
+
+        cache.invalidate(target)
+        target()
+        cache.invalidate()
+        target()
+        self.assertEqual(self.calls, 4)
+
+    def test_keys_include_other_arguments(self):
+        cache = ResponseCache()
+
+        @cache
+        @request_mapper.map_request
+        def target(item, query: FromQuery[QueryDummyModel]):
+            self.calls += 1
+            return ResultModel(value=self.calls)
+
+        request_mapper.setup_mapper(DummyIntegration())
+        self.assertEqual(target(1), {"value": 1})
+        self.assertEqual(target(item=1), {"value": 2})
+        self.assertEqual(target(2), {"value": 3})
+        self.assertEqual(target(1), {"value": 1})
+        self.assertEqual(target([1]), {"value": 4})
+        self.assertEqual(target([1]), {"value": 5})
+
+        cache.invalidate(target, QueryDummyModel(query=True))
+        self.assertEqual(cache.stats.entries, 0)
+
+    def test_only_models_are_cached(self):
+        cache = ResponseCache()
+
+        @cache
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel]):
+            self.calls += 1
+            return "plain"
+
+        request_mapper.setup_mapper(DummyIntegration())
+        target()
+        target()
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.stats.entries, 0)
+
+    def test_finalizes_cached_value_per_request(self):
+        responses = []
+
+        def make_response(content):
+            responses.append(content)
+            return object()
+
+        class Integration(DummyIntegration):
+            def make_json_response(self, content):
+                return make_response(content)
+
+        target = self._make_view(ResponseCache())
+        integration = Integration()
+        request_mapper.setup_mapper(
+            integration, response_converter=request_mapper.JsonResponseConverter(integration)
+        )
+
+        first, second = target(), target()
+        self.assertIsNot(first, second)
+        self.assertEqual(responses, [b'{"value":1}', b'{"value":1}'])
+
+    def test_async(self):
+        cache = ResponseCache()
+
+        @cache
+        @request_mapper.map_request
+        async def target(query: FromQuery[QueryDummyModel]):
+            self.calls += 1
+            return ResultModel(value=self.calls)
+
+        request_mapper.setup_mapper(AsyncDummyIntegration({"query": True}))
+
+        async def run():
+            return [await target(), await target()]
+
+        self.assertEqual(asyncio.run(run()), [{"value": 1}, {"value": 1}])
+        self.assertEqual(cache.stats.hits, 1)
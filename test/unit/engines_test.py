@@ -0,0 +1,131 @@
+import dataclasses
+import importlib
+import unittest
+from test.fixtures import DummyIntegration
+from typing import List, Union
+
+from typing_extensions import TypedDict
+
+import request_mapper
+from request_mapper import FromBody, RequestValidationError, ValidationEngine, register_engine
+from request_mapper.engines import _engines, get_engine
+
+
+@dataclasses.dataclass
+class Item:
+    id: int
+
+
+class ItemDict(TypedDict):
+    id: int
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+class PointError(Exception):
+    pass
+
+
+class PointEngine(ValidationEngine):
+    error_types = (PointError,)
+
+    def __init__(self):
+        self.compiled = 0
+
+    def supports(self, cls):
+        return cls is Point
+
+    def compile_validator(self, cls):
+        self.compiled += 1
+
+        def validate(data):
+            if "x" not in data:
+                raise PointError
+            return cls(data["x"], data.get("y", 0))
+
+        return validate
+
+    def get_errors(self, error):
+        return [{"type": "missing", "loc": ("x",), "msg": "Field required"}]
+
+    def compile_serializer(self, cls):
+        return lambda point: {"x": point.x, "y": point.y}
+
+
+class TestEngines(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_validates_dataclass_body(self):
+        @request_mapper.map_request
+        def target(item: FromBody[Item]):
+            return item
+
+        request_mapper.setup_mapper(DummyIntegration(body={"id": "1"}))
+        self.assertEqual(target(), Item(id=1))
+
+    def test_validates_typed_dict_lists(self):
+        @request_mapper.map_request
+        def target(items: FromBody[List[ItemDict]]):
+            return items
+
+        request_mapper.setup_mapper(DummyIntegration(body=[{"id": "1"}]))
+        self.assertEqual(target(), [{"id": 1}])
+
+        request_mapper.setup_mapper(DummyIntegration(body=[{"id": "x"}]))
+        with self.assertRaises(RequestValidationError) as e:
+            target()
+        self.assertEqual(e.exception.source_errors[0]["loc"], (0, "id"))
+
+    def test_registered_engines_take_precedence(self):
+        engine = PointEngine()
+        register_engine(engine)
+        self.addCleanup(_engines.remove, engine)
+        self.assertIs(get_engine(Point), engine)
+
+        @request_mapper.map_request
+        def target(point: FromBody[Point]):
+            return point.x, point.y
+
+        self.assertEqual(engine.compiled, 1)
+        request_mapper.setup_mapper(DummyIntegration(body={"x": 1}))
+        self.assertEqual((target(), target()), ((1, 0), (1, 0)))
+        self.assertEqual(engine.compiled, 1)
+
+        request_mapper.setup_mapper(DummyIntegration(body={}))
+        with self.assertRaises(RequestValidationError) as e:
+            target()
+        self.assertEqual(e.exception.source_errors[0]["loc"], ("x",))
+
+    def test_serializes_values_of_the_return_annotation(self):
+        @request_mapper.map_request
+        def target(item: FromBody[Item]) -> Item:
+            return item
+
+        @request_mapper.map_request
+        def items(item: FromBody[Item]) -> List[Item]:
+            return [item, item]
+
+        @request_mapper.map_request
+        def unsupported(item: FromBody[Item]) -> Union[Item, Point]:
+            return item
+
+        request_mapper.setup_mapper(DummyIntegration(body={"id": "1"}))
+        self.assertEqual(target(), {"id": 1})
+        self.assertEqual(items(), [{"id": 1}, {"id": 1}])
+        self.assertEqual(unsupported(), Item(id=1))
+
+    def test_registered_engines_serialize_return_values(self):
+        engine = PointEngine()
+        register_engine(engine)
+        self.addCleanup(_engines.remove, engine)
+
+        @request_mapper.map_request
+        def target(point: FromBody[Point]) -> Point:
+            return point
+
+        request_mapper.setup_mapper(DummyIntegration(body={"x": 1}))
+        self.assertEqual(target(), {"x": 1, "y": 0})
@@ -0,0 +1,65 @@
+import importlib
+import json
+import unittest
+from test.fixtures import DummyIntegration
+from typing import List
+
+from pydantic import BaseModel, conint
+
+import request_mapper
+from request_mapper import ErrorFormat, FromBody, RequestValidationError
+from request_mapper.errors import render_errors
+
+
+class Item(BaseModel):
+    id: conint(gt=0)
+
+
+class Batch(BaseModel):
+    items: List[Item]
+
+
+class TestErrorFormat(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+        @request_mapper.map_request
+        def target(batch: FromBody[Batch]):
+            return batch
+
+        self.target = target
+        request_mapper.setup_mapper(
+            DummyIntegration(body={"items": [{"id": 0}, {"id": -1}, {"id": "x"}]})
+        )
+
+    def get_error(self):
+        with self.assertRaises(RequestValidationError) as e:
+            self.target()
+        return e.exception
+
+    def test_formats_errors_lazily(self):
+        err = self.get_error()
+        self.assertIsNone(err._source_errors)
+        self.assertEqual(len(err.source_errors), 3)
+        self.assertEqual(err.source_errors[0]["loc"], ("items", 0, "id"))
+
+    def test_renders_all_details_by_default(self):
+        err = self.get_error()
+        self.assertEqual(json.loads(render_errors(err)), json.loads(json.dumps(err.source_errors)))
+
+    def test_caps_and_strips_errors(self):
+        err = self.get_error()
+        for max_errors in (3, 1):
+            error_format = ErrorFormat(
+                max_errors=max_errors, include_input=False, include_context=False, include_url=False
+            )
+            for errors in (error_format.format(err), json.loads(error_format.render(err))):
+                self.assertEqual(len(errors), max_errors)
+                self.assertEqual(set(errors[0]), {"type", "loc", "msg"})
+
+    def test_setup_mapper_configures_error_format(self):
+        request_mapper.setup_mapper(DummyIntegration(), error_format=ErrorFormat(max_errors=1))
+        err = RequestValidationError("body", [{"type": "a", "loc": (), "msg": "a", "input": 1}] * 2)
+        self.assertEqual(
+            json.loads(render_errors(err)), [{"type": "a", "loc": [], "msg": "a", "input": 1}]
+        )
@@ -0,0 +1,127 @@
+import asyncio
+import importlib
+import operator
+import unittest
+from test.fixtures import QueryDummyModel
+
+from pydantic import BaseModel
+
+import request_mapper
+from request_mapper import AsyncRequestMapperIntegration, FromQuery, ResponseCache, SingleFlight
+
+
+class ResultModel(BaseModel):
+    value: int
+
+
+class ArgsQueryIntegration(AsyncRequestMapperIntegration):
+    """Read the query from the first argument of the view."""
+
+    def set_up(self, request_mapper_decorator):
+        pass
+
+    def bind_request_getter(self, fn):
+        return operator.itemgetter(0)
+
+    async def get_query_as_dict(self, call):
+        return call.request
+
+    async def get_request_body_as_dict(self, call):
+        return {}
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+        request_mapper.setup_mapper(ArgsQueryIntegration())
+        self.calls = 0
+
+    def make_view(self, flight, delay=0.01, error=None):
+        @flight
+        @request_mapper.map_request
+        async def target(request, query: FromQuery[QueryDummyModel]):
+            self.calls += 1
+            value = self.calls
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return ResultModel(value=value)
+
+        return target
+
+    def test_coalesces_identical_concurrent_calls(self):
+        flight = SingleFlight()
+        target = self.make_view(flight)
+
+        async def run():
+            return await asyncio.gather(
+                *(target({"query": "true"}) for _ in range(10)), target({"query": "false"})
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(results[:10], [{"value": 1}] * 10)
+        self.assertEqual(results[10], {"value": 2})
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(flight.stats, (2, 9, 0, 0))
+
+    def test_does_not_coalesce_sequential_calls(self):
+        target = self.make_view(SingleFlight())
+
+        async def run():
+            return [await target({"query": "true"}), await target({"query": "true"})]
+
+        self.assertEqual(asyncio.run(run()), [{"value": 1}, {"value": 2}])
+
+    def test_exceptions_propagate_to_waiters(self):
+        target = self.make_view(SingleFlight(), error=ValueError("failed"))
+
+        async def run():
+            return await asyncio.gather(
+                *(target({"query": "true"}) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    def test_falls_back_after_max_wait(self):
+        flight = SingleFlight(max_wait=0.01)
+        target = self.make_view(flight, delay=0.1)
+
+        async def run():
+            return await asyncio.gather(target({"query": "true"}), target({"query": "true"}))
+
+        self.assertEqual(asyncio.run(run()), [{"value": 1}, {"value": 2}])
+        self.assertEqual(flight.stats.fallbacks, 1)
+
+    def test_waiters_run_the_view_when_the_leader_is_cancelled(self):
+        target = self.make_view(SingleFlight(), delay=0.05)
+
+        async def run():
+            leader = asyncio.ensure_future(target({"query": "true"}))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(target({"query": "true"}))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await waiter
+
+        self.assertEqual(asyncio.run(run()), {"value": 2})
+
+    def test_coalesced_results_are_cached_once(self):
+        cache = ResponseCache()
+        target = cache(self.make_view(SingleFlight()))
+
+        async def run():
+            await asyncio.gather(*(target({"query": "true"}) for _ in range(3)))
+            return await target({"query": "true"})
+
+        self.assertEqual(asyncio.run(run()), {"value": 1})
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cache.stats.entries, 1)
+
+    def test_rejects_sync_views(self):
+        def target(query: FromQuery[QueryDummyModel]):
+            return query
+
+        with self.assertRaises(TypeError):
+            SingleFlight()(target)
@@ -0,0 +1,152 @@
+import importlib
+import unittest
+from test.fixtures import DummyIntegration, FormDataDummyModel
+from typing import List
+
+from pydantic import BaseModel
+
+import request_mapper
+from request_mapper import (
+    FromForm,
+    RequestPolicyViolationError,
+    RequestValidationError,
+    UploadedFile,
+)
+from request_mapper.form import FormParser
+from request_mapper.types import FormDataMapping
+
+BOUNDARY = "x-boundary"
+CONTENT_TYPE = f'multipart/form-data; boundary="{BOUNDARY}"'
+
+
+def multipart(*parts):
+    body = b"preamble\r\n"
+    for headers, content in parts:
+        body += f"--{BOUNDARY}\r\n{headers}\r\n\r\n".encode() + content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def field(name, value):
+    return f'Content-Disposition: form-data; name="{name}"', value
+
+
+def upload(name, filename, content):
+    return (
+        f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+        "Content-Type: text/plain",
+        content,
+    )
+
+
+def parse(body, content_type=CONTENT_TYPE, mapping=FormDataMapping, chunk_size=None):
+    parser = FormParser(content_type, mapping)
+    chunk_size = chunk_size or len(body)
+    for i in range(0, len(body), chunk_size):
+        parser.feed(body[i : i + chunk_size])
+    return parser.close()
+
+
+class SmallSpoolMapping(FormDataMapping):
+    spool_size = 4
+    max_file_size = 16
+    max_field_size = 8
+
+
+class TestFormParser(unittest.TestCase):
+    def test_parses_fields_and_files_split_across_chunks(self):
+        body = multipart(
+            field("tags", b"a"),
+            field("tags", b"b"),
+            upload("doc", "doc.txt", b"line\r\n--almost boundary\r\n"),
+        )
+        for chunk_size in (1, 3, 7, len(body)):
+            data = parse(body, chunk_size=chunk_size)
+            self.assertEqual(data.getlist("tags"), ["a", "b"])
+            self.assertEqual(data["doc"].filename, "doc.txt")
+            self.assertEqual(data["doc"].content_type, "text/plain")
+            self.assertEqual(data["doc"].read(), b"line\r\n--almost boundary\r\n")
+
+    def test_spools_large_files_to_disk(self):
+        data = parse(multipart(upload("doc", "doc.txt", b"0123456789")), mapping=SmallSpoolMapping)
+        doc = data["doc"]
+        self.assertEqual(doc.size, 10)
+        self.assertTrue(doc.file._rolled)
+        self.assertEqual(bytes(doc.mmap()), b"0123456789")
+
+    def test_keeps_small_files_in_memory(self):
+        doc = parse(multipart(upload("doc", "doc.txt", b"012")), mapping=SmallSpoolMapping)["doc"]
+        self.assertFalse(doc.file._rolled)
+        self.assertEqual(bytes(doc.mmap()), b"012")
+
+    def test_rejects_parts_over_their_limit(self):
+        for part in (field("name", b"x" * 9), upload("doc", "doc.txt", b"x" * 17)):
+            with self.assertRaises(RequestPolicyViolationError) as e:
+                parse(multipart(part), mapping=SmallSpoolMapping, chunk_size=4)
+            self.assertEqual(e.exception.status_code, 413)
+
+    def test_rejects_other_content_types(self):
+        with self.assertRaises(RequestPolicyViolationError) as e:
+            parse(b"{}", content_type="application/json")
+        self.assertEqual(e.exception.status_code, 415)
+
+    def test_rejects_truncated_body(self):
+        with self.assertRaises(RequestValidationError):
+            parse(multipart(field("name", b"x"))[:-10])
+
+    def test_parses_urlencoded(self):
+        data = parse(b"a=1&a=2&b=%20x", content_type="application/x-www-form-urlencoded")
+        self.assertEqual((data.getlist("a"), data["b"]), (["1", "2"], " x"))
+
+    def test_replaces_invalid_utf8_in_urlencoded(self):
+        data = parse(b"a=\xff&b=%FF", content_type="application/x-www-form-urlencoded")
+        self.assertEqual((data["a"], data["b"]), ("\ufffd", "\ufffd"))
+
+
+class StreamingFormIntegration(request_mapper.RequestMapperIntegration):
+    def __init__(self, body):
+        self.body = body
+
+    def set_up(self, request_mapper_decorator):
+        pass
+
+    def get_query_as_dict(self, call):
+        return {}
+
+    def get_request_body_as_dict(self, call):
+        raise NotImplementedError
+
+    def get_header(self, call, name):
+        return CONTENT_TYPE if name == "Content-Type" else None
+
+    def get_request_body_stream(self, call):
+        return iter([self.body[:5], self.body[5:]])
+
+
+class UploadModel(BaseModel):
+    title: str
+    tags: List[str]
+    doc: UploadedFile
+
+
+class TestFromForm(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_uses_integration_form_data(self):
+        @request_mapper.map_request
+        def target(form: FromForm[FormDataDummyModel]):
+            return form
+
+        request_mapper.setup_mapper(DummyIntegration())
+        self.assertEqual(target(), {"form": True})
+
+    def test_parses_body_stream(self):
+        @request_mapper.map_request
+        def target(form: FromForm[UploadModel]):
+            return form.title, form.tags, form.doc.read()
+
+        body = multipart(
+            field("title", b"Report"), field("tags", b"a"), upload("doc", "r.txt", b"data")
+        )
+        request_mapper.setup_mapper(StreamingFormIntegration(body))
+        self.assertEqual(target(), ("Report", ["a"], b"data"))
@@ -0,0 +1,75 @@
+import importlib
+import json
+import unittest
+from test.fixtures import DummyIntegration, QueryDummyModel, RequestBodyDummyModel
+
+import request_mapper
+from request_mapper import FromBody, FromQuery, HistogramAggregator, RequestValidationError
+from request_mapper.instrumentation import PhaseTiming
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_records_every_phase(self):
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel], body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        aggregator = HistogramAggregator()
+        request_mapper.setup_mapper(DummyIntegration(), instrumentation=aggregator)
+        target()
+        target()
+
+        phases = {(p["phase"], p["location"]): p for p in aggregator.report()["phases"]}
+        self.assertEqual(
+            set(phases),
+            {
+                ("extraction", "query-string"),
+                ("extraction", "request-body"),
+                ("validation", "query-string"),
+                ("validation", "request-body"),
+                ("handler", None),
+                ("serialization", None),
+            },
+        )
+        self.assertTrue(all(p["count"] == 2 for p in phases.values()))
+        self.assertTrue(
+            phases["handler", None]["view"].endswith("test_records_every_phase.<locals>.target")
+        )
+
+    def test_counts_validation_failures(self):
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel]):
+            pass
+
+        aggregator = HistogramAggregator()
+        request_mapper.setup_mapper(DummyIntegration(query={}), instrumentation=aggregator)
+        with self.assertRaises(RequestValidationError):
+            target()
+
+        failures = aggregator.report()["validation_failures"]
+        self.assertEqual([(f["location"], f["count"]) for f in failures], [("query-string", 1)])
+
+    def test_histogram_summary(self):
+        aggregator = HistogramAggregator(buckets=(0.001, 0.01, 0.1))
+        for duration in (0.0005, 0.002, 0.003, 0.05):
+            aggregator.record_phase(PhaseTiming("view", "handler", duration, payload_size=10))
+
+        [summary] = aggregator.report()["phases"]
+        self.assertEqual(summary["count"], 4)
+        self.assertEqual(summary["p50"], 0.01)
+        self.assertEqual(summary["max"], 0.05)
+        self.assertEqual(summary["mean_payload_size"], 10)
+        self.assertEqual(
+            summary["buckets"],
+            [{"le": 0.001, "count": 1}, {"le": 0.01, "count": 2}, {"le": 0.1, "count": 1}],
+        )
+
+    def test_report_is_strict_json(self):
+        aggregator = HistogramAggregator(buckets=(0.001,))
+        aggregator.record_phase(PhaseTiming("view", "handler", 0.5))
+
+        report = json.loads(json.dumps(aggregator.report(), allow_nan=False))
+        self.assertEqual(report["phases"][0]["buckets"], [{"le": "+Inf", "count": 1}])
@@ -0,0 +1,102 @@
+import asyncio
+import importlib
+import unittest
+from test.fixtures import DummyIntegration, RequestBodyDummyModel
+
+from typing_extensions import Annotated
+
+import request_mapper
+from request_mapper import (
+    AsyncRequestMapperIntegration,
+    BodyPolicy,
+    FromBodyLazy,
+    RequestPolicyViolationError,
+    RequestValidationError,
+)
+
+
+class CountingIntegration(DummyIntegration):
+    fetches = 0
+
+    def get_request_body_as_dict(self, call):
+        self.fetches += 1
+        return super().get_request_body_as_dict(call)
+
+
+class AsyncBodyIntegration(AsyncRequestMapperIntegration):
+    def __init__(self, body):
+        self.body = body
+        self.fetches = 0
+
+    def set_up(self, request_mapper_decorator):
+        pass
+
+    async def get_query_as_dict(self, call):
+        return {}
+
+    async def get_request_body_as_dict(self, call):
+        self.fetches += 1
+        return self.body
+
+
+class TestFromBodyLazy(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_skips_fetching_unused_body(self):
+        @request_mapper.map_request
+        def target(body: FromBodyLazy[RequestBodyDummyModel]):
+            return "rejected"
+
+        integration = CountingIntegration()
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target(), "rejected")
+        self.assertEqual(integration.fetches, 0)
+
+    def test_validates_on_first_access(self):
+        @request_mapper.map_request
+        def target(body: FromBodyLazy[RequestBodyDummyModel]):
+            self.assertFalse(body.resolved)
+            self.assertTrue(body.body)
+            self.assertEqual(body.get(), RequestBodyDummyModel(body=True))
+            return body
+
+        integration = CountingIntegration()
+        request_mapper.setup_mapper(integration)
+        target()
+        self.assertEqual(integration.fetches, 1)
+
+    def test_raises_validation_errors_on_access(self):
+        @request_mapper.map_request
+        def target(body: FromBodyLazy[RequestBodyDummyModel]):
+            return body.body
+
+        request_mapper.setup_mapper(DummyIntegration(body={}))
+        with self.assertRaises(RequestValidationError) as e:
+            target()
+
+        self.assertEqual(e.exception.location, "request-body")
+
+    def test_enforces_policy_on_access(self):
+        @request_mapper.map_request
+        def target(body: Annotated[FromBodyLazy[RequestBodyDummyModel], BodyPolicy(max_depth=0)]):
+            return body.get()
+
+        request_mapper.setup_mapper(DummyIntegration())
+        with self.assertRaises(RequestPolicyViolationError):
+            target()
+
+    def test_async(self):
+        @request_mapper.map_request
+        async def target(body: FromBodyLazy[RequestBodyDummyModel]):
+            with self.assertRaises(RuntimeError):
+                body.body
+
+            model = await body.get()
+            self.assertTrue(body.body)
+            return model
+
+        integration = AsyncBodyIntegration({"body": True})
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(asyncio.run(target()), {"body": True})
+        self.assertEqual(integration.fetches, 1)
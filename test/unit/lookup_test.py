@@ -0,0 +1,147 @@
+import importlib
+import sys
+import unittest
+from test.fixtures import DummyIntegration
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+import request_mapper
+from request_mapper import FromCookies, FromHeaders, FromPath, RequestValidationError
+from request_mapper.lookup import CookieLookup
+
+
+class RecordingSource(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.looked_up = []
+
+    def get(self, name):
+        self.looked_up.append(name)
+        return super().get(name)
+
+
+class TenantHeaders(BaseModel):
+    tenant_id: int
+    key: Optional[str] = Field(None, alias="Idempotency-Key")
+
+
+class LookupIntegration(DummyIntegration):
+    def __init__(self, headers=None, path=None, cookies=None):
+        super().__init__()
+        self.headers = RecordingSource(headers or {})
+        self.path = path or {}
+        self.cookie_header = cookies
+
+    def get_headers(self, call):
+        return self.headers
+
+    def get_path_params(self, call):
+        return self.path
+
+    def get_cookies(self, call):
+        return CookieLookup(self.cookie_header)
+
+
+class TestLookupMappings(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_reads_only_declared_headers(self):
+        @request_mapper.map_request
+        def target(headers: FromHeaders[TenantHeaders]):
+            return headers
+
+        integration = LookupIntegration(
+            headers={"tenant-id": "3", "Idempotency-Key": "abc", "user-agent": "test"}
+        )
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target(), {"tenant_id": 3, "key": "abc"})
+        self.assertEqual(sorted(integration.headers.looked_up), ["Idempotency-Key", "tenant-id"])
+
+    def test_looks_up_header_aliases_as_they_are(self):
+        class ApiKeyHeaders(BaseModel):
+            api_key: str = Field(alias="x_api_key")
+
+        @request_mapper.map_request
+        def target(headers: FromHeaders[ApiKeyHeaders]):
+            return headers
+
+        integration = LookupIntegration(headers={"x_api_key": "abc"})
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target(), {"api_key": "abc"})
+        self.assertEqual(integration.headers.looked_up, ["x_api_key"])
+
+    def test_reports_missing_headers(self):
+        @request_mapper.map_request
+        def target(headers: FromHeaders[TenantHeaders]):
+            return headers
+
+        request_mapper.setup_mapper(LookupIntegration())
+        with self.assertRaises(RequestValidationError) as e:
+            target()
+
+        self.assertEqual(e.exception.location, "headers")
+
+    def test_maps_path_and_cookies(self):
+        class PostPath(BaseModel):
+            post_id: int
+
+        class Session(BaseModel):
+            session: str
+            theme: str = "light"
+
+        @request_mapper.map_request
+        def target(path: FromPath[PostPath], cookies: FromCookies[Session]):
+            return path.post_id, cookies.session, cookies.theme
+
+        integration = LookupIntegration(path={"post_id": "7"}, cookies='other=1; session="s1"')
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target(), (7, "s1", "light"))
+
+    def test_collects_list_fields_from_multi_value_sources(self):
+        class Forwarded(BaseModel):
+            via: List[str]
+
+        class MultiValueSource(dict):
+            def getall(self, name, default):
+                return self[name] if name in self else default
+
+        @request_mapper.map_request
+        def target(headers: FromHeaders[Forwarded]):
+            return headers
+
+        integration = LookupIntegration()
+        integration.headers = MultiValueSource(via=["a", "b"])
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target(), {"via": ["a", "b"]})
+
+    @unittest.skipIf(sys.version_info < (3, 10), "requires X | Y unions")
+    def test_collects_repeated_headers_into_optional_union_lists(self):
+        class Forwarded(BaseModel):
+            via: list[str] | None = None
+
+        class MultiValueSource(dict):
+            def get(self, name):
+                return self[name][0] if name in self else None
+
+            def getall(self, name, default):
+                return self[name] if name in self else default
+
+        @request_mapper.map_request
+        def target(headers: FromHeaders[Forwarded]):
+            return headers
+
+        integration = LookupIntegration()
+        integration.headers = MultiValueSource(via=["a", "b"])
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target(), {"via": ["a", "b"]})
+
+    def test_requires_integration_support(self):
+        @request_mapper.map_request
+        def target(headers: FromHeaders[TenantHeaders]):
+            return headers
+
+        request_mapper.setup_mapper(DummyIntegration())
+        with self.assertRaisesRegex(TypeError, "does not support headers"):
+            target()
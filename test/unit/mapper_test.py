@@ -5,10 +5,13 @@ from test.fixtures import (
     QueryDummyModel,
     RequestBodyDummyModel,
 )
-from typing import Optional
+from typing import Dict, List, Optional, Union
+
+from typing_extensions import Annotated
 
 import request_mapper
 from request_mapper import FromQuery, FromBody, RequestValidationError
+from request_mapper.types import RequestDataMapping
 
 
 class TestMapper(unittest.TestCase):
@@ -89,3 +92,166 @@ class TestMapper(unittest.TestCase):
             pass
 
         _dummy()
+
+    def test_mapper_rebinds_views_when_integration_changes(self):
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel]):
+            return query
+
+        request_mapper.setup_mapper(DummyIntegration())
+        self.assertEqual(target(), {"query": True})
+
+        request_mapper.setup_mapper(DummyIntegration(query={"query": False}))
+        self.assertEqual(target(), {"query": False})
+
+    def test_mapper_uses_get_data_for_custom_mappings(self):
+        class CustomMapping(RequestDataMapping):
+            location = "custom"
+
+            def get_data(self, integration, call):
+                return {"query": call.kwargs["raw"] == "yes"}
+
+        @request_mapper.map_request
+        def target(raw: str, query: Annotated[QueryDummyModel, CustomMapping]):
+            return query
+
+        request_mapper.setup_mapper(DummyIntegration())
+        self.assertEqual(target(raw="yes"), {"query": True})
+
+    def test_mapper_validates_body_from_raw_bytes_when_available(self):
+        class RawBodyIntegration(DummyIntegration):
+            def get_request_body_as_dict(self, call):
+                raise AssertionError("dict path must not be used")
+
+            def get_request_body_as_bytes(self, call):
+                return b'{"body": true}'
+
+        @request_mapper.map_request
+        def target(body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        request_mapper.setup_mapper(RawBodyIntegration())
+        self.assertEqual(target(), {"body": True})
+
+    def test_mapper_validates_container_bodies_in_one_call(self):
+        @request_mapper.map_request
+        def target_list(body: FromBody[List[RequestBodyDummyModel]]):
+            return body
+
+        @request_mapper.map_request
+        def target_dict(body: FromBody[Dict[str, RequestBodyDummyModel]]):
+            return body
+
+        request_mapper.setup_mapper(DummyIntegration(body=[{"body": True}, {"body": False}]))
+        self.assertEqual(
+            target_list(), [RequestBodyDummyModel(body=True), RequestBodyDummyModel(body=False)]
+        )
+
+        request_mapper.setup_mapper(DummyIntegration(body={"a": {"body": True}}))
+        self.assertEqual(target_dict(), {"a": RequestBodyDummyModel(body=True)})
+
+    def test_mapper_reports_container_errors_per_item(self):
+        class RawBodyIntegration(DummyIntegration):
+            def get_request_body_as_bytes(self, call):
+                return b'[{"body": true}, {"body": []}]'
+
+        @request_mapper.map_request
+        def target(body: FromBody[List[Union[RequestBodyDummyModel, QueryDummyModel]]]):
+            return body
+
+        for integration in (
+            DummyIntegration(body=[{"body": True}, {"body": []}]),
+            RawBodyIntegration(),
+        ):
+            request_mapper.setup_mapper(integration)
+            with self.assertRaises(RequestValidationError) as e:
+                target()
+
+            self.assertEqual(e.exception.source_errors[0]["loc"][:2], (1, "RequestBodyDummyModel"))
+
+    def test_mapper_shares_type_adapters_between_views(self):
+        from request_mapper.engines import get_type_adapter
+
+        self.assertIs(
+            get_type_adapter(List[RequestBodyDummyModel]),
+            get_type_adapter(List[RequestBodyDummyModel]),
+        )
+
+    def test_mapper_uses_response_converter(self):
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel]):
+            return query
+
+        @request_mapper.map_request
+        def target_not_a_model(query: FromQuery[QueryDummyModel]):
+            return "ok"
+
+        request_mapper.setup_mapper(
+            DummyIntegration(), response_converter=lambda m: ("converted", m)
+        )
+        self.assertEqual(target(), ("converted", QueryDummyModel(query=True)))
+        self.assertEqual(target_not_a_model(), "ok")
+
+    def test_json_response_converter_serializes_to_bytes(self):
+        class JsonDummyIntegration(DummyIntegration):
+            def make_json_response(self, content):
+                return ("json", content)
+
+        @request_mapper.map_request
+        def target(query: FromQuery[QueryDummyModel]):
+            return query
+
+        integration = JsonDummyIntegration()
+        request_mapper.setup_mapper(
+            integration, response_converter=request_mapper.JsonResponseConverter(integration)
+        )
+        self.assertEqual(target(), ("json", b'{"query":true}'))
+
+    def test_json_response_converter_requires_integration_support(self):
+        with self.assertRaises(TypeError):
+            request_mapper.JsonResponseConverter(DummyIntegration())
+
+    def test_mapper_reads_each_source_once(self):
+        class CountingIntegration(DummyIntegration):
+            calls = 0
+
+            def get_request_body_as_dict(self, call):
+                self.calls += 1
+                return {"body": True, "query": False}
+
+        class EnvelopeModel(RequestBodyDummyModel):
+            pass
+
+        @request_mapper.map_request
+        def target(
+            envelope: FromBody[EnvelopeModel],
+            body: FromBody[RequestBodyDummyModel],
+            detail: FromBody[QueryDummyModel],
+        ):
+            return envelope, body, detail
+
+        integration = CountingIntegration()
+        request_mapper.setup_mapper(integration)
+        target()
+        self.assertEqual(integration.calls, 1)
+
+    def test_mapper_passes_request_located_at_bind_time(self):
+        class RequestIntegration(DummyIntegration):
+            bound = 0
+
+            def bind_request_getter(self, fn):
+                self.bound += 1
+                return lambda args: args[0]
+
+            def get_query_as_dict(self, call):
+                return {"query": call.request == "request"}
+
+        @request_mapper.map_request
+        def target(request, query: FromQuery[QueryDummyModel]):
+            return query
+
+        integration = RequestIntegration()
+        request_mapper.setup_mapper(integration)
+        self.assertEqual(target("request"), {"query": True})
+        self.assertEqual(target("other"), {"query": False})
+        self.assertEqual(integration.bound, 1)
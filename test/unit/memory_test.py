@@ -0,0 +1,97 @@
+import importlib
+import json
+import tracemalloc
+import unittest
+from test.fixtures import DummyIntegration, RequestBodyDummyModel
+from typing import List
+
+import request_mapper
+from request_mapper import FromBody, MemoryProfiler
+from request_mapper.instrumentation import PhaseTiming
+
+
+class RawBodyIntegration(DummyIntegration):
+    def __init__(self, body):
+        super().__init__()
+        self.raw_body = body
+
+    def get_request_body_as_bytes(self, call):
+        return self.raw_body
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_records_memory_of_sampled_requests(self):
+        @request_mapper.map_request
+        def target(body: FromBody[List[RequestBodyDummyModel]]):
+            return body
+
+        profiler = MemoryProfiler(sample_rate=2)
+        body = b"[" + b",".join([b'{"body": true}'] * 2000) + b"]"
+        request_mapper.setup_mapper(RawBodyIntegration(body), instrumentation=profiler)
+        for _ in range(4):
+            target()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        phases = {p["phase"]: p for p in profiler.report()["phases"]}
+        self.assertEqual(set(phases), {"extraction", "validation", "handler", "serialization"})
+        validation = phases["validation"]
+        self.assertEqual(validation["count"], 2)
+        self.assertEqual(validation["location"], "request-body")
+        self.assertEqual(validation["payload_size_le"], 64 * 1024)
+        # The validated list of models outlives the phase.
+        self.assertGreater(validation["retained_mean"], 0)
+        self.assertGreaterEqual(validation["peak_max"], validation["retained_max"])
+
+    def test_skips_instrumentation_of_unsampled_requests(self):
+        @request_mapper.map_request
+        def target(body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        profiler = MemoryProfiler(sample_rate=3, payload_buckets=(1,))
+        recorded = []
+        profiler.record_phase = recorded.append
+        request_mapper.setup_mapper(RawBodyIntegration(b'{"body": true}'), instrumentation=profiler)
+        for _ in range(6):
+            target()
+
+        self.assertEqual(len(recorded), 8)
+
+    def test_report_is_strict_json(self):
+        @request_mapper.map_request
+        def target(body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        profiler = MemoryProfiler(payload_buckets=(1,))
+        request_mapper.setup_mapper(RawBodyIntegration(b'{"body": true}'), instrumentation=profiler)
+        target()
+
+        report = json.loads(json.dumps(profiler.report(), allow_nan=False))
+        validation = next(p for p in report["phases"] if p["phase"] == "validation")
+        self.assertEqual(validation["payload_size_le"], "+Inf")
+
+    def test_keeps_tracing_started_by_the_app(self):
+        @request_mapper.map_request
+        def target(body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        request_mapper.setup_mapper(DummyIntegration(), instrumentation=MemoryProfiler())
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        target()
+        self.assertTrue(tracemalloc.is_tracing())
+
+    def test_ignores_phases_without_memory(self):
+        profiler = MemoryProfiler()
+        profiler.record_phase(PhaseTiming("view", "handler", 0.1))
+        profiler.record_phase(
+            PhaseTiming("view", "handler", 0.1, peak_memory=10, retained_memory=4)
+        )
+        [summary] = profiler.report()["phases"]
+        self.assertEqual(
+            (summary["count"], summary["peak_max"], summary["retained_mean"]), (1, 10, 4)
+        )
+        profiler.reset()
+        self.assertEqual(profiler.report(), {"phases": []})
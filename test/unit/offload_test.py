@@ -0,0 +1,89 @@
+import asyncio
+import importlib
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from test.fixtures import RequestBodyDummyModel
+
+import request_mapper
+from request_mapper import AsyncRequestMapperIntegration, FromBody, RequestValidationError
+from request_mapper.types import RequestPolicyViolationError
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class RawBodyIntegration(AsyncRequestMapperIntegration):
+    def __init__(self, body, executor, threshold):
+        self.body = body
+        self.validation_executor = executor
+        self.offload_threshold = threshold
+
+    def set_up(self, request_mapper_decorator):
+        pass
+
+    async def get_query_as_dict(self, call):
+        return {}
+
+    async def get_request_body_as_dict(self, call):
+        raise NotImplementedError
+
+    async def get_request_body_as_bytes(self, call):
+        return self.body
+
+
+class TestValidationOffload(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+        @request_mapper.map_request
+        async def target(body: FromBody[RequestBodyDummyModel]):
+            return body
+
+        self.target = target
+
+    def test_offloads_payloads_above_threshold(self):
+        with CountingExecutor() as executor:
+            integration = RawBodyIntegration(b'{"body": true}', executor, threshold=10)
+            request_mapper.setup_mapper(integration)
+            self.assertEqual(asyncio.run(self.target()), {"body": True})
+            self.assertEqual(executor.submitted, 1)
+
+            integration.body = b'{"body":1}'
+            self.assertEqual(asyncio.run(self.target()), {"body": True})
+            self.assertEqual(executor.submitted, 1)
+
+    def test_offloaded_validation_errors(self):
+        with CountingExecutor() as executor:
+            request_mapper.setup_mapper(RawBodyIntegration(b'{"body": []}', executor, threshold=0))
+            with self.assertRaises(RequestValidationError) as e:
+                asyncio.run(self.target())
+
+        self.assertEqual(e.exception.location, "request-body")
+        self.assertEqual(executor.submitted, 1)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            request_mapper.setup_mapper(RawBodyIntegration(b'{"body": true}', executor, 0))
+            self.assertEqual(asyncio.run(self.target()), {"body": True})
+
+            request_mapper.setup_mapper(RawBodyIntegration(b"{", executor, 0))
+            with self.assertRaises(RequestValidationError):
+                asyncio.run(self.target())
+
+    def test_errors_can_be_pickled(self):
+        error = pickle.loads(pickle.dumps(RequestValidationError("request-body", [{"msg": "x"}])))
+        self.assertEqual((error.location, error.source_errors), ("request-body", [{"msg": "x"}]))
+
+        error = pickle.loads(
+            pickle.dumps(RequestPolicyViolationError("request-body", "too_large", "msg", 413))
+        )
+        self.assertEqual(error.status_code, 413)
+        self.assertEqual(error.source_errors[0]["type"], "too_large")
@@ -0,0 +1,92 @@
+import importlib
+import unittest
+from test.fixtures import DummyIntegration, RequestBodyDummyModel
+
+from typing_extensions import Annotated
+
+import request_mapper
+from request_mapper import BodyPolicy, FromBody, RequestPolicyViolationError
+from request_mapper.policy import json_depth_exceeds
+
+
+class HeaderIntegration(DummyIntegration):
+    def __init__(self, headers, raw_body=b'{"body": true}'):
+        super().__init__()
+        self.headers = headers
+        self.raw_body = raw_body
+        self.body_read = False
+
+    def get_header(self, call, name):
+        return self.headers.get(name)
+
+    def get_request_body_as_bytes(self, call):
+        self.body_read = True
+        return self.raw_body
+
+
+class PolicyModel(RequestBodyDummyModel):
+    __body_policy__ = BodyPolicy(content_types=["application/json"])
+
+
+class TestBodyPolicy(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_rejects_oversized_body_from_content_length_without_reading_it(self):
+        @request_mapper.map_request
+        def target(body: Annotated[FromBody[RequestBodyDummyModel], BodyPolicy(max_size=10)]):
+            pass
+
+        integration = HeaderIntegration({"Content-Length": "1000"})
+        request_mapper.setup_mapper(integration)
+        with self.assertRaises(RequestPolicyViolationError) as e:
+            target()
+
+        self.assertFalse(integration.body_read)
+        self.assertEqual(e.exception.status_code, 413)
+        self.assertEqual(e.exception.source_errors[0]["type"], "body_too_large")
+
+    def test_rejects_oversized_body_without_content_length(self):
+        @request_mapper.map_request
+        def target(body: Annotated[FromBody[RequestBodyDummyModel], BodyPolicy(max_size=10)]):
+            pass
+
+        request_mapper.setup_mapper(HeaderIntegration({}))
+        with self.assertRaises(RequestPolicyViolationError):
+            target()
+
+    def test_model_policy_checks_content_type(self):
+        @request_mapper.map_request
+        def target(body: FromBody[PolicyModel]):
+            return body
+
+        request_mapper.setup_mapper(HeaderIntegration({"Content-Type": "text/plain"}))
+        with self.assertRaises(RequestPolicyViolationError) as e:
+            target()
+        self.assertEqual(e.exception.status_code, 415)
+
+        request_mapper.setup_mapper(
+            HeaderIntegration({"Content-Type": "Application/JSON; charset=utf-8"})
+        )
+        self.assertEqual(target(), {"body": True})
+
+    def test_rejects_deeply_nested_body(self):
+        @request_mapper.map_request
+        def target(body: Annotated[FromBody[RequestBodyDummyModel], BodyPolicy(max_depth=2)]):
+            pass
+
+        request_mapper.setup_mapper(HeaderIntegration({}, raw_body=b'{"body": [[true]]}'))
+        with self.assertRaises(RequestPolicyViolationError) as e:
+            target()
+        self.assertEqual(e.exception.source_errors[0]["type"], "body_too_deep")
+
+    def test_json_depth_ignores_brackets_in_strings(self):
+        self.assertFalse(json_depth_exceeds(b'{"a": "[[[{{{\\"[["}', 1))
+        self.assertTrue(json_depth_exceeds(b'[{"a": []}]', 2))
+        self.assertFalse(json_depth_exceeds(b'[{"a": []}]', 3))
+
+    def test_json_depth_measures_deepest_branch(self):
+        self.assertFalse(json_depth_exceeds(b'[[1], [2], {"a": [3]}]', 3))
+        self.assertTrue(json_depth_exceeds(b'[[1], [[2]], {"a": 3}]', 2))
+        self.assertTrue(json_depth_exceeds(b'["\\\\", "\\"]", [[]]]', 2))
+        self.assertFalse(json_depth_exceeds(b'["\\\\", "\\"[[", [[]]]', 3))
@@ -0,0 +1,61 @@
+import sys
+import unittest
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from request_mapper.query import QueryDecoder
+
+
+class FilterQuery(BaseModel):
+    ids: List[int] = []
+    tags: Optional[List[str]] = None
+    page: int = 1
+    order: str = Field("asc", alias="o")
+
+
+class ForbidExtraQuery(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    ids: List[int] = []
+
+
+class TestQueryDecoder(unittest.TestCase):
+    def test_decodes_repeated_keys_into_lists(self):
+        decoder = QueryDecoder(FilterQuery)
+
+        self.assertEqual(
+            decoder.decode_string("ids=1&ids=2&page=3&page=4&tags=a+b&tags=%C3%A9&o=desc"),
+            {"ids": ["1", "2"], "page": "3", "tags": ["a b", "é"], "o": "desc"},
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 10), "requires X | Y unions")
+    def test_decodes_repeated_keys_into_optional_union_lists(self):
+        class UnionQuery(BaseModel):
+            ids: list[int] | None = None
+
+        decoder = QueryDecoder(UnionQuery)
+
+        self.assertEqual(decoder.decode_string("ids=1&ids=2"), {"ids": ["1", "2"]})
+
+    def test_skips_undeclared_keys(self):
+        decoder = QueryDecoder(FilterQuery)
+
+        self.assertEqual(decoder.decode_string("unknown=1&&order=desc&page="), {"page": ""})
+
+    def test_keeps_undeclared_keys_when_model_does_not_ignore_extra(self):
+        decoder = QueryDecoder(ForbidExtraQuery)
+
+        self.assertEqual(decoder.decode_string("ids=1&x=2"), {"ids": ["1"], "x": "2"})
+
+    def test_decodes_multi_value_mappings(self):
+        class MultiDict(dict):
+            def getlist(self, key):
+                return [self[key], self[key]]
+
+        decoder = QueryDecoder(FilterQuery)
+
+        self.assertEqual(
+            decoder.decode_mapping(MultiDict(ids="1", page="2", other="3")),
+            {"ids": ["1", "1"], "page": "2"},
+        )
@@ -0,0 +1,151 @@
+import dataclasses
+import importlib
+import json
+import unittest
+from test.fixtures import DummyIntegration, RequestBodyDummyModel
+
+from pydantic import ValidationError
+from typing_extensions import TypedDict
+
+import request_mapper
+from request_mapper import ErrorFormat, FromBodyStream, RequestValidationError
+from request_mapper.errors import render_errors
+from request_mapper.response import iter_json_chunks
+from request_mapper.streaming import JsonItemSplitter
+
+
+def split(body: bytes, chunk_size: int):
+    splitter = JsonItemSplitter()
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(splitter.feed(body[i : i + chunk_size]))
+
+    return items + splitter.close()
+
+
+class StreamingIntegration(DummyIntegration):
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.raw_body = body
+
+    def get_request_body_stream(self, call):
+        return iter([self.raw_body[:5], self.raw_body[5:]])
+
+
+class TestJsonItemSplitter(unittest.TestCase):
+    def test_splits_json_array_across_chunks(self):
+        docs = [{"a": 'quote " and ] , }', "b": [1, {"c": "\\"}]}, 1, "s", [], None]
+        body = json.dumps(docs).encode()
+
+        for chunk_size in (1, 2, 3, 7, len(body)):
+            self.assertEqual([json.loads(x) for x in split(body, chunk_size)], docs)
+
+    def test_splits_ndjson(self):
+        body = b'{"a": 1}\n\n{"a": 2}\r\n{"a": 3}'
+
+        self.assertEqual(split(body, 4), [b'{"a": 1}', b'{"a": 2}', b'{"a": 3}'])
+
+    def test_empty_array_has_no_items(self):
+        self.assertEqual(split(b" [ ] ", 1), [])
+
+    def test_unterminated_array_surfaces_partial_item(self):
+        self.assertEqual(split(b'[{"a": 1}, {"a"', 3), [b'{"a": 1}', b'{"a"'])
+
+
+class TestFromBodyStream(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_maps_items_lazily(self):
+        @request_mapper.map_request
+        def target(items: FromBodyStream[RequestBodyDummyModel]):
+            return list(items)
+
+        request_mapper.setup_mapper(StreamingIntegration(b'[{"body": true}, {"body": false}]'))
+        self.assertEqual(
+            target(), [RequestBodyDummyModel(body=True), RequestBodyDummyModel(body=False)]
+        )
+
+    def test_validation_error_names_failing_item(self):
+        @request_mapper.map_request
+        def target(items: FromBodyStream[RequestBodyDummyModel]):
+            return list(items)
+
+        request_mapper.setup_mapper(StreamingIntegration(b'{"body": true}\n{"body": "nope"}\n'))
+        with self.assertRaises(RequestValidationError) as e:
+            target()
+
+        self.assertEqual(e.exception.location, "request-body")
+        self.assertEqual(e.exception.source_errors[0]["loc"], (1, "body"))
+
+    def test_item_errors_follow_error_format(self):
+        @request_mapper.map_request
+        def target(items: FromBodyStream[RequestBodyDummyModel]):
+            return list(items)
+
+        request_mapper.setup_mapper(
+            StreamingIntegration(b'{"body": true}\n{"body": "nope"}\n'),
+            error_format=ErrorFormat(include_input=False),
+        )
+        with self.assertRaises(RequestValidationError) as e:
+            target()
+
+        # Errors are formatted when rendered, from the original validation error.
+        self.assertIsInstance(e.exception.cause, ValidationError)
+        [error] = json.loads(render_errors(e.exception))
+        self.assertEqual(error["loc"], [1, "body"])
+        self.assertNotIn("input", error)
+
+    def test_maps_items_through_validation_engines(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        class Tag(TypedDict):
+            name: str
+
+        @request_mapper.map_request
+        def target(points: FromBodyStream[Point]):
+            return list(points)
+
+        @request_mapper.map_request
+        def tags(items: FromBodyStream[Tag]):
+            return list(items)
+
+        request_mapper.setup_mapper(StreamingIntegration(b'[{"x": 1}, {"x": "2"}]'))
+        self.assertEqual(target(), [Point(x=1), Point(x=2)])
+
+        request_mapper.setup_mapper(StreamingIntegration(b'{"name": "a"}\n{"name": 1}'))
+        with self.assertRaises(RequestValidationError) as e:
+            tags()
+
+        self.assertEqual(e.exception.source_errors[0]["loc"], (1, "name"))
+
+    def test_raises_when_integration_cannot_stream(self):
+        @request_mapper.map_request
+        def _target(items: FromBodyStream[RequestBodyDummyModel]):
+            pass
+
+        request_mapper.setup_mapper(DummyIntegration())
+        with self.assertRaises(TypeError) as e:
+            _target()
+
+        self.assertEqual(
+            str(e.exception), "DummyIntegration does not support streaming request bodies"
+        )
+
+
+class TestJsonChunks(unittest.TestCase):
+    def test_encodes_items_as_json_array(self):
+        items = (RequestBodyDummyModel(body=i % 2 == 0) for i in range(3))
+        chunks = list(iter_json_chunks(items, ndjson=False))
+        self.assertEqual(chunks[0], b'[{"body":true}')
+        self.assertEqual(
+            json.loads(b"".join(chunks)), [{"body": True}, {"body": False}, {"body": True}]
+        )
+        self.assertEqual(b"".join(iter_json_chunks(iter([]), ndjson=False)), b"[]")
+
+    def test_encodes_items_as_ndjson(self):
+        items = iter([RequestBodyDummyModel(body=True), {"body": False}])
+        body = b"".join(iter_json_chunks(items, ndjson=True))
+        self.assertEqual(body, b'{"body":true}\n{"body": false}\n')
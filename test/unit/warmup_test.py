@@ -0,0 +1,76 @@
+import gc
+import importlib
+import unittest
+from test.fixtures import DummyIntegration, QueryDummyModel, RequestBodyDummyModel
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+import request_mapper
+from request_mapper import FromBody, FromQuery
+
+
+class Parent(BaseModel):
+    child: "Optional[Child]" = None
+
+
+class Child(BaseModel):
+    name: str
+
+
+class Response(BaseModel):
+    items: List[Parent]
+
+
+class WarmUpIntegration(DummyIntegration):
+    def __init__(self):
+        super().__init__()
+        self.warmed_up = 0
+
+    def warm_up(self):
+        self.warmed_up += 1
+
+
+class TestWarmUp(unittest.TestCase):
+    def setUp(self):
+        importlib.reload(request_mapper)
+
+    def test_builds_parameter_and_response_types(self):
+        @request_mapper.map_request
+        def target(
+            body: FromBody[List[RequestBodyDummyModel]], query: FromQuery[QueryDummyModel]
+        ) -> Optional[Response]:
+            return None
+
+        integration = WarmUpIntegration()
+        request_mapper.setup_mapper(integration)
+        timings = request_mapper.warm_up_views()
+
+        self.assertEqual(integration.warmed_up, 1)
+        self.assertEqual(
+            set(timings),
+            {
+                repr(List[RequestBodyDummyModel]),
+                f"{QueryDummyModel.__module__}.QueryDummyModel",
+                f"{__name__}.Response",
+            },
+        )
+        self.assertTrue(all(t >= 0 for t in timings.values()))
+
+    def test_rebuilds_deferred_models(self):
+        @request_mapper.map_request
+        def target(body: FromBody[Parent]):
+            return body
+
+        if not hasattr(Parent, "model_rebuild"):
+            self.skipTest("Pydantic v1 builds models on definition")
+
+        self.assertFalse(Parent.__pydantic_complete__)
+        request_mapper.setup_mapper(DummyIntegration(), warm_up=True)
+        self.assertTrue(Parent.__pydantic_complete__)
+
+    def test_freezes_objects(self):
+        request_mapper.setup_mapper(DummyIntegration())
+        self.addCleanup(gc.unfreeze)
+        request_mapper.warm_up_views(freeze=True)
+        self.assertGreater(gc.get_freeze_count(), 0)